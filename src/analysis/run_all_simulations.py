@@ -1,78 +1,99 @@
 #!/usr/bin/env python3
 """
 Master script to run all Λ-Core Riemann Hypothesis simulations
+
+The simulations run in this process and share one prime table. Run from
+src/ as: python -m analysis.run_all_simulations
 """
 
-import subprocess
 import sys
 import time
+import traceback
+from core.zeta_functions import prime_table
+from simulations import simulation_1_zeta_comparison as zeta_comparison
+from simulations import simulation_2_prime_partitions as prime_partitions
+from simulations import simulation_3_prime_potential as prime_potential
+from simulations import simulation_4_hamiltonian_eigenvalues as hamiltonian
+
+# Largest prime any default simulation needs (simulation 2 sieves to 10^4)
+PRIME_LIMIT = 10000
+
+# (description, simulation, report, plot) for each simulation
+SIMULATIONS = [
+    ("Zeta Function Comparison (Dirichlet vs Euler)",
+     zeta_comparison.compare_zeta, zeta_comparison.print_report, None),
+    ("Prime Class Partitioning and Visualization",
+     prime_partitions.partition_primes, prime_partitions.print_report, prime_partitions.plot_partitions),
+    ("Prime Potential V(y) Visualization",
+     prime_potential.prime_potential, prime_potential.print_report, prime_potential.plot_potential),
+    ("Hamiltonian Eigenvalue Analysis",
+     hamiltonian.hamiltonian_spectrum, hamiltonian.print_report, hamiltonian.plot_comparison)
+]
+
+def run_simulation(description, simulation, report=None, plot=None, primes=None):
+    """
+    Run one simulation in-process and report its results.
+
+    Args:
+        description (str): Name shown in the log
+        simulation (callable): Simulation function accepting primes=
+        report (callable): Optional printer of the results
+        plot (callable): Optional figure writer of the results
+        primes (array-like): Shared prime table
+
+    Returns:
+        dict: The simulation results, or None if it failed
+    """
+    print(f"\n{'='*60}")
+    print(f"RUNNING: {description}")
+    print(f"{'='*60}")
 
-def run_simulation(script_name, description):
- """Run a simulation script and capture output"""
- print(f"\n{'='*60}")
- print(f"RUNNING: {description}")
- print(f"Script: {script_name}")
- print(f"{'='*60}")
- 
- start_time = time.time()
- try:
- result = subprocess.run([sys.executable, script_name], 
- capture_output=True, text=True, check=True)
- print(result.stdout)
- if result.stderr:
- print("STDERR:", result.stderr)
- 
- elapsed = time.time() - start_time
- print(f"\n {description} completed successfully in {elapsed:.2f} seconds")
- 
- except subprocess.CalledProcessError as e:
- elapsed = time.time() - start_time
- print(f" {description} failed after {elapsed:.2f} seconds")
- print("STDOUT:", e.stdout)
- print("STDERR:", e.stderr)
- return False
- 
- return True
+    start_time = time.time()
+    try:
+        results = simulation(primes=primes)
+        if plot is not None:
+            plot(results)
+        if report is not None:
+            report(results)
+    except Exception:
+        elapsed = time.time() - start_time
+        print(f" {description} failed after {elapsed:.2f} seconds")
+        traceback.print_exc()
+        return None
+
+    elapsed = time.time() - start_time
+    print(f"\n {description} completed successfully in {elapsed:.2f} seconds")
+    return results
 
 def main():
- """Run all simulations"""
- print(" Starting Λ-Core Riemann Hypothesis Simulation Suite")
- print(f"Python version: {sys.version}")
- 
- simulations = [
- ("simulation_1_zeta_comparison.py", "Zeta Function Comparison (Dirichlet vs Euler)"),
- ("simulation_2_prime_partitions.py", "Prime Class Partitioning and Visualization"),
- ("simulation_3_prime_potential.py", "Prime Potential V(y) Visualization"),
- ("simulation_4_hamiltonian_eigenvalues.py", "Hamiltonian Eigenvalue Analysis")
- ]
- 
- total_start = time.time()
- successful = 0
- 
- for script, description in simulations:
- if run_simulation(script, description):
- successful += 1
- time.sleep(1) # Brief pause between simulations
- 
- total_elapsed = time.time() - total_start
- 
- print(f"\n{'='*60}")
- print(f"SIMULATION SUITE COMPLETE")
- print(f"{'='*60}")
- print(f"Total time: {total_elapsed:.2f} seconds")
- print(f"Successful: {successful}/{len(simulations)}")
- 
- if successful == len(simulations):
- print(" All simulations completed successfully!")
- print("\nGenerated files:")
- print(" - prime_partitions.png")
- print(" - prime_potential.png") 
- print(" - riemann_zeros_comparison.png")
- else:
- print(f" {len(simulations) - successful} simulation(s) failed")
- return 1
- 
- return 0
+    """Run all simulations"""
+    print(" Starting Λ-Core Riemann Hypothesis Simulation Suite")
+    print(f"Python version: {sys.version}")
+
+    total_start = time.time()
+    primes, _ = prime_table(PRIME_LIMIT)
+    results = [run_simulation(*simulation, primes=primes) for simulation in SIMULATIONS]
+    successful = sum(result is not None for result in results)
+
+    total_elapsed = time.time() - total_start
+
+    print(f"\n{'='*60}")
+    print(f"SIMULATION SUITE COMPLETE")
+    print(f"{'='*60}")
+    print(f"Total time: {total_elapsed:.2f} seconds")
+    print(f"Successful: {successful}/{len(SIMULATIONS)}")
+
+    if successful == len(SIMULATIONS):
+        print(" All simulations completed successfully!")
+        print("\nGenerated files:")
+        print(" - prime_partitions.png")
+        print(" - prime_potential.png")
+        print(" - riemann_zeros_comparison.png")
+    else:
+        print(f" {len(SIMULATIONS) - successful} simulation(s) failed")
+        return 1
+
+    return 0
 
 if __name__ == "__main__":
- sys.exit(main()) 
\ No newline at end of file
+    sys.exit(main())
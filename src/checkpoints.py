@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Checkpoint Storage for Long Verification Runs
+
+Each completed stage of a run (e.g. the spectrum at one resolution) is
+written to its own .npz file in a checkpoint directory. Files are written
+to a temporary name, flushed to disk and renamed into place, so a job
+killed mid-write never leaves a truncated checkpoint behind. A restarted
+run asks the store which stages exist and skips them.
+"""
+
+import json
+import os
+import re
+import tempfile
+import numpy as np
+
+def stage_name(prefix, **params):
+    """
+    Build a file-safe stage name that encodes the run parameters.
+
+    Changing any parameter changes the name, so a resumed run never picks
+    up a checkpoint computed with different settings.
+
+    Args:
+        prefix: Stage family, e.g. 'radial'
+        **params: Parameters identifying the stage
+
+    Returns:
+        Stage name such as 'radial_N=8000_T=20_epsilon=1e-08'
+    """
+    parts = [prefix] + [f"{key}={params[key]!r}" for key in sorted(params)]
+    return re.sub(r'[^A-Za-z0-9_.=+-]', '-', '_'.join(parts))
+
+class CheckpointStore:
+    """
+    Directory of atomically written stage checkpoints.
+    """
+
+    def __init__(self, directory):
+        """
+        Open (and create if needed) a checkpoint directory.
+
+        Args:
+            directory: Path of the checkpoint directory
+        """
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, name):
+        """Path of the checkpoint file for a stage."""
+        return os.path.join(self.directory, name + '.npz')
+
+    def has(self, name):
+        """Whether a stage has been checkpointed."""
+        return os.path.exists(self.path(name))
+
+    def stages(self):
+        """Names of all checkpointed stages."""
+        return sorted(entry[:-4] for entry in os.listdir(self.directory)
+                      if entry.endswith('.npz'))
+
+    def save(self, name, arrays=None, **metadata):
+        """
+        Atomically write a stage checkpoint.
+
+        Args:
+            name: Stage name (see stage_name)
+            arrays: Dictionary of numpy arrays, stored uncompressed
+            **metadata: JSON-serializable scalars and lists saved alongside
+        """
+        arrays = dict(arrays or {})
+        arrays['__metadata__'] = np.array(json.dumps(metadata))
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as stream:
+                np.savez(stream, **arrays)
+                stream.flush()
+                os.fsync(stream.fileno())
+            os.replace(temporary, self.path(name))
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+
+    def load(self, name):
+        """
+        Read a stage checkpoint.
+
+        Args:
+            name: Stage name
+
+        Returns:
+            (arrays, metadata): dictionary of arrays and the metadata dictionary
+        """
+        with np.load(self.path(name), allow_pickle=False) as data:
+            arrays = {key: data[key] for key in data.files if key != '__metadata__'}
+            metadata = json.loads(str(data['__metadata__']))
+        return arrays, metadata
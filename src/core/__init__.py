@@ -14,7 +14,12 @@ from .zeta_functions import (
  sieve_of_eratosthenes,
  validate_zeta_identity,
  known_riemann_zeros,
- mean_zero_spacing
+ mean_zero_spacing,
+ prime_blocks,
+ integer_log_table,
+ prime_table,
+ critical_strip_zeta,
+ validate_zeta_identity_grid
 )
 
 from .prime_operators import (
@@ -26,6 +31,72 @@ from .spectral_solver import (
  QuantumHamiltonian
 )
 
+from .tridiagonal import (
+ tridiagonal_matrix,
+ nearest_eigenvalues,
+ radial_operator_bands,
+ sturm_count,
+ continue_eigenvalues,
+ precision_dtype,
+ sampled_precision_error,
+ PRECISION_DTYPES,
+ tridiagonal_operator,
+ iterative_eigenvalues,
+ radial_channel_spectra
+)
+
+from .compact_potential import (
+ CompactPrimePotential,
+ PotentialPyramid,
+ discretize_prime_blocks
+)
+
+from .prime_race import (
+ PrimeRace,
+ streaming_partition_statistics
+)
+
+from .residue_classes import (
+ ResidueClassPartitioner
+)
+
+from .l_functions import (
+ LAMBDA_CORE_CHARACTER,
+ principal_character,
+ is_principal,
+ dirichlet_l_series,
+ dirichlet_l_euler,
+ dirichlet_l_batch
+)
+
+from .level_statistics import (
+ riemann_counting_function,
+ unfold,
+ SpacingStatistics,
+ spacing_statistics
+)
+
+from .planner import (
+ calibrate,
+ estimate_cost,
+ plan_eigensolve,
+ solve_radial_spectrum
+)
+
+from .threads import (
+ blas_threads,
+ set_blas_threads,
+ parallel_sweep
+)
+
+from .artifacts import (
+ MATCH_SCHEMA,
+ match_table,
+ concatenate_tables,
+ write_artifact,
+ read_artifact
+)
+
 __version__ = "1.1"
 __author__ = "Sethu Iyer"
 
@@ -38,5 +109,49 @@ __all__ = [
  'mean_zero_spacing',
  'PrimePartitioner',
  'PrimePotential',
- 'QuantumHamiltonian'
+ 'QuantumHamiltonian',
+ 'tridiagonal_matrix',
+ 'nearest_eigenvalues',
+ 'CompactPrimePotential',
+ 'PotentialPyramid',
+ 'PrimeRace',
+ 'streaming_partition_statistics',
+ 'ResidueClassPartitioner',
+ 'prime_blocks',
+ 'discretize_prime_blocks',
+ 'integer_log_table',
+ 'prime_table',
+ 'LAMBDA_CORE_CHARACTER',
+ 'principal_character',
+ 'is_principal',
+ 'dirichlet_l_series',
+ 'dirichlet_l_euler',
+ 'dirichlet_l_batch',
+ 'critical_strip_zeta',
+ 'validate_zeta_identity_grid',
+ 'riemann_counting_function',
+ 'unfold',
+ 'SpacingStatistics',
+ 'spacing_statistics',
+ 'radial_operator_bands',
+ 'sturm_count',
+ 'continue_eigenvalues',
+ 'calibrate',
+ 'estimate_cost',
+ 'plan_eigensolve',
+ 'solve_radial_spectrum',
+ 'precision_dtype',
+ 'sampled_precision_error',
+ 'PRECISION_DTYPES',
+ 'blas_threads',
+ 'set_blas_threads',
+ 'parallel_sweep',
+ 'MATCH_SCHEMA',
+ 'match_table',
+ 'concatenate_tables',
+ 'write_artifact',
+ 'read_artifact',
+ 'tridiagonal_operator',
+ 'iterative_eigenvalues',
+ 'radial_channel_spectra'
 ] 
\ No newline at end of file
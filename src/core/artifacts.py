@@ -0,0 +1,166 @@
+"""
+LambdaCore-RiemannHypothesis: Result Artifacts Module
+
+Columnar result tables for the verification entry points. Every table
+follows MATCH_SCHEMA, one row per (run, zeta zero), and is written either
+as an Arrow IPC file (when pyarrow is installed) or as an uncompressed
+.npz. Both formats are read back zero-copy through memory maps, so
+plotting and aggregation jobs never re-parse printed logs.
+
+Author: Sethu Iyer (https://sethuiyer.github.io/)
+Date: December 2024
+Version: 1.1
+"""
+
+import importlib.util
+import os
+import struct
+import zipfile
+import numpy as np
+
+# Stable column order and types of every match table
+MATCH_SCHEMA = (
+    ('zero_index', np.int32),
+    ('tau', np.float64),
+    ('predicted_lambda', np.float64),
+    ('matched_lambda', np.float64),
+    ('absolute_error', np.float64),
+    ('relative_error', np.float64),
+    ('N', np.int64),
+    ('epsilon', np.float64),
+    ('T', np.float64),
+    ('computation_time', np.float64),
+)
+
+def _pyarrow():
+    """Import pyarrow on first use; it is optional and slow to import."""
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+    except ImportError:
+        raise ImportError("Arrow artifacts require pyarrow") from None
+    return pa, ipc
+
+def match_table(zero_index, tau, predicted_lambda, matched_lambda, N,
+                epsilon=np.nan, T=np.nan, computation_time=np.nan):
+    """
+    Build a match table in MATCH_SCHEMA.
+
+    Run parameters may be scalars (broadcast over all rows) or per-row
+    arrays; errors are derived from the predicted and matched values.
+
+    Args:
+        zero_index (array-like): 1-based index of each zeta zero
+        tau (array-like): Zero heights τ
+        predicted_lambda (array-like): Predicted eigenvalues
+        matched_lambda (array-like): Computed eigenvalues matched to them
+        N (int or array-like): Grid resolution
+        epsilon (float or array-like): Left boundary parameter (NaN if unused)
+        T (float or array-like): Right boundary parameter
+        computation_time (float or array-like): Solve time in seconds
+
+    Returns:
+        dict: Column name -> 1-D numpy array, in schema order
+    """
+    predicted_lambda = np.asarray(predicted_lambda, dtype=np.float64)
+    matched_lambda = np.asarray(matched_lambda, dtype=np.float64)
+    absolute_error = np.abs(matched_lambda - predicted_lambda)
+    values = {
+        'zero_index': zero_index,
+        'tau': tau,
+        'predicted_lambda': predicted_lambda,
+        'matched_lambda': matched_lambda,
+        'absolute_error': absolute_error,
+        'relative_error': absolute_error / np.abs(predicted_lambda),
+        'N': N,
+        'epsilon': epsilon,
+        'T': T,
+        'computation_time': computation_time,
+    }
+    rows = len(predicted_lambda)
+    return {name: np.broadcast_to(np.asarray(values[name], dtype=dtype), (rows,)).copy()
+            for name, dtype in MATCH_SCHEMA}
+
+def concatenate_tables(tables):
+    """
+    Stack match tables row-wise.
+
+    Args:
+        tables (iterable): Tables in MATCH_SCHEMA
+
+    Returns:
+        dict: A single table in MATCH_SCHEMA
+    """
+    tables = list(tables)
+    if not tables:
+        return {name: np.empty(0, dtype=dtype) for name, dtype in MATCH_SCHEMA}
+    return {name: np.concatenate([table[name] for table in tables]) for name, _ in MATCH_SCHEMA}
+
+def write_artifact(path, table, format='auto'):
+    """
+    Write a table as an Arrow IPC file or an uncompressed .npz.
+
+    Args:
+        path (str): Output path; the extension is added if missing
+        table (dict): Column name -> 1-D array
+        format (str): 'arrow', 'npz', or 'auto' (Arrow when pyarrow is installed)
+
+    Returns:
+        str: The path written
+    """
+    if format == 'auto':
+        extension = os.path.splitext(path)[1]
+        format = extension[1:] if extension in ('.arrow', '.npz') else (
+            'arrow' if importlib.util.find_spec('pyarrow') is not None else 'npz')
+    if format not in ('arrow', 'npz'):
+        raise ValueError(f"Unknown artifact format '{format}'; expected 'arrow' or 'npz'")
+    if not path.endswith('.' + format):
+        path = path + '.' + format
+
+    if format == 'arrow':
+        pa, ipc = _pyarrow()
+        batch = pa.table({name: np.ascontiguousarray(column) for name, column in table.items()})
+        with pa.OSFile(path, 'wb') as sink, ipc.new_file(sink, batch.schema) as writer:
+            writer.write_table(batch)
+    else:
+        # Stored (not deflated) members, so read_artifact can memory-map them
+        np.savez(path, **table)
+    return path
+
+def _memmap_npz(path):
+    """Memory-map every member of an uncompressed .npz file."""
+    columns = {}
+    with zipfile.ZipFile(path) as archive, open(path, 'rb') as stream:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path} is compressed; it cannot be memory-mapped")
+            # Skip the local file header to the start of the .npy member
+            stream.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack('<HH', stream.read(4))
+            stream.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(stream)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(stream)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(stream)
+            name = info.filename[:-4] if info.filename.endswith('.npy') else info.filename
+            columns[name] = np.memmap(path, dtype=dtype, mode='r', offset=stream.tell(),
+                                      shape=shape, order='F' if fortran_order else 'C')
+    return columns
+
+def read_artifact(path):
+    """
+    Open a table written by write_artifact without copying its columns.
+
+    Args:
+        path (str): Path of a .arrow or .npz artifact
+
+    Returns:
+        dict: Column name -> read-only numpy array backed by the file
+    """
+    if path.endswith('.arrow'):
+        pa, ipc = _pyarrow()
+        table = ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        return {name: table.column(name).combine_chunks().to_numpy(zero_copy_only=True)
+                for name in table.column_names}
+    return _memmap_npz(path)
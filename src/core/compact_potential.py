@@ -0,0 +1,308 @@
+"""
+LambdaCore-RiemannHypothesis: Compact Prime Potential Module
+
+Struct-of-arrays representation of the prime potential. The prime
+spectrum is stored once as contiguous arrays and deposited onto any
+grid with a single vectorized binning pass, optionally smoothed into a
+regularized-delta potential by FFT convolution. A potential pyramid
+derives a whole ladder of grid resolutions from one fine binning pass.
+
+Author: Sethu Iyer (https://sethuiyer.github.io/)
+Date: December 2024
+Version: 1.1
+"""
+
+from math import lcm
+
+import numpy as np
+
+class CompactPrimePotential:
+    """
+    Contiguous-array form of V(y) = Σ_p w_p * δ(y - log(p)) * sign(p).
+
+    The primes are kept sorted by log(p) in three parallel arrays:
+    - log_primes: positions y = log(p)
+    - weights: w_p = coupling * p^(-1/2)
+    - signs: +1 for Euclidean (4n+1) and Anchor (2), -1 for Hyperbolic (4n+3)
+    """
+
+    def __init__(self, log_primes, weights, signs, coupling_constant=1.0):
+        """
+        Initialize from prebuilt arrays.
+
+        Args:
+            log_primes (numpy.ndarray): log(p) for each prime
+            weights (numpy.ndarray): Coupling-scaled weights p^(-1/2)
+            signs (numpy.ndarray): Class sign of each prime (+1 or -1)
+            coupling_constant (float): Coupling already folded into weights
+        """
+        order = np.argsort(log_primes, kind='stable')
+        self.log_primes = np.ascontiguousarray(log_primes, dtype=np.float64)[order]
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)[order]
+        self.signs = np.ascontiguousarray(signs, dtype=np.int8)[order]
+        self.strengths = self.weights * self.signs
+        self.coupling_constant = coupling_constant
+
+    @classmethod
+    def from_primes(cls, primes, coupling_constant=1.0):
+        """
+        Build the compact potential directly from an array of primes.
+
+        Args:
+            primes (array-like): Prime numbers
+            coupling_constant (float): Overall energy scale
+
+        Returns:
+            CompactPrimePotential: The compact potential
+        """
+        primes = np.asarray(primes, dtype=np.int64)
+        signs = np.where(primes % 4 == 3, -1, 1)
+        return cls(np.log(primes), primes**(-0.5) * coupling_constant, signs,
+                   coupling_constant)
+
+    @classmethod
+    def from_partitioner(cls, partitioner, coupling_constant=1.0):
+        """
+        Build the compact potential from a PrimePartitioner.
+
+        Args:
+            partitioner (PrimePartitioner): Prime partition object
+            coupling_constant (float): Overall energy scale
+
+        Returns:
+            CompactPrimePotential: The compact potential
+        """
+        classes = [
+            (partitioner.euclidean_primes, 1),
+            (partitioner.hyperbolic_primes, -1),
+            (partitioner.anchor_primes, 1),
+        ]
+        primes = np.concatenate([np.asarray(p, dtype=np.int64) for p, _ in classes])
+        signs = np.concatenate([np.full(len(p), s) for p, s in classes])
+        return cls(np.log(primes), primes**(-0.5) * coupling_constant, signs,
+                   coupling_constant)
+
+    def __len__(self):
+        return len(self.log_primes)
+
+    def _window(self, y_min, y_max, include_min=False):
+        """Slice of primes with y_min < log(p) < y_max, or y_min <= log(p) with include_min."""
+        lo = np.searchsorted(self.log_primes, y_min, side='left' if include_min else 'right')
+        hi = np.searchsorted(self.log_primes, y_max, side='left')
+        return slice(lo, hi)
+
+    def _bin_indices(self, y_min, y_max, n_grid):
+        """Uniform-grid bin index of every prime inside (y_min, y_max)."""
+        window = self._window(y_min, y_max)
+        dy = (y_max - y_min) / n_grid
+        idx = ((self.log_primes[window] - y_min) / dy).astype(np.int64)
+        keep = idx < n_grid
+        return idx[keep], self.strengths[window][keep]
+
+    def discretize(self, y_min=0, y_max=10, n_grid=1000):
+        """
+        Deposit the potential on a uniform grid.
+
+        Matches PrimePotential.construct_discrete_potential: each prime adds
+        its signed weight to bin int((log(p) - y_min) / dy), dy = (y_max - y_min) / n_grid.
+
+        Args:
+            y_min (float): Minimum y value (log scale)
+            y_max (float): Maximum y value (log scale)
+            n_grid (int): Number of grid points
+
+        Returns:
+            tuple: (y_grid, V_potential)
+        """
+        idx, strengths = self._bin_indices(y_min, y_max, n_grid)
+        V_potential = np.bincount(idx, weights=strengths, minlength=n_grid)
+        return np.linspace(y_min, y_max, n_grid), V_potential
+
+    def evaluate(self, y_grid):
+        """
+        Deposit the potential on an arbitrary sorted grid.
+
+        Each prime contributes to the grid point at or immediately below
+        log(p); primes outside [y_grid[0], y_grid[-1]) are dropped.
+
+        Args:
+            y_grid (numpy.ndarray): Sorted grid points (need not be uniform)
+
+        Returns:
+            numpy.ndarray: V evaluated on y_grid
+        """
+        y_grid = np.asarray(y_grid, dtype=np.float64)
+        window = self._window(y_grid[0], y_grid[-1], include_min=True)
+        idx = np.searchsorted(y_grid, self.log_primes[window], side='right') - 1
+        return np.bincount(idx, weights=self.strengths[window], minlength=len(y_grid))
+
+    def sparse(self, y_min=0, y_max=10, n_grid=1000):
+        """
+        Nonzero entries of the uniform-grid potential, without a dense array.
+
+        Args:
+            y_min (float): Minimum y value (log scale)
+            y_max (float): Maximum y value (log scale)
+            n_grid (int): Number of grid points
+
+        Returns:
+            tuple: (indices, values) of the occupied grid sites
+        """
+        idx, strengths = self._bin_indices(y_min, y_max, n_grid)
+        if len(idx) == 0:
+            return idx, strengths
+        # Primes are sorted, so equal bin indices are already contiguous
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(idx)) + 1))
+        indices = idx[starts]
+        values = np.add.reduceat(strengths, starts)
+        nonzero = values != 0
+        return indices[nonzero], values[nonzero]
+
+    def smoothed(self, y_min=0, y_max=10, n_grid=1000, width=0.01, truncate=6.0):
+        """
+        Regularized-delta potential V_σ(y) = Σ_p w_p * g_σ(y - log(p)) * sign(p).
+
+        Each δ(y - log(p)) is replaced by a unit-mass Gaussian g_σ of width σ.
+        The primes are deposited onto the grid with linear (cloud-in-cell)
+        weights and convolved with the sampled kernel via FFT, so the cost is
+        O(P + N log N) instead of O(P·N). Primes within truncate·σ outside
+        [y_min, y_max] contribute their tails.
+
+        The grid spacing is dy = (y_max - y_min) / n_grid, as in
+        QuantumHamiltonian, with samples at y_min + j·dy. The sampled kernel
+        is normalised to sum 1, so each prime deposits exactly its weight
+        even when σ is close to dy. Unlike construct_discrete_potential, the
+        result is a density in y (divided by dy): it converges as n_grid
+        grows rather than scaling with the bin width.
+
+        Args:
+            y_min (float): Minimum y value (log scale)
+            y_max (float): Maximum y value (log scale)
+            n_grid (int): Number of grid points
+            width (float): Kernel standard deviation σ in y units
+            truncate (float): Kernel support in units of σ
+
+        Returns:
+            tuple: (y_grid, V_potential)
+
+        Raises:
+            ValueError: If n_grid < 2
+        """
+        if n_grid < 2:
+            raise ValueError(f"smoothed needs at least 2 grid points, got n_grid={n_grid}")
+        h = (y_max - y_min) / n_grid
+        y_grid = y_min + h * np.arange(n_grid)
+        pad = int(np.ceil(truncate * width / h))
+
+        # Cloud-in-cell deposit on the padded grid y_min + (j - pad) * h
+        window = self._window(y_min - (pad + 1) * h, y_max + (pad + 1) * h)
+        x = (self.log_primes[window] - y_min) / h + pad
+        left = np.floor(x).astype(np.int64)
+        frac = x - left
+        strengths = self.strengths[window]
+        n_padded = n_grid + 2 * pad
+        keep = (left >= 0) & (left + 1 < n_padded)
+        binned = np.bincount(left[keep], weights=strengths[keep] * (1.0 - frac[keep]),
+                             minlength=n_padded)
+        binned += np.bincount(left[keep] + 1, weights=strengths[keep] * frac[keep],
+                              minlength=n_padded)
+
+        offsets = np.arange(-pad, pad + 1) * h
+        kernel = np.exp(-0.5 * (offsets / width)**2)
+        kernel /= kernel.sum()
+        # Imported here: scipy.signal alone costs more than the rest of core to import
+        from scipy.signal import fftconvolve
+        V_potential = fftconvolve(binned, kernel, mode='valid') / h
+        return y_grid, V_potential
+
+def discretize_prime_blocks(blocks, y_min=0, y_max=10, n_grid=1000,
+                            coupling_constant=1.0):
+    """
+    Bin a stream of prime blocks onto a uniform grid in constant memory.
+
+    Each block is converted to a CompactPrimePotential, binned and added to
+    the running potential; the stream is abandoned as soon as log(p) passes
+    y_max, so prime_blocks(10**11) can be passed directly.
+
+    Args:
+        blocks (iterable): Ascending prime blocks, e.g. prime_blocks(limit)
+        y_min (float): Minimum y value (log scale)
+        y_max (float): Maximum y value (log scale)
+        n_grid (int): Number of grid points
+        coupling_constant (float): Overall energy scale
+
+    Returns:
+        tuple: (y_grid, V_potential), identical to construct_discrete_potential
+    """
+    V_potential = np.zeros(n_grid)
+    for block in blocks:
+        if len(block) == 0:
+            continue
+        if np.log(block[0]) >= y_max:
+            break
+        _, V_block = CompactPrimePotential.from_primes(
+            block, coupling_constant).discretize(y_min, y_max, n_grid)
+        V_potential += V_block
+    return np.linspace(y_min, y_max, n_grid), V_potential
+
+class PotentialPyramid:
+    """
+    Resolution ladder of binned prime potentials built from one fine pass.
+
+    The primes are binned once on a grid of n_fine = lcm(n_grids) points.
+    Every coarser grid n divides n_fine, so each coarse bin is exactly the
+    union of n_fine / n consecutive fine bins and is obtained by summation.
+
+    The pyramid exposes construct_discrete_potential, so it can be passed to
+    QuantumHamiltonian in place of the PrimePotential it wraps.
+    """
+
+    def __init__(self, prime_potential, y_min=0, y_max=10,
+                 n_grids=(500, 1000, 2000, 4000), max_fine_grid=2**24):
+        """
+        Bin the primes once and aggregate every level of the ladder.
+
+        Args:
+            prime_potential (PrimePotential): Binned (unsmoothed) prime potential
+            y_min (float): Minimum y value shared by all levels
+            y_max (float): Maximum y value shared by all levels
+            n_grids (iterable): Grid sizes of the ladder
+            max_fine_grid (int): Upper bound on lcm(n_grids)
+        """
+        if getattr(prime_potential, 'smoothing_width', None) is not None:
+            raise ValueError("PotentialPyramid aggregates binned potentials; "
+                             "smoothed potentials are not additive over bins")
+
+        self.prime_potential = prime_potential
+        self.y_min = y_min
+        self.y_max = y_max
+        self.n_grids = sorted(set(int(n) for n in n_grids))
+        self.n_fine = lcm(*self.n_grids)
+        if self.n_fine > max_fine_grid:
+            raise ValueError(f"lcm of the ladder is {self.n_fine} points; choose "
+                             f"nested grid sizes (e.g. successive doublings)")
+
+        _, fine = prime_potential.compact().discretize(y_min, y_max, self.n_fine)
+        self.levels = {
+            n: fine.reshape(n, self.n_fine // n).sum(axis=1) for n in self.n_grids
+        }
+
+    @property
+    def coupling_constant(self):
+        return self.prime_potential.coupling_constant
+
+    def construct_discrete_potential(self, y_min=0, y_max=10, n_grid=1000):
+        """
+        Return a ladder level, falling back to direct construction off-ladder.
+
+        Args:
+            y_min (float): Minimum y value (log scale)
+            y_max (float): Maximum y value (log scale)
+            n_grid (int): Number of grid points
+
+        Returns:
+            tuple: (y_grid, V_potential)
+        """
+        if (y_min, y_max) == (self.y_min, self.y_max) and n_grid in self.levels:
+            return np.linspace(y_min, y_max, n_grid), self.levels[n_grid].copy()
+        return self.prime_potential.construct_discrete_potential(y_min, y_max, n_grid)
@@ -0,0 +1,208 @@
+"""
+LambdaCore-RiemannHypothesis: Level Statistics Module
+
+Spectral unfolding and level-spacing statistics for comparing computed
+eigenvalues and Riemann zeros with GUE random-matrix predictions.
+Histograms are accumulated chunk by chunk, so spectra far larger than
+memory can be streamed from disk.
+
+Author: Sethu Iyer (https://sethuiyer.github.io/)
+Date: December 2024
+Version: 1.1
+"""
+
+import numpy as np
+
+def riemann_counting_function(t):
+    """
+    Smooth zero-counting function N̄(T) = T/(2π) log(T/(2π)) - T/(2π) + 7/8.
+
+    Its derivative log(T/(2π))/(2π) is the reciprocal of mean_zero_spacing(T).
+
+    Args:
+        t (array-like): Heights on the critical line
+
+    Returns:
+        numpy.ndarray: Expected number of zeros with height below t
+    """
+    x = np.asarray(t, dtype=float) / (2 * np.pi)
+    return x * np.log(x) - x + 7.0 / 8.0
+
+def eigenvalue_counting_function(eigenvalues, shift=0.5):
+    """
+    Smooth counting function for eigenvalues λ ≈ τ² + shift of the radial operator.
+
+    Args:
+        eigenvalues (array-like): Eigenvalues λ
+        shift (float): Offset between λ and τ² (1/2 for the radial operator)
+
+    Returns:
+        numpy.ndarray: N̄(sqrt(λ - shift))
+
+    Raises:
+        ValueError: If any λ ≤ shift (such levels have no real height τ)
+    """
+    eigenvalues = np.asarray(eigenvalues, dtype=float)
+    below = eigenvalues <= shift
+    if np.any(below):
+        raise ValueError(f"{np.count_nonzero(below)} eigenvalues are at or below the shift "
+                         f"{shift} (lowest {eigenvalues[below].min()}); drop them before unfolding")
+    return riemann_counting_function(np.sqrt(eigenvalues - shift))
+
+def unfold(levels, counting_function='riemann'):
+    """
+    Map levels to unit mean spacing with a smooth counting function.
+
+    Args:
+        levels (array-like): Ascending levels (zero heights or eigenvalues)
+        counting_function (str or callable): 'riemann' for zero heights,
+            'eigenvalue' for λ = τ² + 1/2, or any smooth N̄(E)
+
+    Returns:
+        numpy.ndarray: Unfolded levels N̄(levels)
+    """
+    if counting_function == 'riemann':
+        counting_function = riemann_counting_function
+    elif counting_function == 'eigenvalue':
+        counting_function = eigenvalue_counting_function
+    return np.asarray(counting_function(np.asarray(levels, dtype=float)), dtype=float)
+
+def gue_spacing_density(s):
+    """Wigner surmise for GUE nearest-neighbour spacings: (32/π²) s² exp(-4s²/π)."""
+    s = np.asarray(s, dtype=float)
+    return (32 / np.pi**2) * s**2 * np.exp(-4 * s**2 / np.pi)
+
+def gue_pair_correlation(r):
+    """Montgomery–Dyson pair correlation 1 - (sin(πr)/(πr))²."""
+    r = np.asarray(r, dtype=float)
+    return 1 - np.sinc(r)**2
+
+def iter_level_chunks(source, chunk_size=1_000_000):
+    """
+    Yield ascending chunks of a level list without loading it all.
+
+    Args:
+        source (str or array-like): Path to a .npy file (memory-mapped) or an array
+        chunk_size (int): Levels per chunk
+
+    Yields:
+        numpy.ndarray: The next chunk of levels
+    """
+    levels = np.load(source, mmap_mode='r') if isinstance(source, str) else source
+    for start in range(0, len(levels), chunk_size):
+        yield np.asarray(levels[start:start + chunk_size], dtype=float)
+
+class SpacingStatistics:
+    """
+    Streaming nearest-neighbour and pair-correlation histograms.
+
+    Each chunk is unfolded, and only the tail of unfolded levels within
+    max_distance of the end is carried to the next chunk, so memory is
+    bounded by the chunk size and the histogram resolution.
+    """
+
+    def __init__(self, counting_function='riemann', max_spacing=4.0, spacing_bins=80,
+                 max_distance=3.0, pair_bins=60):
+        """
+        Initialize empty histograms.
+
+        Args:
+            counting_function (str or callable): Passed to unfold
+            max_spacing (float): Upper edge of the spacing histogram
+            spacing_bins (int): Number of spacing bins
+            max_distance (float): Largest unfolded distance in the pair correlation
+            pair_bins (int): Number of pair-correlation bins
+        """
+        self.counting_function = counting_function
+        self.max_distance = max_distance
+        self.spacing_edges = np.linspace(0, max_spacing, spacing_bins + 1)
+        self.pair_edges = np.linspace(0, max_distance, pair_bins + 1)
+        self.spacing_counts = np.zeros(spacing_bins, dtype=np.int64)
+        self.pair_counts = np.zeros(pair_bins, dtype=np.int64)
+        self.n_levels = 0
+        self.n_spacings = 0
+        self.spacing_sum = 0.0
+        self.spacing_sum_sq = 0.0
+        self._tail = np.empty(0)
+
+    def update(self, levels):
+        """
+        Fold the next ascending chunk of levels into the histograms.
+
+        Args:
+            levels (array-like): Levels above every level seen so far
+        """
+        x = unfold(levels, self.counting_function)
+        if len(x) == 0:
+            return
+        combined = np.concatenate((self._tail, x))
+        n_tail = len(self._tail)
+
+        spacings = np.diff(combined[max(n_tail - 1, 0):])
+        self.spacing_counts += np.histogram(spacings, self.spacing_edges)[0]
+        self.n_spacings += len(spacings)
+        self.spacing_sum += spacings.sum()
+        self.spacing_sum_sq += (spacings**2).sum()
+
+        # Pairs (i, i+k) whose upper member is new; stop once no gap is short enough
+        k = 1
+        while k < len(combined):
+            gaps = combined[k:] - combined[:-k]
+            gaps = gaps[max(n_tail - k, 0):]
+            close = gaps[gaps < self.max_distance]
+            if len(close) == 0:
+                break
+            self.pair_counts += np.histogram(close, self.pair_edges)[0]
+            k += 1
+
+        self.n_levels += len(x)
+        self._tail = combined[combined > combined[-1] - self.max_distance]
+
+    def results(self):
+        """
+        Normalized densities alongside the GUE predictions.
+
+        Returns:
+            dict: Bin centres, spacing density P(s), pair correlation R₂(r),
+            their GUE counterparts, and spacing mean/variance
+        """
+        spacing_width = np.diff(self.spacing_edges)
+        pair_width = np.diff(self.pair_edges)
+        spacing_centres = 0.5 * (self.spacing_edges[1:] + self.spacing_edges[:-1])
+        pair_centres = 0.5 * (self.pair_edges[1:] + self.pair_edges[:-1])
+        mean = self.spacing_sum / self.n_spacings if self.n_spacings else float('nan')
+        variance = (self.spacing_sum_sq / self.n_spacings - mean**2
+                    if self.n_spacings else float('nan'))
+
+        return {
+            'n_levels': self.n_levels,
+            'mean_spacing': mean,
+            'spacing_variance': variance,
+            'spacing_centres': spacing_centres,
+            'spacing_density': self.spacing_counts / (max(self.n_spacings, 1) * spacing_width),
+            'gue_spacing_density': gue_spacing_density(spacing_centres),
+            'pair_centres': pair_centres,
+            'pair_correlation': self.pair_counts / (max(self.n_levels, 1) * pair_width),
+            'gue_pair_correlation': gue_pair_correlation(pair_centres)
+        }
+
+def spacing_statistics(levels, counting_function='riemann', chunk_size=1_000_000, **kwargs):
+    """
+    One-call spacing analysis of an array, a .npy path or an iterable of chunks.
+
+    Args:
+        levels (array-like, str or iterable): Levels, a .npy path, or ascending chunks
+        counting_function (str or callable): Passed to unfold
+        chunk_size (int): Chunk length when levels is an array or path
+        **kwargs: Histogram settings forwarded to SpacingStatistics
+
+    Returns:
+        dict: SpacingStatistics.results()
+    """
+    stats = SpacingStatistics(counting_function, **kwargs)
+    if isinstance(levels, (str, np.ndarray, list, tuple)):
+        levels = iter_level_chunks(levels if isinstance(levels, str) else np.asarray(levels),
+                                   chunk_size)
+    for chunk in levels:
+        stats.update(chunk)
+    return stats.results()
@@ -0,0 +1,232 @@
+"""
+LambdaCore-RiemannHypothesis: Eigensolver Planning Module
+
+Pre-flight memory and runtime estimates for the eigensolver backends
+available for symmetric tridiagonal operators, calibrated by timing each
+backend on small problems on the current machine. A plan is checked
+against memory and time budgets before anything is allocated, and the
+fastest backend that fits is selected automatically.
+
+Author: Sethu Iyer (https://sethuiyer.github.io/)
+Date: December 2024
+Version: 1.1
+"""
+
+import json
+import os
+import time
+import warnings
+import numpy as np
+import scipy.linalg as linalg
+from .tridiagonal import radial_operator_bands, nearest_eigenvalues, sturm_count
+
+# Backends able to return the full spectrum, and those for a window of k values
+FULL_SPECTRUM_BACKENDS = ('tridiagonal', 'dense')
+PARTIAL_SPECTRUM_BACKENDS = ('bisection', 'shift_invert', 'tridiagonal', 'dense')
+
+# Asymptotic cost models: (work(n, k), bytes(n, k)); work is scaled by a calibrated constant
+_COST_MODELS = {
+    # LAPACK syevd on a dense copy: O(n³) work, matrix plus its working copy
+    'dense': (lambda n, k: float(n)**3, lambda n, k: 16.0 * n**2 + 64.0 * n),
+    # LAPACK stemr on the bands: O(n²) work, O(n) storage
+    'tridiagonal': (lambda n, k: float(n)**2, lambda n, k: 96.0 * n),
+    # LAPACK stebz bisection for k eigenvalues: O(n k) work
+    'bisection': (lambda n, k: float(n) * k, lambda n, k: 96.0 * n + 16.0 * k),
+    # Sparse LU of H - σI plus a Lanczos basis of ~2k+1 vectors
+    'shift_invert': (lambda n, k: float(n) * max(k, 10),
+                     lambda n, k: 8.0 * n * (2 * max(k, 10) + 40)),
+}
+
+_CALIBRATION = None
+
+def _benchmark(backend, n, k, repeats):
+    diagonal, off_diagonal = radial_operator_bands(n + 1)
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        _solve(backend, diagonal, off_diagonal, k, sigma=None)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def calibrate(repeats=3, path=None):
+    """
+    Time every backend on a small problem and fit its cost constant.
+
+    Args:
+        repeats (int): Timings per backend; the fastest is kept
+        path (str): Optional JSON file; loaded if it exists, written otherwise
+
+    Returns:
+        dict: Seconds per unit of modelled work for each backend
+    """
+    global _CALIBRATION
+    if path is not None and os.path.exists(path):
+        with open(path) as stream:
+            _CALIBRATION = json.load(stream)
+        return _CALIBRATION
+
+    problems = {'dense': (400, None), 'tridiagonal': (4000, None),
+                'bisection': (20000, 10), 'shift_invert': (20000, 10)}
+    calibration = {}
+    for backend, (n, k) in problems.items():
+        seconds = _benchmark(backend, n, k, repeats)
+        calibration[backend] = seconds / _COST_MODELS[backend][0](n, k or n)
+
+    _CALIBRATION = calibration
+    if path is not None:
+        with open(path, 'w') as stream:
+            json.dump(calibration, stream, indent=2)
+    return calibration
+
+def available_memory():
+    """
+    Memory available for new allocations in bytes, or None if it cannot be read.
+
+    Uses MemAvailable from /proc/meminfo (free memory plus reclaimable
+    cache) on Linux, falling back to the free pages reported by sysconf.
+    """
+    try:
+        with open('/proc/meminfo') as stream:
+            for line in stream:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_AVPHYS_PAGES')
+    except (ValueError, OSError, AttributeError):
+        return None
+
+def estimate_cost(n, backend, num_eigenvalues=None, calibration=None):
+    """
+    Estimate memory and runtime of one eigensolve without allocating it.
+
+    Args:
+        n (int): Matrix order
+        backend (str): One of 'dense', 'tridiagonal', 'bisection', 'shift_invert'
+        num_eigenvalues (int): Eigenvalues wanted (None for the full spectrum)
+        calibration (dict): Cost constants from calibrate (calibrated lazily if None)
+
+    Returns:
+        dict: 'backend', 'memory_bytes' and 'seconds'
+    """
+    if backend not in _COST_MODELS:
+        raise ValueError(f"Unknown backend '{backend}'; expected one of {list(_COST_MODELS)}")
+    if calibration is None:
+        calibration = _CALIBRATION if _CALIBRATION is not None else calibrate()
+    k = n if num_eigenvalues is None else min(num_eigenvalues, n)
+    work, memory = _COST_MODELS[backend]
+    return {
+        'backend': backend,
+        'memory_bytes': memory(n, k),
+        'seconds': calibration[backend] * work(n, k)
+    }
+
+def plan_eigensolve(n, num_eigenvalues=None, backend='auto', memory_budget='auto',
+                    time_budget=None, calibration=None):
+    """
+    Choose an eigensolver backend that fits the memory and time budgets.
+
+    With backend='auto' the fastest feasible backend is chosen. An explicit
+    backend that exceeds a budget is downgraded to the fastest feasible one
+    with a warning; if nothing fits, the plan is refused.
+
+    Args:
+        n (int): Matrix order
+        num_eigenvalues (int): Eigenvalues wanted (None for the full spectrum)
+        backend (str): Requested backend or 'auto'
+        memory_budget (float): Bytes allowed; 'auto' uses 80% of available memory,
+            None disables the check
+        time_budget (float): Seconds allowed, or None
+        calibration (dict): Cost constants from calibrate
+
+    Returns:
+        dict: Chosen 'backend', its 'memory_bytes' and 'seconds', and the
+        'estimates' for every candidate
+
+    Raises:
+        ValueError: If no candidate backend fits the budgets
+    """
+    if memory_budget == 'auto':
+        available = available_memory()
+        memory_budget = 0.8 * available if available is not None else None
+    candidates = FULL_SPECTRUM_BACKENDS if num_eigenvalues is None else PARTIAL_SPECTRUM_BACKENDS
+    if backend != 'auto' and backend not in candidates:
+        raise ValueError(f"Backend '{backend}' cannot compute "
+                         f"{'the full spectrum' if num_eigenvalues is None else 'a partial spectrum'}; "
+                         f"expected one of {list(candidates)}")
+
+    estimates = [estimate_cost(n, name, num_eigenvalues, calibration) for name in candidates]
+
+    def fits(estimate):
+        return ((memory_budget is None or estimate['memory_bytes'] <= memory_budget) and
+                (time_budget is None or estimate['seconds'] <= time_budget))
+
+    feasible = sorted((e for e in estimates if fits(e)), key=lambda e: e['seconds'])
+    if not feasible:
+        raise ValueError(f"No eigensolver backend fits n={n} within memory budget "
+                         f"{memory_budget} bytes and time budget {time_budget} s")
+
+    chosen = feasible[0]
+    if backend != 'auto':
+        requested = next(e for e in estimates if e['backend'] == backend)
+        if fits(requested):
+            chosen = requested
+        else:
+            warnings.warn(f"Backend '{backend}' exceeds the budget "
+                          f"({requested['memory_bytes'] / 2**20:.0f} MB, ~{requested['seconds']:.0f} s); "
+                          f"using '{chosen['backend']}' instead")
+
+    return dict(chosen, estimates=estimates)
+
+def _solve(backend, diagonal, off_diagonal, num_eigenvalues, sigma):
+    n = len(diagonal)
+    if num_eigenvalues is None:
+        if backend == 'dense':
+            A = np.zeros((n, n))
+            np.fill_diagonal(A, diagonal)
+            np.fill_diagonal(A[1:], off_diagonal)
+            np.fill_diagonal(A[:, 1:], off_diagonal)
+            return np.linalg.eigvalsh(A)
+        return linalg.eigvalsh_tridiagonal(diagonal, off_diagonal)
+
+    k = min(num_eigenvalues, n)
+    if sigma is None:
+        # Lowest k eigenvalues: target just below the Gerschgorin lower bound
+        sigma = float(np.min(diagonal) - 2 * np.max(np.abs(off_diagonal), initial=0.0)) - 1.0
+
+    if backend == 'shift_invert':
+        return nearest_eigenvalues(diagonal, off_diagonal, sigma, k)
+    if backend == 'bisection':
+        # Index of sigma in the spectrum from a Sturm count, then an index window
+        below = int(sturm_count(diagonal, off_diagonal, sigma))
+        window = linalg.eigvalsh_tridiagonal(
+            diagonal, off_diagonal, select='i',
+            select_range=(max(0, below - k), min(n - 1, below + k - 1))
+        )
+    else:
+        window = _solve(backend, diagonal, off_diagonal, None, sigma)
+    return np.sort(window[np.argsort(np.abs(window - sigma))[:k]])
+
+def solve_radial_spectrum(N, epsilon=1e-6, T=15, num_eigenvalues=None, sigma=None,
+                          plan=None, **plan_options):
+    """
+    Plan and run an eigensolve of the radial operator.
+
+    Args:
+        N (int): Number of internal grid points (matrix order N-1)
+        epsilon (float): Small value for left boundary (log(epsilon))
+        T (float): Right boundary in t-coordinates
+        num_eigenvalues (int): Eigenvalues wanted (None for the full spectrum)
+        sigma (float): Target energy for a partial spectrum (lowest if None)
+        plan (dict): Precomputed plan_eigensolve result
+        **plan_options: Passed to plan_eigensolve when plan is None
+
+    Returns:
+        tuple: (eigenvalues sorted ascending, plan)
+    """
+    if plan is None:
+        plan = plan_eigensolve(N - 1, num_eigenvalues, **plan_options)
+    diagonal, off_diagonal = radial_operator_bands(N, epsilon, T)
+    eigenvalues = _solve(plan['backend'], diagonal, off_diagonal, num_eigenvalues, sigma)
+    return np.sort(eigenvalues), plan
@@ -0,0 +1,193 @@
+"""
+LambdaCore-RiemannHypothesis: Prime Race Module
+
+Streaming residue-class counters for the Chebyshev-bias race between
+prime classes (4n+3 vs 4n+1 by default). Primes are produced by the
+segmented sieve in zeta_functions.prime_blocks and folded into running
+counters block by block, so memory stays bounded however far the race
+is followed.
+
+Author: Sethu Iyer (https://sethuiyer.github.io/)
+Date: December 2024
+Version: 1.1
+"""
+
+import numpy as np
+from .zeta_functions import prime_blocks
+
+def logarithmic_milestones(limit, per_decade=1, start=10):
+    """
+    Checkpoint positions spaced evenly in log10(x) up to limit.
+
+    Args:
+        limit (int): Largest position; always included as the last milestone
+        per_decade (int): Number of milestones per factor of ten
+        start (int): First milestone
+
+    Returns:
+        numpy.ndarray: Sorted integer milestones
+    """
+    if limit < start:
+        return np.array([limit], dtype=np.int64)
+    exponents = np.arange(np.log10(start), np.log10(limit), 1.0 / per_decade)
+    milestones = np.unique(np.round(10.0**exponents).astype(np.int64))
+    return np.append(milestones[milestones < limit], limit)
+
+class PrimeRace:
+    """
+    Streaming race between two residue classes of primes modulo q.
+
+    Tracks per-class counts π(x; q, a), the lead π(x; q, leader) - π(x; q, trailer),
+    the number of lead changes (sign flips of the lead, ignoring ties) and
+    the running ratio, without keeping any primes in memory.
+    """
+
+    def __init__(self, modulus=4, leader=3, trailer=1):
+        """
+        Initialize empty race counters.
+
+        Args:
+            modulus (int): Modulus q of the residue classes
+            leader (int): Residue expected to lead (4n+3 for Chebyshev's bias)
+            trailer (int): Residue it is raced against
+        """
+        self.modulus = modulus
+        self.leader = leader
+        self.trailer = trailer
+        self.class_counts = np.zeros(modulus, dtype=np.int64)
+        self.lead = 0
+        self.lead_changes = 0
+        self.last_prime = 0
+        self.checkpoints = []
+        self._sign = 0
+
+    def update(self, primes, milestones=(), callback=None):
+        """
+        Fold the next ascending block of primes into the counters.
+
+        Args:
+            primes (numpy.ndarray): Primes larger than every prime seen so far
+            milestones (iterable): Positions x inside this block to checkpoint
+            callback (callable): Optional function called with each checkpoint
+        """
+        if len(primes) == 0:
+            return
+        residues = primes % self.modulus
+        step = (residues == self.leader).astype(np.int64) - (residues == self.trailer)
+        running = self.lead + np.cumsum(step)
+
+        # A lead change is a flip between strictly positive and negative leads
+        signs = np.sign(running)
+        nonzero = np.flatnonzero(signs)
+        flips = np.zeros(len(primes), dtype=np.int64)
+        if len(nonzero):
+            previous = np.concatenate(([self._sign], signs[nonzero[:-1]]))
+            flips[nonzero] = (previous != 0) & (previous != signs[nonzero])
+            self._sign = int(signs[nonzero[-1]])
+        cumulative_flips = np.cumsum(flips)
+
+        for x in milestones:
+            # Number of primes <= x within this block
+            n = int(np.searchsorted(primes, x, side='right'))
+            counts = self.class_counts + np.bincount(residues[:n], minlength=self.modulus)
+            checkpoint = self._checkpoint(
+                x, counts,
+                int(running[n - 1]) if n else self.lead,
+                self.lead_changes + (int(cumulative_flips[n - 1]) if n else 0)
+            )
+            self.checkpoints.append(checkpoint)
+            if callback is not None:
+                callback(checkpoint)
+
+        self.class_counts += np.bincount(residues, minlength=self.modulus)
+        self.lead = int(running[-1])
+        self.lead_changes += int(cumulative_flips[-1])
+        self.last_prime = int(primes[-1])
+
+    def _checkpoint(self, x, counts, lead, lead_changes):
+        leader_count = int(counts[self.leader])
+        trailer_count = int(counts[self.trailer])
+        return {
+            'x': int(x),
+            'prime_count': int(counts.sum()),
+            'class_counts': {r: int(c) for r, c in enumerate(counts)},
+            'lead': lead,
+            'lead_changes': lead_changes,
+            'ratio': leader_count / trailer_count if trailer_count > 0 else float('inf')
+        }
+
+    def run(self, limit, segment_size=2**22, per_decade=1, callback=None, blocks=None):
+        """
+        Sieve up to limit in segments, checkpointing at logarithmic milestones.
+
+        Args:
+            limit (int): Follow the race up to this bound
+            segment_size (int): Odd numbers sieved per segment
+            per_decade (int): Checkpoints per factor of ten
+            callback (callable): Optional function called with each checkpoint
+            blocks (iterable): Optional prime block stream to consume instead
+                of prime_blocks(limit, segment_size)
+
+        Returns:
+            dict: Final race state (same layout as a checkpoint)
+        """
+        milestones = logarithmic_milestones(limit, per_decade)
+        next_milestone = 0
+        if blocks is None:
+            blocks = prime_blocks(limit, segment_size)
+        for block in blocks:
+            if len(block) == 0:
+                # Segments without primes can neither advance the race nor settle a milestone
+                continue
+            due = milestones[next_milestone:]
+            due = due[due <= block[-1]]
+            next_milestone += len(due)
+            self.update(block, due, callback)
+
+        due = milestones[next_milestone:]
+        for x in due:
+            checkpoint = self._checkpoint(x, self.class_counts, self.lead, self.lead_changes)
+            self.checkpoints.append(checkpoint)
+            if callback is not None:
+                callback(checkpoint)
+        return self._checkpoint(limit, self.class_counts, self.lead, self.lead_changes)
+
+def streaming_partition_statistics(max_prime, segment_size=2**22, per_decade=1,
+                                   callback=None, blocks=None):
+    """
+    Streaming counterpart of PrimePartitioner.get_partition_statistics.
+
+    Counts the Euclidean (4n+1), Hyperbolic (4n+3) and Anchor (2) classes
+    up to max_prime without materializing the primes, and adds the race
+    history between the two main classes.
+
+    Args:
+        max_prime (int): Maximum prime to consider
+        segment_size (int): Odd numbers sieved per segment
+        per_decade (int): Checkpoints per factor of ten
+        callback (callable): Optional function called with each checkpoint
+        blocks (iterable): Optional prime block stream (see PrimeRace.run)
+
+    Returns:
+        dict: Partition statistics plus 'lead', 'lead_changes' and 'checkpoints'
+    """
+    race = PrimeRace(modulus=4, leader=3, trailer=1)
+    final = race.run(max_prime, segment_size, per_decade, callback, blocks)
+
+    n_euclidean = int(race.class_counts[1])
+    n_hyperbolic = int(race.class_counts[3])
+    n_anchor = int(race.class_counts[2])
+    n_total = final['prime_count']
+
+    return {
+        'euclidean_count': n_euclidean,
+        'hyperbolic_count': n_hyperbolic,
+        'anchor_count': n_anchor,
+        'total_count': n_total,
+        'balance_ratio': n_hyperbolic / n_euclidean if n_euclidean > 0 else float('inf'),
+        'euclidean_fraction': n_euclidean / n_total,
+        'hyperbolic_fraction': n_hyperbolic / n_total,
+        'lead': final['lead'],
+        'lead_changes': final['lead_changes'],
+        'checkpoints': race.checkpoints
+    }
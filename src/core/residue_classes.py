@@ -0,0 +1,141 @@
+"""
+LambdaCore-RiemannHypothesis: Residue Classes Module
+
+Multi-modulus prime partitioning. One shared prime array is classified
+for every requested modulus in a single vectorized pass, and class
+membership is kept as compact residue arrays from which masks, index
+lists and Dirichlet-character sign patterns are derived on demand.
+
+Author: Sethu Iyer (https://sethuiyer.github.io/)
+Date: December 2024
+Version: 1.1
+"""
+
+import numpy as np
+from .zeta_functions import sieve_of_eratosthenes
+
+class ResidueClassPartitioner:
+    """
+    Partitions one prime array into residue classes for many moduli at once.
+
+    The Λ-Core split is the modulus-4 case: residue 1 (Euclidean),
+    residue 3 (Hyperbolic) and the ramified prime 2 (Anchor).
+    """
+
+    def __init__(self, moduli=(4,), max_prime=10000, primes=None):
+        """
+        Classify the primes for all moduli.
+
+        Args:
+            moduli (iterable): Moduli q to partition by
+            max_prime (int): Maximum prime to consider when primes is None
+            primes (array-like): Optional precomputed ascending primes to share
+        """
+        if primes is None:
+            primes = sieve_of_eratosthenes(max_prime)
+        self.primes = np.asarray(primes, dtype=np.int64)
+        self.max_prime = int(self.primes[-1]) if len(self.primes) else max_prime
+        self.moduli = np.array(sorted(set(int(q) for q in moduli)), dtype=np.int64)
+        self._rows = {int(q): i for i, q in enumerate(self.moduli)}
+
+        # Smallest unsigned type that holds every residue
+        dtype = np.min_scalar_type(int(self.moduli.max()) - 1) if len(self.moduli) else np.uint8
+        self.residues = (self.primes[np.newaxis, :] % self.moduli[:, np.newaxis]).astype(dtype)
+
+    def residues_for(self, modulus):
+        """
+        Residues p mod q for every prime.
+
+        Args:
+            modulus (int): One of the partitioned moduli
+
+        Returns:
+            numpy.ndarray: Residue of each prime (a view, not a copy)
+        """
+        if modulus not in self._rows:
+            raise KeyError(f"Modulus {modulus} was not partitioned; "
+                           f"available: {list(self._rows)}")
+        return self.residues[self._rows[modulus]]
+
+    def class_mask(self, modulus, residue):
+        """Boolean mask of the primes p ≡ residue (mod modulus)."""
+        return self.residues_for(modulus) == residue
+
+    def class_indices(self, modulus, residue):
+        """Indices into self.primes of the primes p ≡ residue (mod modulus)."""
+        return np.flatnonzero(self.class_mask(modulus, residue))
+
+    def class_primes(self, modulus, residue):
+        """The primes p ≡ residue (mod modulus)."""
+        return self.primes[self.class_mask(modulus, residue)]
+
+    def class_counts(self, modulus):
+        """
+        Number of primes in every residue class.
+
+        Args:
+            modulus (int): One of the partitioned moduli
+
+        Returns:
+            numpy.ndarray: counts[a] = #{p : p ≡ a (mod modulus)}
+        """
+        return np.bincount(self.residues_for(modulus), minlength=modulus)
+
+    def character_values(self, modulus, character):
+        """
+        Evaluate a Dirichlet character on every prime.
+
+        Args:
+            modulus (int): One of the partitioned moduli
+            character (array-like): Values χ(a) for a = 0, ..., modulus-1
+
+        Returns:
+            numpy.ndarray: χ(p) for each prime (0 for primes dividing modulus)
+        """
+        character = np.asarray(character)
+        if len(character) != modulus:
+            raise ValueError(f"Character table has {len(character)} entries, "
+                             f"expected {modulus}")
+        return character[self.residues_for(modulus)]
+
+    def sign_pattern(self, modulus, character):
+        """
+        Λ-Core sign pattern induced by a real character.
+
+        Generalizes the modulus-4 rule: sign(p) = χ(p) for unramified
+        primes, and +1 (Anchor) for the primes dividing the modulus.
+
+        Args:
+            modulus (int): One of the partitioned moduli
+            character (array-like): Real character values χ(a), a = 0, ..., modulus-1
+
+        Returns:
+            numpy.ndarray: +1/-1 sign of each prime as int8
+        """
+        values = np.real(self.character_values(modulus, character))
+        return np.where(values == 0, 1, np.sign(values)).astype(np.int8)
+
+    def get_partition_statistics(self, modulus):
+        """
+        Compute class statistics for one modulus.
+
+        Args:
+            modulus (int): One of the partitioned moduli
+
+        Returns:
+            dict: Per-class counts over the reduced residues, ramified count
+            and the spread between the largest and smallest class
+        """
+        counts = self.class_counts(modulus)
+        reduced = [a for a in range(modulus) if np.gcd(a, modulus) == 1]
+        reduced_counts = counts[reduced]
+        n_total = len(self.primes)
+
+        return {
+            'modulus': modulus,
+            'class_counts': {a: int(counts[a]) for a in reduced},
+            'ramified_count': int(n_total - reduced_counts.sum()),
+            'total_count': n_total,
+            'balance_ratio': (float(reduced_counts.max() / reduced_counts.min())
+                              if reduced_counts.min() > 0 else float('inf'))
+        }
@@ -11,140 +11,266 @@ Version: 1.1
 
 import numpy as np
 import scipy.linalg as linalg
-import matplotlib.pyplot as plt
 from .prime_operators import PrimePotential
 from .zeta_functions import known_riemann_zeros
+from .artifacts import match_table
+from .tridiagonal import (nearest_eigenvalues, sturm_count, precision_dtype,
+                          sampled_precision_error, tridiagonal_operator, iterative_eigenvalues)
 
 class QuantumHamiltonian:
- """
- Constructs and solves the quantum Hamiltonian H = T + V where:
- T = -1/2 * d²/dy² (kinetic energy operator)
- V = prime potential from the Λ-Core framework
- """
- 
- def __init__(self, prime_potential, y_min=0, y_max=10, n_grid=1000):
- """
- Initialize the Hamiltonian constructor.
- 
- Args:
- prime_potential (PrimePotential): The prime potential object
- y_min (float): Minimum coordinate value
- y_max (float): Maximum coordinate value
- n_grid (int): Number of grid points
- """
- self.prime_potential = prime_potential
- self.y_min = y_min
- self.y_max = y_max
- self.n_grid = n_grid
- self.dy = (y_max - y_min) / n_grid
- 
- # Construct the Hamiltonian components
- self._construct_kinetic_operator()
- self._construct_potential_operator()
- self._construct_hamiltonian()
- 
- def _construct_kinetic_operator(self):
- """
- Construct the kinetic energy operator T = -1/2 * d²/dy².
- Uses standard finite difference discretization.
- """
- self.T_matrix = np.zeros((self.n_grid, self.n_grid))
- 
- # Second derivative finite difference: [-1, 2, -1] / dy²
- self.T_matrix += np.diag(-2 * np.ones(self.n_grid))
- self.T_matrix += np.diag(np.ones(self.n_grid - 1), k=1)
- self.T_matrix += np.diag(np.ones(self.n_grid - 1), k=-1)
- 
- # Apply the -1/2 factor and grid scaling
- self.T_matrix *= -1.0 / (2.0 * self.dy**2)
- 
- def _construct_potential_operator(self):
- """
- Construct the potential energy operator V from prime spectrum.
- """
- y_grid, V_potential = self.prime_potential.construct_discrete_potential(
- self.y_min, self.y_max, self.n_grid
- )
- self.V_matrix = np.diag(V_potential)
- self.y_grid = y_grid
- self.V_potential = V_potential
- 
- def _construct_hamiltonian(self):
- """
- Construct the full Hamiltonian H = T + V.
- """
- self.H_matrix = self.T_matrix + self.V_matrix
- 
- def solve_eigenvalues(self, num_eigenvalues=15, which='smallest'):
- """
- Solve for the eigenvalues of the Hamiltonian.
- 
- Args:
- num_eigenvalues (int): Number of eigenvalues to compute
- which (str): Which eigenvalues to compute ('smallest', 'largest')
- 
- Returns:
- tuple: (eigenvalues, eigenvectors)
- """
- if which == 'smallest':
- # Get the smallest eigenvalues
- eigenvalues = linalg.eigvalsh(
- self.H_matrix, 
- subset_by_index=[0, num_eigenvalues-1]
- )
- else:
- # For largest, need to compute more and select
- eigenvalues = linalg.eigvalsh(self.H_matrix)
- eigenvalues = eigenvalues[-num_eigenvalues:]
- 
- # Filter for positive eigenvalues (physical spectrum)
- positive_eigenvalues = eigenvalues[eigenvalues > 0]
- 
- return positive_eigenvalues
- 
- def compute_riemann_approximation(self, num_zeros=15):
- """
- Compute approximation to Riemann zeros using eigenvalues.
- The correspondence is: t_n ≈ sqrt(E_n)
- 
- Args:
- num_zeros (int): Number of zeros to approximate
- 
- Returns:
- numpy.ndarray: Approximated zero heights
- """
- eigenvalues = self.solve_eigenvalues(num_zeros)
- return np.sqrt(eigenvalues)
- 
- def validate_against_known_zeros(self, num_zeros=15):
- """
- Compare computed eigenvalues against known Riemann zeros.
- 
- Args:
- num_zeros (int): Number of zeros to compare
- 
- Returns:
- dict: Validation results and statistics
- """
- computed_zeros = self.compute_riemann_approximation(num_zeros)
- known_zeros = np.array(known_riemann_zeros()[:num_zeros])
- 
- # Ensure we have the same number for comparison
- min_length = min(len(computed_zeros), len(known_zeros))
- computed_zeros = computed_zeros[:min_length]
- known_zeros = known_zeros[:min_length]
- 
- # Compute relative errors
- relative_errors = np.abs(computed_zeros - known_zeros) / known_zeros * 100
- 
- results = {
- 'computed_zeros': computed_zeros,
- 'known_zeros': known_zeros,
- 'relative_errors': relative_errors,
- 'mean_relative_error': np.mean(relative_errors),
- 'max_relative_error': np.max(relative_errors),
- 'min_relative_error': np.min(relative_errors),
- 'num_compared': min_length
- }
- 
- return results 
\ No newline at end of file
+    """
+    Constructs and solves the quantum Hamiltonian H = T + V where:
+    T = -1/2 * d²/dy² (kinetic energy operator)
+    V = prime potential from the Λ-Core framework
+    """
+
+    def __init__(self, prime_potential, y_min=0, y_max=10, n_grid=1000, precision='double',
+                 assemble=True):
+        """
+        Initialize the Hamiltonian constructor.
+
+        Args:
+            prime_potential (PrimePotential): The prime potential object, or a
+                PotentialPyramid sharing one fine binning across several n_grid
+            y_min (float): Minimum coordinate value
+            y_max (float): Maximum coordinate value
+            n_grid (int): Number of grid points
+            precision (str): 'double', or 'single' for a float32 preview that halves
+                memory and bandwidth (check it with preview_error)
+            assemble (bool): Build the dense T, V and H matrices now; with False
+                only the potential is kept (O(n_grid) memory) for the band and
+                matrix-free solvers, and the dense solvers assemble on first use
+        """
+        self.prime_potential = prime_potential
+        self.precision = precision
+        self.dtype = precision_dtype(precision)
+        self.y_min = y_min
+        self.y_max = y_max
+        self.n_grid = n_grid
+        self.dy = (y_max - y_min) / n_grid
+
+        self.y_grid, self.V_potential = prime_potential.construct_discrete_potential(
+            self.y_min, self.y_max, self.n_grid
+        )
+        self.H_matrix = None
+        if assemble:
+            self.assemble()
+
+    def assemble(self):
+        """
+        Construct the dense Hamiltonian components T, V and H = T + V.
+        """
+        self._construct_kinetic_operator()
+        self._construct_potential_operator()
+        self._construct_hamiltonian()
+
+    def _construct_kinetic_operator(self):
+        """
+        Construct the kinetic energy operator T = -1/2 * d²/dy².
+        Uses standard finite difference discretization.
+        """
+        self.T_matrix = np.zeros((self.n_grid, self.n_grid), dtype=self.dtype)
+
+        # Second derivative finite difference: [-1, 2, -1] / dy²
+        self.T_matrix += np.diag(-2 * np.ones(self.n_grid, dtype=self.dtype))
+        self.T_matrix += np.diag(np.ones(self.n_grid - 1, dtype=self.dtype), k=1)
+        self.T_matrix += np.diag(np.ones(self.n_grid - 1, dtype=self.dtype), k=-1)
+
+        # Apply the -1/2 factor and grid scaling
+        self.T_matrix *= -1.0 / (2.0 * self.dy**2)
+
+    def _construct_potential_operator(self):
+        """
+        Construct the potential energy operator V from prime spectrum.
+        """
+        self.V_matrix = np.diag(self.V_potential.astype(self.dtype))
+
+    def _construct_hamiltonian(self):
+        """
+        Construct the full Hamiltonian H = T + V.
+        """
+        self.H_matrix = self.T_matrix + self.V_matrix
+
+    def tridiagonal_bands(self, dtype=None):
+        """
+        Return the Hamiltonian in tridiagonal band storage.
+
+        Args:
+            dtype: Floating-point type of the bands (defaults to the working precision)
+
+        Returns:
+            tuple: (diagonal, off_diagonal) of H = T + V
+        """
+        dtype = self.dtype if dtype is None else dtype
+        diagonal = np.full(self.n_grid, 1.0 / self.dy**2) + self.V_potential
+        off_diagonal = np.full(self.n_grid - 1, -1.0 / (2.0 * self.dy**2))
+        return diagonal.astype(dtype), off_diagonal.astype(dtype)
+
+    def solve_eigenvalues(self, num_eigenvalues=15, which='smallest', sigma=None):
+        """
+        Solve for the eigenvalues of the Hamiltonian.
+
+        Args:
+            num_eigenvalues (int): Number of eigenvalues to compute
+            which (str): Which eigenvalues to compute ('smallest', 'largest', 'nearest')
+            sigma (float): Target energy for which='nearest', e.g. t_n² for a zero t_n
+
+        Returns:
+            numpy.ndarray: Positive eigenvalues of the requested part of the spectrum
+        """
+        if which in ('smallest', 'largest') and self.H_matrix is None:
+            self.assemble()
+
+        if which == 'smallest':
+            # Get the smallest eigenvalues
+            eigenvalues = linalg.eigvalsh(
+                self.H_matrix,
+                subset_by_index=[0, num_eigenvalues-1]
+            )
+        elif which == 'largest':
+            # LAPACK can select the top of the spectrum by index directly
+            eigenvalues = linalg.eigvalsh(
+                self.H_matrix,
+                subset_by_index=[self.n_grid - num_eigenvalues, self.n_grid - 1]
+            )
+        elif which == 'nearest':
+            if sigma is None:
+                raise ValueError("which='nearest' requires a target energy sigma")
+            # Shift-invert Lanczos around sigma on the tridiagonal bands
+            diagonal, off_diagonal = self.tridiagonal_bands()
+            eigenvalues = nearest_eigenvalues(
+                diagonal, off_diagonal, sigma, num_eigenvalues
+            )
+        else:
+            raise ValueError(f"Unknown eigenvalue selection: {which}")
+
+        # Filter for positive eigenvalues (physical spectrum)
+        positive_eigenvalues = eigenvalues[eigenvalues > 0]
+
+        return positive_eigenvalues
+
+    def linear_operator(self, terms=()):
+        """
+        Return H as a matrix-free operator.
+
+        H·ψ is the kinetic stencil plus a diagonal multiply by V, vectorized
+        over blocks of vectors; extra terms are added by their action only.
+
+        Args:
+            terms (iterable): Callables mapping an (n_grid, k) block ψ to a
+                symmetric term's action on it (e.g. a smoothing convolution)
+
+        Returns:
+            scipy.sparse.linalg.LinearOperator: H (plus terms), never assembled
+        """
+        diagonal, _ = self.tridiagonal_bands(dtype=np.float64)
+        return tridiagonal_operator(diagonal, -1.0 / (2.0 * self.dy**2), terms)
+
+    def solve_matrix_free(self, num_eigenvalues=15, terms=(), tolerance=1e-12,
+                          max_iterations=None):
+        """
+        Solve for the lowest eigenvalues without materializing H.
+
+        LOBPCG is started from the lowest eigenvectors of T + V and
+        preconditioned by its shifted band factorization, so with extra terms
+        it converges in a few iterations of O(n_grid) work each.
+
+        Args:
+            num_eigenvalues (int): Number of eigenvalues to compute
+            terms (iterable): Extra symmetric terms (see linear_operator)
+            tolerance (float): Residual tolerance relative to the operator norm
+            max_iterations (int): Iteration limit
+
+        Returns:
+            numpy.ndarray: Positive eigenvalues of the lowest part of the spectrum
+        """
+        eigenvalues = iterative_eigenvalues(
+            self.linear_operator(terms), num_eigenvalues,
+            bands=self.tridiagonal_bands(dtype=np.float64), tolerance=tolerance,
+            max_iterations=max_iterations
+        )
+        return eigenvalues[eigenvalues > 0]
+
+    def preview_error(self, eigenvalues, num_samples=3):
+        """
+        Estimate the error of a single-precision solve against float64.
+
+        A few of the given eigenvalues are re-resolved by float64 bisection on
+        the tridiagonal bands, which costs O(n_grid) each, so thousands of
+        preview configurations can be triaged cheaply.
+
+        Args:
+            eigenvalues (numpy.ndarray): Eigenvalues from solve_eigenvalues
+            num_samples (int): Number of eigenvalues to check
+
+        Returns:
+            dict: Sampled float64 references and relative errors (see
+            tridiagonal.sampled_precision_error)
+        """
+        diagonal, off_diagonal = self.tridiagonal_bands(dtype=np.float64)
+        return sampled_precision_error(diagonal, off_diagonal, eigenvalues, num_samples)
+
+    def count_eigenvalues(self, energies):
+        """
+        Count eigenvalues below each energy via Sturm sequences.
+
+        Args:
+            energies (array-like): Energies E
+
+        Returns:
+            numpy.ndarray: N(E), the number of eigenvalues below each E
+        """
+        diagonal, off_diagonal = self.tridiagonal_bands(dtype=np.float64)
+        return sturm_count(diagonal, off_diagonal, energies)
+
+    def compute_riemann_approximation(self, num_zeros=15):
+        """
+        Compute approximation to Riemann zeros using eigenvalues.
+        The correspondence is: t_n ≈ sqrt(E_n)
+
+        Args:
+            num_zeros (int): Number of zeros to approximate
+
+        Returns:
+            numpy.ndarray: Approximated zero heights
+        """
+        eigenvalues = self.solve_eigenvalues(num_zeros)
+        return np.sqrt(eigenvalues)
+
+    def validate_against_known_zeros(self, num_zeros=15):
+        """
+        Compare computed eigenvalues against known Riemann zeros.
+
+        Args:
+            num_zeros (int): Number of zeros to compare
+
+        Returns:
+            dict: Validation results and statistics; 'table' holds the matches
+            as columns (artifacts.MATCH_SCHEMA, with λ = t² and no epsilon)
+        """
+        computed_zeros = self.compute_riemann_approximation(num_zeros)
+        known_zeros = np.array(known_riemann_zeros()[:num_zeros])
+
+        # Ensure we have the same number for comparison
+        min_length = min(len(computed_zeros), len(known_zeros))
+        computed_zeros = computed_zeros[:min_length]
+        known_zeros = known_zeros[:min_length]
+
+        # Compute relative errors
+        relative_errors = np.abs(computed_zeros - known_zeros) / known_zeros * 100
+
+        results = {
+            'computed_zeros': computed_zeros,
+            'known_zeros': known_zeros,
+            'relative_errors': relative_errors,
+            'mean_relative_error': np.mean(relative_errors),
+            'max_relative_error': np.max(relative_errors),
+            'min_relative_error': np.min(relative_errors),
+            'num_compared': min_length,
+            'table': match_table(
+                np.arange(1, min_length + 1), known_zeros, known_zeros**2, computed_zeros**2,
+                N=self.n_grid, T=self.y_max
+            )
+        }
+
+        return results
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+LambdaCore-RiemannHypothesis: BLAS Thread Control Module
+
+Thread-count control for the BLAS/LAPACK libraries behind numpy and
+scipy, so that concurrent eigensolves share the cores instead of each
+grabbing all of them. threadpoolctl is used when it is installed; without
+it, limits are applied through the standard environment variables, which
+only take effect in worker processes spawned afterwards (a warning is
+issued, since the BLAS pool of the running process is left unchanged).
+
+Author: Sethu Iyer (https://sethuiyer.github.io/)
+Date: December 2024
+Version: 1.1
+"""
+
+import multiprocessing
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:
+    threadpool_limits = None
+
+# Variables read by OpenBLAS, MKL, BLIS, Accelerate and OpenMP at load time
+THREAD_ENVIRONMENT_VARIABLES = (
+    'OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+    'BLIS_NUM_THREADS', 'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS'
+)
+
+_persistent_limit = None
+
+def _set_environment(num_threads):
+    previous = {name: os.environ.get(name) for name in THREAD_ENVIRONMENT_VARIABLES}
+    for name in THREAD_ENVIRONMENT_VARIABLES:
+        os.environ[name] = str(num_threads)
+    return previous
+
+def _restore_environment(previous):
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+@contextmanager
+def blas_threads(num_threads):
+    """
+    Limit BLAS/LAPACK threads for the duration of a block.
+
+    Example:
+        with blas_threads(2):
+            eigenvalues = hamiltonian.solve_eigenvalues(15)
+
+    Args:
+        num_threads (int): Threads each BLAS/LAPACK call may use
+
+    Yields:
+        int: The thread count in effect
+    """
+    previous = _set_environment(num_threads)
+    limiter = None
+    if threadpool_limits is not None:
+        limiter = threadpool_limits(limits=num_threads, user_api='blas')
+    else:
+        warnings.warn("threadpoolctl is not installed; blas_threads only affects "
+                      "processes started inside the block")
+    try:
+        yield num_threads
+    finally:
+        if limiter is not None:
+            limiter.restore_original_limits()
+        _restore_environment(previous)
+
+def set_blas_threads(num_threads):
+    """
+    Set the BLAS/LAPACK thread count for the rest of this process.
+
+    Also exported through the environment, so worker processes spawned
+    later inherit the same limit. Without threadpoolctl only that export
+    happens, and a warning is issued.
+
+    Args:
+        num_threads (int): Threads each BLAS/LAPACK call may use
+    """
+    global _persistent_limit
+    _set_environment(num_threads)
+    if threadpool_limits is not None:
+        _persistent_limit = threadpool_limits(limits=num_threads, user_api='blas')
+    else:
+        warnings.warn("threadpoolctl is not installed; set_blas_threads only affects "
+                      "processes spawned afterwards, not this one")
+
+def _limit_worker_threads(num_threads):
+    """Process-pool initializer: pin the worker's BLAS pool."""
+    _set_environment(num_threads)
+    if threadpool_limits is not None:
+        global _persistent_limit
+        _persistent_limit = threadpool_limits(limits=num_threads, user_api='blas')
+
+def parallel_sweep(function, items, workers=None, threads_per_worker=None):
+    """
+    Map a function over sweep points in worker processes with BLAS threads split.
+
+    Cores are divided between workers (threads_per_worker defaults to
+    cpu_count // workers), so total BLAS threads never exceed the cores.
+
+    Args:
+        function (callable): Module-level (importable) function of one sweep point
+        items (iterable): Sweep points, e.g. N values or parameter dicts
+        workers (int): Number of worker processes (defaults to the core count)
+        threads_per_worker (int): BLAS threads per worker
+
+    Returns:
+        list: Results in the order of items
+    """
+    cores = os.cpu_count() or 1
+    workers = workers or cores
+    threads_per_worker = threads_per_worker or max(1, cores // workers)
+
+    # Spawned (not forked) workers load BLAS fresh, so the environment
+    # applies there even without threadpoolctl
+    previous = _set_environment(threads_per_worker)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_limit_worker_threads,
+                                 initargs=(threads_per_worker,),
+                                 mp_context=multiprocessing.get_context('spawn')) as pool:
+            return list(pool.map(function, items))
+    finally:
+        _restore_environment(previous)
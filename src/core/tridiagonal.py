@@ -0,0 +1,446 @@
+"""
+LambdaCore-RiemannHypothesis: Tridiagonal Operators Module
+
+Band-storage helpers for the symmetric tridiagonal operators of the
+Λ-Core framework (the prime Hamiltonian and the radial operator),
+including interior eigenvalue solves centred on a target energy,
+Sturm-sequence eigenvalue counting, eigenvalue continuation along a path
+of operators, float64 error checks for float32 preview solves, and
+matrix-free application for iterative (Lanczos/LOBPCG) eigensolvers.
+
+Author: Sethu Iyer (https://sethuiyer.github.io/)
+Date: December 2024
+Version: 1.1
+"""
+
+import numpy as np
+import scipy.linalg as linalg
+import scipy.sparse as sparse
+from scipy.sparse.linalg import LinearOperator, eigsh, lobpcg, minres, onenormest
+
+# Working precisions: 'single' is a float32 preview for fast triage
+PRECISION_DTYPES = {'double': np.float64, 'single': np.float32}
+
+def radial_operator_bands(N, epsilon=1e-6, T=15, centrifugal=0.75):
+    """
+    Bands of the discretized radial operator L_radial = -d²/dt² + 3/4.
+
+    Same (N-1) x (N-1) operator as RiemannZeroVerifier.compute_eigenvalues,
+    on t in [log(epsilon), T] with grid spacing h = (T - log(epsilon)) / N.
+
+    Args:
+        N (int): Number of internal grid points
+        epsilon (float): Small value for left boundary (log(epsilon))
+        T (float): Right boundary in t-coordinates
+        centrifugal (float): Constant centrifugal term on the diagonal
+
+    Returns:
+        tuple: (diagonal, off_diagonal) of lengths N-1 and N-2
+    """
+    h = (T - np.log(epsilon)) / N
+    diagonal = np.full(N - 1, 2 / h**2 + centrifugal)
+    off_diagonal = np.full(N - 2, -1 / h**2)
+    return diagonal, off_diagonal
+
+def radial_channel_spectra(N, centrifugal_terms, epsilon=1e-6, T=15, num_eigenvalues=None):
+    """
+    Spectra of the radial operator for a batch of centrifugal channels.
+
+    All channels share the grid and the -d²/dt² stencil. A constant term c
+    shifts the spectrum exactly, eig(L_0 + cI) = eig(L_0) + c, so every
+    constant channel comes from one solve of the stencil plus a broadcast
+    add; only position-dependent profiles need a band solve of their own.
+
+    Args:
+        N (int): Number of internal grid points
+        centrifugal_terms (iterable): One term per channel, either a constant
+            (e.g. 0.75 for m = 0) or an array of N-1 values on the internal grid
+        epsilon (float): Small value for left boundary (log(epsilon))
+        T (float): Right boundary in t-coordinates
+        num_eigenvalues (int): Lowest eigenvalues to keep per channel (all if None)
+
+    Returns:
+        numpy.ndarray: Sorted eigenvalues, shape (channels, eigenvalues)
+
+    Raises:
+        ValueError: If no channel is given, or a profile has the wrong length
+    """
+    centrifugal_terms = list(centrifugal_terms)
+    if not centrifugal_terms:
+        raise ValueError("centrifugal_terms must contain at least one channel")
+    diagonal, off_diagonal = radial_operator_bands(N, epsilon, T, centrifugal=0.0)
+    select = {}
+    if num_eigenvalues is not None and num_eigenvalues < N - 1:
+        select = {'select': 'i', 'select_range': (0, num_eigenvalues - 1)}
+    size = N - 1 if not select else num_eigenvalues
+
+    spectra = np.empty((len(centrifugal_terms), size))
+    constant = [i for i, term in enumerate(centrifugal_terms) if np.ndim(term) == 0]
+    if constant:
+        base = linalg.eigvalsh_tridiagonal(diagonal, off_diagonal, **select)
+        shifts = np.array([centrifugal_terms[i] for i in constant], dtype=float)
+        spectra[constant] = base[np.newaxis, :] + shifts[:, np.newaxis]
+
+    for i, term in enumerate(centrifugal_terms):
+        if np.ndim(term) == 0:
+            continue
+        profile = np.asarray(term, dtype=float)
+        if profile.shape != diagonal.shape:
+            raise ValueError(f"Centrifugal profile {i} has shape {profile.shape}, "
+                             f"expected ({N - 1},)")
+        spectra[i] = linalg.eigvalsh_tridiagonal(diagonal + profile, off_diagonal, **select)
+    return spectra
+
+def tridiagonal_matrix(diagonal, off_diagonal):
+    """
+    Assemble a symmetric tridiagonal matrix in sparse CSC storage.
+
+    Args:
+        diagonal (numpy.ndarray): Main diagonal, length N
+        off_diagonal (numpy.ndarray): Sub/super diagonal, length N-1
+
+    Returns:
+        scipy.sparse.csc_matrix: The N x N operator
+    """
+    return sparse.diags(
+        [off_diagonal, diagonal, off_diagonal], offsets=[-1, 0, 1], format='csc'
+    )
+
+def tridiagonal_operator(diagonal, off_diagonal, terms=()):
+    """
+    Matrix-free symmetric operator: a three-point stencil plus extra terms.
+
+    H·ψ is applied as a diagonal multiply and two shifted vector updates,
+    vectorized over blocks of vectors, so iterative eigensolvers never see
+    an assembled matrix. Terms that are cheap to apply but expensive to
+    assemble (non-local couplings, smoothing convolutions) are added as
+    callables.
+
+    Args:
+        diagonal (numpy.ndarray): Main diagonal, length N
+        off_diagonal (numpy.ndarray or float): Sub/super diagonal, length N-1 or constant
+        terms (iterable): Callables mapping an (N, k) block ψ to the symmetric
+            term's action on it, same shape
+
+    Returns:
+        scipy.sparse.linalg.LinearOperator: The N x N operator
+    """
+    diagonal = np.asarray(diagonal)
+    n = len(diagonal)
+    off_diagonal = np.broadcast_to(np.asarray(off_diagonal), (n - 1,))[:, np.newaxis]
+    diagonal = diagonal[:, np.newaxis]
+    terms = tuple(terms)
+
+    def apply(psi):
+        psi = np.asarray(psi)
+        block = psi.reshape(n, -1)
+        result = diagonal * block
+        result[1:] += off_diagonal * block[:-1]
+        result[:-1] += off_diagonal * block[1:]
+        for term in terms:
+            result += term(block)
+        return result.reshape(psi.shape)
+
+    dtype = np.result_type(diagonal, off_diagonal)
+    return LinearOperator((n, n), matvec=apply, rmatvec=apply, matmat=apply,
+                          rmatmat=apply, dtype=dtype)
+
+def iterative_eigenvalues(operator, num_eigenvalues=10, bands=None,
+                          tolerance=1e-12, max_iterations=None, seed=0):
+    """
+    Lowest eigenvalues of a symmetric operator using only its action.
+
+    Runs block LOBPCG; when the local (stencil + diagonal) part is given
+    as bands, its lowest eigenvectors start the block and the shifted band
+    factorization (H_local - σI)⁻¹, σ below its spectrum, preconditions the
+    iteration. Memory is O(N) per vector, and only the extra terms decide
+    the iteration count. Operators too small for a LOBPCG block (N below
+    five times the block size) are applied to the identity and solved
+    densely.
+
+    The residuals ||Hx - λx|| of the result are checked against the
+    tolerance. If LOBPCG stalls (strong non-local terms can break it), the
+    banded case falls back to shift-invert Lanczos about σ, with each
+    (H - σI)⁻¹ applied by MINRES under the same band preconditioner.
+
+    Args:
+        operator (LinearOperator): Symmetric N x N operator
+        num_eigenvalues (int): Number of lowest eigenvalues to return
+        bands (tuple): Optional (diagonal, off_diagonal) of the local part
+        tolerance (float): Residual tolerance relative to the operator norm
+        max_iterations (int): Iteration limit (default 500)
+        seed (int): Seed of the random start block when bands are not given
+
+    Returns:
+        numpy.ndarray: The lowest eigenvalues, sorted ascending
+
+    Raises:
+        numpy.linalg.LinAlgError: If the residuals miss the tolerance
+    """
+    n = operator.shape[0]
+    k = min(num_eigenvalues, n)
+    # A few guard vectors beyond k speed up convergence of the k-th value
+    block_size = k + max(k // 2, 2)
+    if 5 * block_size > n:
+        return linalg.eigvalsh(operator @ np.eye(n))[:k]
+
+    preconditioner = None
+    if bands is None:
+        start = np.random.default_rng(seed).standard_normal((n, block_size))
+    else:
+        diagonal = np.asarray(bands[0], dtype=float)
+        off_diagonal = np.broadcast_to(np.asarray(bands[1], dtype=float), (n - 1,))
+        local, start = linalg.eigh_tridiagonal(
+            diagonal, off_diagonal, select='i', select_range=(0, block_size - 1)
+        )
+        shift = local[0] - (local[-1] - local[0] or max(abs(local[0]), 1.0))
+        factor = linalg.cholesky_banded(np.vstack([np.r_[0.0, off_diagonal], diagonal - shift]))
+        solve = lambda block: linalg.cho_solve_banded((factor, False), block)
+        preconditioner = LinearOperator((n, n), matvec=solve, matmat=solve, dtype=float)
+
+    # LOBPCG's tolerance is an absolute residual norm
+    absolute_tolerance = tolerance * onenormest(operator)
+    eigenvalues, vectors = lobpcg(operator, start, M=preconditioner, largest=False,
+                                  tol=absolute_tolerance, maxiter=max_iterations or 500)
+    order = np.argsort(eigenvalues)[:k]
+    eigenvalues, vectors = eigenvalues[order], vectors[:, order]
+    if _residual_norms(operator, eigenvalues, vectors).max() <= absolute_tolerance:
+        return eigenvalues
+    if preconditioner is None:
+        raise np.linalg.LinAlgError(
+            f"LOBPCG did not reach residual {absolute_tolerance:.3g}; "
+            f"pass the local bands to precondition it"
+        )
+
+    def shifted_solve(block):
+        solution, _ = minres(operator, block, shift=shift, M=preconditioner,
+                             rtol=tolerance, maxiter=max_iterations)
+        return solution
+
+    inverse = LinearOperator((n, n), matvec=shifted_solve, dtype=float)
+    eigenvalues, vectors = eigsh(operator, k, sigma=shift, which='LM', OPinv=inverse,
+                                 tol=tolerance)
+    if _residual_norms(operator, eigenvalues, vectors).max() > absolute_tolerance:
+        raise np.linalg.LinAlgError(
+            f"Neither LOBPCG nor shift-invert Lanczos reached residual {absolute_tolerance:.3g}"
+        )
+    return np.sort(eigenvalues)
+
+def _residual_norms(operator, eigenvalues, vectors):
+    """Residual norms ||Hx - λx|| of each eigenpair column"""
+    return np.linalg.norm(operator @ vectors - vectors * eigenvalues, axis=0)
+
+def nearest_eigenvalues(diagonal, off_diagonal, sigma, num_eigenvalues=10):
+    """
+    Compute the eigenvalues of a symmetric tridiagonal operator closest to sigma.
+
+    Uses shift-invert Lanczos: ARPACK iterates with (H - σI)^(-1), whose
+    dominant eigenvalues are the eigenvalues of H nearest σ. The sparse LU
+    factorization of the shifted tridiagonal matrix costs O(N), so none of
+    the spectrum below the target window is ever diagonalized.
+
+    Args:
+        diagonal (numpy.ndarray): Main diagonal, length N
+        off_diagonal (numpy.ndarray): Sub/super diagonal, length N-1
+        sigma (float): Target energy (e.g. t_n² for a Riemann zero height t_n)
+        num_eigenvalues (int): Number of eigenvalues to return
+
+    Returns:
+        numpy.ndarray: The eigenvalues nearest sigma, sorted ascending
+    """
+    diagonal = np.asarray(diagonal, dtype=float)
+    off_diagonal = np.asarray(off_diagonal, dtype=float)
+    n = len(diagonal)
+    k = min(num_eigenvalues, n)
+
+    if k >= n - 1:
+        # ARPACK needs k < N - 1; tiny operators are cheaper to solve directly
+        eigenvalues = linalg.eigvalsh_tridiagonal(diagonal, off_diagonal)
+        nearest = np.argsort(np.abs(eigenvalues - sigma))[:k]
+        return np.sort(eigenvalues[nearest])
+
+    H = tridiagonal_matrix(diagonal, off_diagonal)
+    eigenvalues = eigsh(H, k=k, sigma=sigma, which='LM', return_eigenvectors=False)
+    return np.sort(eigenvalues)
+
+def precision_dtype(precision):
+    """
+    Floating-point type of a working precision.
+
+    Args:
+        precision (str): 'double' (float64) or 'single' (float32 preview)
+
+    Returns:
+        numpy.dtype: The corresponding dtype
+    """
+    if precision not in PRECISION_DTYPES:
+        raise ValueError(f"Unknown precision '{precision}'; "
+                         f"expected one of {list(PRECISION_DTYPES)}")
+    return np.dtype(PRECISION_DTYPES[precision])
+
+def _nearest_in_bracket(diagonal, off_diagonal, guess, width):
+    """Eigenvalue nearest guess, by bisection in [guess - width, guess + width] (doubled until non-empty)."""
+    while True:
+        found = linalg.eigvalsh_tridiagonal(
+            diagonal, off_diagonal, select='v',
+            select_range=(guess - width, guess + width)
+        )
+        if len(found):
+            return found[np.argmin(np.abs(found - guess))]
+        width *= 2
+
+def _eigenvalues_by_index(diagonal, off_diagonal, indices):
+    """Eigenvalues at the given positions of the ascending spectrum, by bisection."""
+    return np.array([
+        linalg.eigvalsh_tridiagonal(diagonal, off_diagonal, select='i', select_range=(k, k))[0]
+        for k in indices
+    ])
+
+def continue_eigenvalues(band_path, targets, min_width=1e-8, growth=4.0):
+    """
+    Track selected eigenvalues along a smooth path of tridiagonal operators.
+
+    The eigenvalues nearest the targets are found on the first operator by
+    shift-invert, and their indices in the spectrum by a Sturm count. The
+    eigenvalues of an irreducible tridiagonal operator are simple, so they
+    keep their order along a continuous path: on the second operator each
+    value is resolved by index, which also gives the first step. On every
+    later operator each tracked value is predicted by linear extrapolation
+    and bracketed by [prediction - δ, prediction + δ], where δ is growth
+    times the last step (at least min_width relative); LAPACK bisection
+    (stebz) then resolves only that bracket, costing O(N · log(δ / tol)) per
+    eigenvalue instead of a full re-solve. Empty brackets are doubled until
+    they capture an eigenvalue, and the value nearest the prediction is kept.
+
+    A bracket may hold neighbouring eigenvalues too (the last step can
+    exceed the level spacing), so only a value that lost its index is
+    wrong: the step was too large for the path, the value is re-resolved
+    by index, and the point is flagged.
+
+    Args:
+        band_path (iterable): Sequence of (diagonal, off_diagonal) pairs
+        targets (array-like): Energies near which the tracked eigenvalues start
+        min_width (float): Minimum half-width of a bracket, relative to |λ|
+        growth (float): Bracket half-width as a multiple of the last step
+
+    Returns:
+        tuple: (tracked eigenvalues, ambiguous flags), both of shape
+        (len(band_path), len(targets))
+    """
+    targets = np.atleast_1d(np.asarray(targets, dtype=float))
+    history = []
+    flags = []
+    for diagonal, off_diagonal in band_path:
+        if not history:
+            current = np.array([
+                nearest_eigenvalues(diagonal, off_diagonal, target, 1)[0]
+                for target in targets
+            ])
+            # Count below a point just under each value: its index in the spectrum
+            margin = min_width * np.maximum(np.abs(current), 1.0)
+            indices = sturm_count(diagonal, off_diagonal, current - margin)
+            history.append(current)
+            flags.append(np.zeros(len(targets), dtype=bool))
+            continue
+
+        if len(history) == 1:
+            current = _eigenvalues_by_index(diagonal, off_diagonal, indices)
+            history.append(current)
+            flags.append(np.zeros(len(targets), dtype=bool))
+            continue
+
+        previous = history[-1]
+        step = previous - history[-2]
+        prediction = previous + step
+        widths = np.maximum(growth * np.abs(step), min_width * np.maximum(np.abs(prediction), 1.0))
+        current = np.array([
+            _nearest_in_bracket(diagonal, off_diagonal, guess, width)
+            for guess, width in zip(prediction, widths)
+        ])
+        margin = min_width * np.maximum(np.abs(current), 1.0)
+        jumped = sturm_count(diagonal, off_diagonal, current - margin) != indices
+        if np.any(jumped):
+            current[jumped] = _eigenvalues_by_index(diagonal, off_diagonal, indices[jumped])
+        history.append(current)
+        flags.append(jumped)
+    return np.array(history), np.array(flags)
+
+def sampled_precision_error(diagonal, off_diagonal, eigenvalues, num_samples=3):
+    """
+    Estimate the error of reduced-precision eigenvalues from a float64 sample.
+
+    A few of the computed eigenvalues, spread evenly over the set, are
+    re-resolved in double precision by bisection in a narrow bracket around
+    each value (O(N) per sample), giving a cheap error estimate for a
+    float32 preview solve.
+
+    Args:
+        diagonal (numpy.ndarray): Main diagonal, length N (used in float64)
+        off_diagonal (numpy.ndarray): Sub/super diagonal, length N-1
+        eigenvalues (array-like): Eigenvalues computed in reduced precision
+        num_samples (int): Number of eigenvalues to check
+
+    Returns:
+        dict: Sampled indices, float64 reference values, absolute and relative
+        errors, and the maximum relative error
+    """
+    diagonal = np.asarray(diagonal, dtype=np.float64)
+    off_diagonal = np.asarray(off_diagonal, dtype=np.float64)
+    eigenvalues = np.asarray(eigenvalues, dtype=np.float64)
+    if len(eigenvalues) == 0:
+        raise ValueError("No eigenvalues to check")
+
+    indices = np.unique(np.round(
+        np.linspace(0, len(eigenvalues) - 1, min(num_samples, len(eigenvalues)))
+    ).astype(int))
+    # Bracket a few float32 roundoffs of the operator norm (Gerschgorin bound)
+    scale = np.max(np.abs(diagonal)) + 2 * np.max(np.abs(off_diagonal), initial=0.0)
+    width = 64 * np.finfo(np.float32).eps * max(scale, 1.0)
+    reference = np.array([
+        _nearest_in_bracket(diagonal, off_diagonal, eigenvalues[i], width) for i in indices
+    ])
+
+    absolute_errors = np.abs(eigenvalues[indices] - reference)
+    relative_errors = absolute_errors / np.maximum(np.abs(reference), np.finfo(float).tiny)
+    return {
+        'sample_indices': indices,
+        'reference': reference,
+        'absolute_errors': absolute_errors,
+        'relative_errors': relative_errors,
+        'max_relative_error': float(relative_errors.max())
+    }
+
+def sturm_count(diagonal, off_diagonal, energies):
+    """
+    Count the eigenvalues below each energy E without diagonalizing.
+
+    By Sylvester's law of inertia the number of eigenvalues of H below E
+    equals the number of negative pivots in the LDLᵀ factorization of
+    H - EI, which for a tridiagonal H is the Sturm recurrence
+        q_0 = d_0 - E,   q_i = (d_i - E) - e_(i-1)² / q_(i-1).
+    The recurrence runs once over the bands for all energies together:
+    O(N) per query, vectorized over queries, and no matrix is formed.
+
+    Args:
+        diagonal (numpy.ndarray): Main diagonal, length N
+        off_diagonal (numpy.ndarray): Sub/super diagonal, length N-1
+        energies (array-like): Energies E to count below
+
+    Returns:
+        numpy.ndarray: N(E) for each energy (same shape as energies)
+    """
+    energies = np.asarray(energies, dtype=float)
+    E = energies.ravel()
+    diagonal = np.asarray(diagonal, dtype=float)
+    off_squared = np.asarray(off_diagonal, dtype=float)**2
+    # Replacement for an exactly zero pivot (standard LAPACK stebz safeguard)
+    pivmin = np.finfo(float).tiny * max(1.0, float(off_squared.max(initial=0.0)))
+
+    count = np.zeros(len(E), dtype=np.int64)
+    q = diagonal[0] - E
+    for i in range(len(diagonal)):
+        if i > 0:
+            q = (diagonal[i] - E) - off_squared[i - 1] / q
+        q[np.abs(q) < pivmin] = -pivmin
+        count += q < 0
+    return count.reshape(energies.shape)
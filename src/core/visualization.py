@@ -0,0 +1,99 @@
+"""
+LambdaCore-RiemannHypothesis: Visualization Module
+
+Plotting for the Λ-Core objects. This is the only core module that
+imports matplotlib, and it is not imported by the package itself:
+computational workers that never plot do not pay matplotlib's import
+and backend-probing cost. The visualize_* methods of PrimePartitioner
+and PrimePotential import it on first use.
+
+Author: Sethu Iyer (https://sethuiyer.github.io/)
+Date: December 2024
+Version: 1.1
+"""
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.lines import Line2D
+
+def visualize_partition(partitioner, save_path=None):
+    """
+    Create visualization of the prime partitioning.
+
+    Args:
+        partitioner (PrimePartitioner): Prime partition object
+        save_path (str): Optional path to save the plot
+    """
+    stats = partitioner.get_partition_statistics()
+
+    # Create cumulative count plots
+    euclidean_cumulative = np.arange(1, len(partitioner.euclidean_primes) + 1)
+    hyperbolic_cumulative = np.arange(1, len(partitioner.hyperbolic_primes) + 1)
+
+    plt.figure(figsize=(12, 8))
+    plt.plot(partitioner.euclidean_primes, euclidean_cumulative, 'b-',
+             linewidth=2, label=f'4n+1 Primes (Euclidean): {stats["euclidean_count"]}')
+    plt.plot(partitioner.hyperbolic_primes, hyperbolic_cumulative, 'r-',
+             linewidth=2, label=f'4n+3 Primes (Hyperbolic): {stats["hyperbolic_count"]}')
+
+    plt.xlabel('Prime Value')
+    plt.ylabel('Cumulative Count')
+    plt.title(f'Prime Class Partitioning: Λ-Core Duality Framework\n'
+              f'Balance Ratio (4n+3)/(4n+1) = {stats["balance_ratio"]:.4f}')
+    plt.legend()
+    plt.grid(True, alpha=0.3)
+
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.show()
+
+def visualize_potential(potential, y_min=0, y_max=6, n_grid=1000, save_path=None):
+    """
+    Visualize the prime potential landscape.
+
+    Args:
+        potential (PrimePotential): The prime potential object
+        y_min (float): Minimum y value
+        y_max (float): Maximum y value
+        n_grid (int): Grid resolution
+        save_path (str): Optional save path
+    """
+    partitioner = potential.partitioner
+
+    # Separate visualization by prime class for clarity
+    plt.figure(figsize=(15, 7))
+
+    # Plot individual prime contributions
+    classes = ((partitioner.euclidean_primes, 1, 'b', 0.7),
+               (partitioner.hyperbolic_primes, -1, 'r', 0.7),
+               (partitioner.anchor_primes, 1, 'g', 0.9))
+    for primes, sign, color, alpha in classes:
+        for p in primes:
+            log_p = np.log(p)
+            if y_min < log_p < y_max:
+                weight = p**(-0.5) * potential.coupling_constant
+                markers, stems, _ = plt.stem([log_p], [sign * weight], linefmt=f'{color}-',
+                                             markerfmt=f'{color}o', basefmt=' ')
+                plt.setp([markers, stems], alpha=alpha)
+
+    # Add legend and formatting
+    plt.axhline(y=0, color='black', linestyle='-', alpha=0.3)
+    plt.xlabel('y = log(x)')
+    plt.ylabel('Potential Strength V(y)')
+    plt.title('The Prime Potential Landscape: Λ-Core Duality Framework')
+
+    # Custom legend
+    legend_elements = [
+        Line2D([0], [0], marker='o', color='blue', linestyle='-',
+               label='Euclidean Forces (4n+1 primes)'),
+        Line2D([0], [0], marker='o', color='red', linestyle='-',
+               label='Hyperbolic Forces (4n+3 primes)'),
+        Line2D([0], [0], marker='o', color='green', linestyle='-',
+               label='Anchor Forces (p=2)')
+    ]
+    plt.legend(handles=legend_elements, loc='upper right')
+    plt.grid(True, alpha=0.3)
+
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.show()
@@ -2,7 +2,8 @@
 LambdaCore-RiemannHypothesis: Zeta Functions Module
 
 Core implementations of zeta function computations, Euler products,
-and Dirichlet series for the spectral framework.
+Dirichlet series and Euler–Maclaurin evaluation in the critical strip
+for the spectral framework.
 
 Author: Sethu Iyer (https://sethuiyer.github.io/)
 Date: December 2024
@@ -10,132 +11,341 @@ Version: 1.1
 """
 
 import numpy as np
+from functools import lru_cache
+from math import isqrt
 from scipy.special import zeta as scipy_zeta
+from scipy.special import bernoulli, factorial
 import warnings
 
 def dirichlet_series_zeta(s, max_terms=10000):
- """
- Compute ζ(s) using the Dirichlet series representation.
- 
- ζ(s) = Σ(n=1 to ∞) 1/n^s
- 
- Args:
- s (float): The complex argument
- max_terms (int): Maximum number of terms to include
- 
- Returns:
- complex: The computed value of ζ(s)
- """
- if np.real(s) <= 1:
- warnings.warn("Dirichlet series convergence requires Re(s) > 1")
- 
- n_values = np.arange(1, max_terms + 1)
- terms = 1.0 / (n_values ** s)
- return np.sum(terms)
-
-def euler_product_zeta(s, max_prime=1000):
- """
- Compute ζ(s) using the Euler product representation.
- 
- ζ(s) = Π(p prime) 1/(1 - p^(-s))
- 
- Args:
- s (float): The complex argument
- max_prime (int): Maximum prime to include in product
- 
- Returns:
- complex: The computed value of ζ(s)
- """
- if np.real(s) <= 1:
- warnings.warn("Euler product convergence requires Re(s) > 1")
- 
- primes = sieve_of_eratosthenes(max_prime)
- product = 1.0
- 
- for p in primes:
- factor = 1.0 / (1.0 - p**(-s))
- product *= factor
- 
- return product
+    """
+    Compute ζ(s) using the Dirichlet series representation.
+
+    ζ(s) = Σ(n=1 to ∞) 1/n^s
+
+    Args:
+        s (float): The complex argument
+        max_terms (int): Maximum number of terms to include
+
+    Returns:
+        complex: The computed value of ζ(s)
+    """
+    if np.real(s) <= 1:
+        warnings.warn("Dirichlet series convergence requires Re(s) > 1; "
+                      "use critical_strip_zeta inside the critical strip")
+
+    n_values = np.arange(1, max_terms + 1)
+    terms = 1.0 / (n_values ** s)
+    return np.sum(terms)
+
+def euler_product_zeta(s, max_prime=1000, primes=None):
+    """
+    Compute ζ(s) using the Euler product representation.
+
+    ζ(s) = Π(p prime) 1/(1 - p^(-s))
+
+    Args:
+        s (float): The complex argument
+        max_prime (int): Maximum prime to include in product
+        primes (iterable): Optional stream of prime blocks, e.g. prime_blocks(10**11);
+            consumed block by block so memory stays constant
+
+    Returns:
+        complex: The computed value of ζ(s)
+    """
+    if np.real(s) <= 1:
+        warnings.warn("Euler product convergence requires Re(s) > 1")
+
+    if primes is not None:
+        # Accumulate log ζ(s) so the running product stays well scaled
+        log_product = 0.0
+        for block in primes:
+            log_product -= np.sum(np.log1p(-np.asarray(block, dtype=float)**(-s)))
+        return np.exp(log_product)
+
+    primes = sieve_of_eratosthenes(max_prime)
+    product = 1.0
+
+    for p in primes:
+        factor = 1.0 / (1.0 - p**(-s))
+        product *= factor
+
+    return product
 
 def sieve_of_eratosthenes(limit):
- """
- Generate primes up to limit using the Sieve of Eratosthenes.
- 
- Args:
- limit (int): Upper bound for prime generation
- 
- Returns:
- list: List of prime numbers up to limit
- """
- if limit < 2:
- return []
- 
- is_prime = [True] * (limit + 1)
- is_prime[0] = is_prime[1] = False
- 
- for p in range(2, int(np.sqrt(limit)) + 1):
- if is_prime[p]:
- for i in range(p * p, limit + 1, p):
- is_prime[i] = False
- 
- return [p for p in range(2, limit + 1) if is_prime[p]]
+    """
+    Generate primes up to limit using the Sieve of Eratosthenes.
+
+    Args:
+        limit (int): Upper bound for prime generation
+
+    Returns:
+        list: List of prime numbers up to limit
+    """
+    if limit < 2:
+        return []
+
+    is_prime = [True] * (limit + 1)
+    is_prime[0] = is_prime[1] = False
+
+    for p in range(2, int(np.sqrt(limit)) + 1):
+        if is_prime[p]:
+            for i in range(p * p, limit + 1, p):
+                is_prime[i] = False
+
+    return [p for p in range(2, limit + 1) if is_prime[p]]
+
+def prime_blocks(limit, block_size=2**22):
+    """
+    Lazily generate the primes up to limit as ascending NumPy blocks.
+
+    Segmented Sieve of Eratosthenes over the odd numbers: each segment of
+    block_size odd numbers is sieved by the base primes up to sqrt(limit),
+    so memory is O(sqrt(limit) + block_size) however large limit is.
+
+    Args:
+        limit (int): Upper bound for prime generation
+        block_size (int): Odd numbers sieved per segment
+
+    Yields:
+        numpy.ndarray: The next block of primes (int64), in increasing order
+    """
+    if limit < 2:
+        return
+    yield np.array([2], dtype=np.int64)
+
+    base = np.array(sieve_of_eratosthenes(isqrt(limit)), dtype=np.int64)[1:]
+    for lo in range(3, limit + 1, 2 * block_size):
+        hi = min(lo + 2 * block_size, limit + 1)
+        is_prime = np.ones((hi - lo + 1) // 2, dtype=bool)
+        for p in base:
+            p = int(p)
+            if p * p >= hi:
+                break
+            # First odd multiple of p inside the segment, at least p²
+            start = max(p * p, -(-lo // p) * p)
+            if start % 2 == 0:
+                start += p
+            is_prime[(start - lo) // 2::p] = False
+        yield lo + 2 * np.flatnonzero(is_prime)
+
+@lru_cache(maxsize=8)
+def integer_log_table(max_terms):
+    """
+    Cached table of log(n) for n = 1, ..., max_terms.
+
+    Shared by the batched Dirichlet-series evaluators so that repeated
+    sweeps reuse one read-only array instead of rebuilding it.
+
+    Args:
+        max_terms (int): Number of terms
+
+    Returns:
+        numpy.ndarray: Read-only array of log(n)
+    """
+    table = np.log(np.arange(1, max_terms + 1, dtype=float))
+    table.flags.writeable = False
+    return table
+
+@lru_cache(maxsize=8)
+def prime_table(max_prime):
+    """
+    Cached table of the primes up to max_prime and their logarithms.
+
+    Args:
+        max_prime (int): Maximum prime to include
+
+    Returns:
+        tuple: Read-only arrays (primes, log_primes)
+    """
+    primes = np.array(sieve_of_eratosthenes(max_prime), dtype=np.int64)
+    log_primes = np.log(primes.astype(float))
+    primes.flags.writeable = False
+    log_primes.flags.writeable = False
+    return primes, log_primes
+
+def critical_strip_zeta(t, sigma=0.5, tolerance=1e-10, num_corrections=20, max_block=2**22):
+    """
+    Evaluate ζ(σ + it) for an array of heights t by Euler–Maclaurin summation.
+
+    ζ(s) = Σ(n<N) n^(-s) + N^(1-s)/(s-1) + N^(-s)/2
+    + Σ(k=1 to M) B_2k/(2k)! · s(s+1)···(s+2k-2) · N^(-s-2k+1) + R_M
+
+    Unlike the Dirichlet series this is valid everywhere except s = 1, in
+    particular on the critical line. Successive corrections shrink roughly
+    like ((|s| + 2k) / (2πN))², so N is chosen per point to push the M-th
+    correction below the tolerance; the cost is O(|t|) terms per point.
+    Points are grouped by N and each group is summed as one NumPy block.
+
+    Args:
+        t (array-like): Heights on the line Re(s) = sigma
+        sigma (float): Real part σ (0.5 for the critical line)
+        tolerance (float): Target absolute accuracy
+        num_corrections (int): Number M of Bernoulli correction terms
+        max_block (int): Maximum entries in one (points × terms) block
+
+    Returns:
+        numpy.ndarray: Complex ζ(σ + it), same shape as t
+    """
+    t = np.asarray(t, dtype=float)
+    s = (sigma + 1j * t).ravel()
+    M = num_corrections
+
+    ratio = tolerance ** (1.0 / (2 * M))
+    n_terms = np.maximum(
+        np.ceil((np.abs(s) + 2 * M) / (2 * np.pi * ratio)).astype(np.int64), 2
+    )
+    coefficients = bernoulli(2 * M)[2::2] / factorial(np.arange(2, 2 * M + 1, 2))
+
+    order = np.argsort(n_terms, kind='stable')
+    result = np.empty(len(s), dtype=complex)
+    start = 0
+    while start < len(s):
+        # Grow the block while (points × largest N) stays within max_block
+        stop = start + 1
+        while stop < len(s) and (stop + 1 - start) * n_terms[order[stop]] <= max_block:
+            stop += 1
+        idx = order[start:stop]
+        N = int(n_terms[idx[-1]])
+        s_block = s[idx]
+
+        log_n = np.log(np.arange(1, N, dtype=float))
+        head = np.exp(-np.outer(s_block, log_n)).sum(axis=1)
+        N_minus_s = np.exp(-s_block * np.log(N))
+        tail = N * N_minus_s / (s_block - 1) + 0.5 * N_minus_s
+
+        rising = s_block.copy()
+        power = N_minus_s / N
+        for k in range(1, M + 1):
+            tail += coefficients[k - 1] * rising * power
+            rising = rising * (s_block + 2 * k - 1) * (s_block + 2 * k)
+            power = power / N**2
+
+        result[idx] = head + tail
+        start = stop
+    return result.reshape(t.shape)
 
 def validate_zeta_identity(s=2.0, max_terms=10000, max_prime=1000, tolerance=1e-6):
- """
- Validate the fundamental identity: Dirichlet series = Euler product.
- 
- Args:
- s (float): Test value for ζ(s)
- max_terms (int): Terms for Dirichlet series
- max_prime (int): Primes for Euler product
- tolerance (float): Acceptable error threshold
- 
- Returns:
- dict: Validation results including both values and error
- """
- dirichlet_val = dirichlet_series_zeta(s, max_terms)
- euler_val = euler_product_zeta(s, max_prime)
- exact_val = scipy_zeta(s)
- 
- dirichlet_error = abs(dirichlet_val - exact_val) / abs(exact_val)
- euler_error = abs(euler_val - exact_val) / abs(exact_val)
- identity_error = abs(dirichlet_val - euler_val) / abs(exact_val)
- 
- return {
- 'dirichlet_value': dirichlet_val,
- 'euler_value': euler_val,
- 'exact_value': exact_val,
- 'dirichlet_error': dirichlet_error,
- 'euler_error': euler_error,
- 'identity_error': identity_error,
- 'validation_passed': identity_error < tolerance
- }
+    """
+    Validate the fundamental identity: Dirichlet series = Euler product.
+
+    Args:
+        s (float): Test value for ζ(s)
+        max_terms (int): Terms for Dirichlet series
+        max_prime (int): Primes for Euler product
+        tolerance (float): Acceptable error threshold
+
+    Returns:
+        dict: Validation results including both values and error
+        (arrays when s is a grid; see validate_zeta_identity_grid)
+    """
+    if np.ndim(s) > 0:
+        return validate_zeta_identity_grid(s, max_terms, max_prime, tolerance)
+
+    dirichlet_val = dirichlet_series_zeta(s, max_terms)
+    euler_val = euler_product_zeta(s, max_prime)
+    exact_val = scipy_zeta(s)
+
+    dirichlet_error = abs(dirichlet_val - exact_val) / abs(exact_val)
+    euler_error = abs(euler_val - exact_val) / abs(exact_val)
+    identity_error = abs(dirichlet_val - euler_val) / abs(exact_val)
+
+    return {
+        'dirichlet_value': dirichlet_val,
+        'euler_value': euler_val,
+        'exact_value': exact_val,
+        'dirichlet_error': dirichlet_error,
+        'euler_error': euler_error,
+        'identity_error': identity_error,
+        'validation_passed': identity_error < tolerance
+    }
+
+def validate_zeta_identity_grid(s_values, max_terms=10000, max_prime=1000, tolerance=1e-6,
+                                chunk_size=None):
+    """
+    Validate Dirichlet series = Euler product over a whole grid of s values.
+
+    The log(n) and prime tables are built once (and cached across calls),
+    n^(-s) and p^(-s) are formed as chunked NumPy blocks for all s at once,
+    and reference values come from scipy_zeta for real s and from
+    critical_strip_zeta for complex s.
+
+    Args:
+        s_values (array-like): Grid of test values for ζ(s)
+        max_terms (int): Terms for Dirichlet series
+        max_prime (int): Primes for Euler product
+        tolerance (float): Acceptable error threshold
+        chunk_size (int): Terms per block; defaults to about 2^20 entries per block
+
+    Returns:
+        dict: Arrays of values and errors with the same keys as
+        validate_zeta_identity, plus 's_values'
+    """
+    s_values = np.asarray(s_values)
+    real_axis = np.imag(s_values.ravel()) == 0
+    # Stay in real arithmetic (about 3x cheaper) when the grid is on the real axis
+    dtype = float if np.all(real_axis) else complex
+    s = (np.real(s_values) if dtype is float else s_values).ravel().astype(dtype)
+    if np.any(np.real(s) <= 1):
+        warnings.warn("Dirichlet series convergence requires Re(s) > 1")
+    if chunk_size is None:
+        chunk_size = max(1, 2**20 // max(1, len(s)))
+
+    log_n = integer_log_table(max_terms)
+    dirichlet_val = np.zeros(len(s), dtype=dtype)
+    for start in range(0, max_terms, chunk_size):
+        dirichlet_val += np.exp(-np.outer(s, log_n[start:start + chunk_size])).sum(axis=1)
+
+    primes, log_primes = prime_table(max_prime)
+    log_euler = np.zeros(len(s), dtype=dtype)
+    for start in range(0, len(primes), chunk_size):
+        powers = np.exp(-np.outer(s, log_primes[start:start + chunk_size]))
+        log_euler -= np.log1p(-powers).sum(axis=1)
+    euler_val = np.exp(log_euler)
+
+    exact_val = np.empty(len(s), dtype=dtype)
+    exact_val[real_axis] = scipy_zeta(np.real(s[real_axis]))
+    if not np.all(real_axis):
+        exact_val[~real_axis] = critical_strip_zeta(np.imag(s[~real_axis]),
+                                                    sigma=np.real(s[~real_axis]))
+
+    identity_error = np.abs(dirichlet_val - euler_val) / np.abs(exact_val)
+    shape = s_values.shape
+    return {
+        's_values': s_values,
+        'dirichlet_value': dirichlet_val.reshape(shape),
+        'euler_value': euler_val.reshape(shape),
+        'exact_value': exact_val.reshape(shape),
+        'dirichlet_error': (np.abs(dirichlet_val - exact_val) / np.abs(exact_val)).reshape(shape),
+        'euler_error': (np.abs(euler_val - exact_val) / np.abs(exact_val)).reshape(shape),
+        'identity_error': identity_error.reshape(shape),
+        'validation_passed': (identity_error < tolerance).reshape(shape)
+    }
 
 def known_riemann_zeros():
- """
- Return the first 15 known nontrivial zeros of the Riemann zeta function.
- 
- Returns:
- list: Heights of the first 15 zeros on the critical line
- """
- return [
- 14.134725141734693790, 21.022039638771554993, 25.010857580145688763,
- 30.424876125859513210, 32.935061587739189690, 37.586178158825671257,
- 40.918719012147495187, 43.327073280914999519, 48.005150881167159727,
- 49.773832477672302181, 52.910381279279131003, 56.446247697063446123,
- 59.347044003392468915, 60.831778524671805049, 65.112544048081651204
- ]
+    """
+    Return the first 15 known nontrivial zeros of the Riemann zeta function.
+
+    Returns:
+        list: Heights of the first 15 zeros on the critical line
+    """
+    return [
+        14.134725141734693790, 21.022039638771554993, 25.010857580145688763,
+        30.424876125859513210, 32.935061587739189690, 37.586178158825671257,
+        40.918719012147495187, 43.327073280914999519, 48.005150881167159727,
+        49.773832477672302181, 52.910381279279131003, 56.446247697063446123,
+        59.347044003392468915, 60.831778524671805049, 65.112544048081651204
+    ]
 
 def mean_zero_spacing(max_height=100):
- """
- Compute the mean spacing between consecutive Riemann zeros.
- Uses the asymptotic formula: spacing ≈ 2π/log(t/(2π))
- 
- Args:
- max_height (float): Height on critical line
- 
- Returns:
- float: Mean spacing at given height
- """
- return 2 * np.pi / np.log(max_height / (2 * np.pi)) 
\ No newline at end of file
+    """
+    Compute the mean spacing between consecutive Riemann zeros.
+    Uses the asymptotic formula: spacing ≈ 2π/log(t/(2π))
+
+    Args:
+        max_height (float): Height on critical line
+
+    Returns:
+        float: Mean spacing at given height
+    """
+    return 2 * np.pi / np.log(max_height / (2 * np.pi))
\ No newline at end of file
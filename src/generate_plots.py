@@ -2,12 +2,24 @@
 """
 Visualization Script for Dual Spectral Report
 Generate plots comparing both approaches and showing precision results
+
+Figures are built from the match tables written by rigorous_verification.py
+and ultra_precision.py (core.artifacts). Each figure's inputs and plotting
+code are fingerprinted (only the columns each figure declares, so e.g. a
+changed computation_time does not trigger a re-render), and only figures whose fingerprint changed since the
+last build are re-rendered; pass --force to rebuild everything.
 """
 
+import hashlib
+import inspect
+import json
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 from matplotlib.gridspec import GridSpec
+from core.artifacts import read_artifact
 
 # Set up publication-quality plotting
 plt.style.use('default')
@@ -23,19 +35,55 @@ plt.rcParams.update({
  'text.usetex': False, # Set to True if you have LaTeX installed
 })
 
-def plot_precision_comparison():
- """Compare precision between different grid resolutions"""
- 
- # Data from our experiments
- zeros = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
- tau_values = np.array([14.1347, 21.0220, 25.0109, 30.4249, 32.9351, 
- 37.5862, 40.9187, 43.3271, 48.0052, 49.7738])
+# Result artifacts read by the figures (written by the verification scripts)
+ARTIFACTS = {
+ 'convergence': 'rigorous_verification_matches',
+ 'ultra': 'ultra_precision_matches',
+}
+OUTPUT_DIR = '../docs'
+FINGERPRINT_FILE = os.path.join(OUTPUT_DIR, '.plot_fingerprints.json')
+
+def load_artifacts():
+ """Open every result artifact that exists (the newer of Arrow and .npz); missing ones map to None"""
+ tables = {}
+ for key, base in ARTIFACTS.items():
+ paths = [base + extension for extension in ('.arrow', '.npz') if os.path.exists(base + extension)]
+ tables[key] = read_artifact(max(paths, key=os.path.getmtime)) if paths else None
+ return tables
+
+def rows_for_N(table, N):
+ """Rows of a match table computed at grid resolution N"""
+ mask = table['N'] == N
+ return {name: column[mask] for name, column in table.items()}
+
+def select_columns(table, columns):
+ """The declared columns of a table; reading any other column raises KeyError"""
+ return {name: table[name] for name in columns}
+
+def figure_fingerprint(function, tables):
+ """Hash of a figure's plotting code and its declared input columns"""
+ digest = hashlib.sha256(inspect.getsource(function).encode())
+ for table in tables:
+ for name in sorted(table):
+ column = np.ascontiguousarray(table[name])
+ digest.update(f"{name}:{column.dtype.str}:{column.shape}".encode())
+ digest.update(column.tobytes())
+ return digest.hexdigest()
+
+def plot_precision_comparison(convergence, ultra, save_path=None):
+ """Compare precision between a basic grid resolution and the ultra-precision run"""
  
- # N=1000 results (approximate from sam.py output)
- n1000_errors = np.array([0.535, 0.504, 0.578, 0.494, 0.427, 0.520, 0.480, 0.510, 0.490, 0.470])
+ # Basic resolution: N=1000 from the convergence sweep (coarsest N if absent)
+ basic_N = 1000 if np.any(convergence['N'] == 1000) else int(convergence['N'].min())
+ basic = rows_for_N(convergence, basic_N)
+ ultra_N = int(ultra['N'][0])
  
- # N=16000 ultra-precision results
- n16000_errors = np.array([0.037, 0.204, 0.186, 0.089, 0.147, 0.056, 0.040, 0.070, 0.124, 0.113])
+ # Pair the runs by zero index, not row position: either may have missed zeros
+ zeros, basic_rows, ultra_rows = np.intersect1d(basic['zero_index'], ultra['zero_index'],
+ return_indices=True)
+ tau_values = ultra['tau'][ultra_rows]
+ basic_errors = 100 * basic['relative_error'][basic_rows]
+ ultra_errors = 100 * ultra['relative_error'][ultra_rows]
  
  fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
  
@@ -43,9 +91,9 @@ def plot_precision_comparison():
  width = 0.35
  x = np.arange(len(zeros))
  
- bars1 = ax1.bar(x - width/2, n1000_errors, width, label='N=1,000 (Way 2 Basic)', 
+ bars1 = ax1.bar(x - width/2, basic_errors, width, label=f'N={basic_N:,} (Way 2 Basic)', 
  color='lightblue', alpha=0.7, edgecolor='blue')
- bars2 = ax1.bar(x + width/2, n16000_errors, width, label='N=16,000 (Way 2 Ultra)', 
+ bars2 = ax1.bar(x + width/2, ultra_errors, width, label=f'N={ultra_N:,} (Way 2 Ultra)', 
  color='lightcoral', alpha=0.7, edgecolor='red')
  
  ax1.set_xlabel('Riemann Zero Number')
@@ -58,7 +106,7 @@ def plot_precision_comparison():
  ax1.set_yscale('log')
  
  # Add text annotations for exceptional results
- for i, v in enumerate(n16000_errors):
+ for i, v in enumerate(ultra_errors):
  if v < 0.1: # Exceptional precision
  ax1.annotate(f'{v:.3f}%', (x[i] + width/2, v), 
  textcoords="offset points", xytext=(0,10), ha='center',
@@ -68,10 +116,10 @@ def plot_precision_comparison():
  tau_range = np.linspace(10, 55, 100)
  theoretical_trend = 0.5 * (tau_range / 14.1347) # Hypothetical scaling
  
- ax2.scatter(tau_values, n1000_errors, s=60, color='blue', alpha=0.7, 
- label='N=1,000', marker='o')
- ax2.scatter(tau_values, n16000_errors, s=60, color='red', alpha=0.7, 
- label='N=16,000', marker='s')
+ ax2.scatter(tau_values, basic_errors, s=60, color='blue', alpha=0.7, 
+ label=f'N={basic_N:,}', marker='o')
+ ax2.scatter(tau_values, ultra_errors, s=60, color='red', alpha=0.7, 
+ label=f'N={ultra_N:,}', marker='s')
  
  ax2.set_xlabel('τ (Imaginary Part of Zero)')
  ax2.set_ylabel('Relative Error (%)')
@@ -81,12 +129,15 @@ def plot_precision_comparison():
  ax2.set_yscale('log')
  
  plt.tight_layout()
- plt.savefig('../docs/precision_comparison.png', dpi=300, bbox_inches='tight')
- plt.show()
+ plt.savefig(save_path or os.path.join(OUTPUT_DIR, 'precision_comparison.png'), dpi=300, bbox_inches='tight')
+ plt.close(fig)
 
-def plot_dual_framework_overview():
+def plot_dual_framework_overview(ultra, save_path=None):
  """Create a visual overview of both approaches"""
  
+ # Best ultra-precision relative error (%) from the stored results
+ best_error = 100 * float(np.min(ultra['relative_error']))
+ 
  fig = plt.figure(figsize=(16, 10))
  gs = GridSpec(3, 4, figure=fig, height_ratios=[1, 2, 1])
  
@@ -157,7 +208,7 @@ def plot_dual_framework_overview():
  ax3 = fig.add_subplot(gs[2, :])
  
  approaches = ['Way 1\n(Quantum)', 'Way 2\n(Geometric)']
- precisions = [13, 99.963] # 87% error = 13% precision, 0.037% error = 99.963% precision
+ precisions = [13, 100 - best_error] # 87% error = 13% precision; Way 2 from its best match
  colors = ['lightblue', 'lightcoral']
  
  bars = ax3.bar(approaches, precisions, color=colors, alpha=0.7, edgecolor='black')
@@ -172,7 +223,7 @@ def plot_dual_framework_overview():
  f'{precision:.1f}%', ha='center', va='bottom', fontweight='bold')
  
  # Add error labels
- errors = ['~87-90% error', '0.037% error']
+ errors = ['~87-90% error', f'{best_error:.3f}% error']
  for i, (bar, error) in enumerate(zip(bars, errors)):
  ax3.text(bar.get_x() + bar.get_width()/2., 50,
  error, ha='center', va='center', fontweight='bold',
@@ -181,16 +232,23 @@ def plot_dual_framework_overview():
  ax3.grid(True, alpha=0.3, axis='y')
  
  plt.tight_layout()
- plt.savefig('../docs/dual_framework_overview.png', dpi=300, bbox_inches='tight')
- plt.show()
+ plt.savefig(save_path or os.path.join(OUTPUT_DIR, 'dual_framework_overview.png'), dpi=300, bbox_inches='tight')
+ plt.close(fig)
 
-def plot_convergence_analysis():
+def plot_convergence_analysis(convergence, ultra, save_path=None):
  """Show convergence behavior with grid resolution"""
  
- # Simulated data for different N values
- N_values = np.array([500, 1000, 2000, 4000, 8000, 16000])
- mean_errors = np.array([2.1, 0.52, 0.28, 0.15, 0.09, 0.107]) # Simulated convergence
- best_errors = np.array([1.5, 0.37, 0.18, 0.08, 0.05, 0.037]) # Best case convergence
+ # Mean and best relative error (%) per resolution, sweep plus ultra-precision run
+ table = {name: np.concatenate([convergence[name], ultra[name]]) for name in ('N', 'relative_error')}
+ N_values = np.unique(table['N'])
+ mean_errors = np.array([100 * table['relative_error'][table['N'] == N].mean() for N in N_values])
+ best_errors = np.array([100 * table['relative_error'][table['N'] == N].min() for N in N_values])
+ 
+ # Ultra-precision run and its spectrum range, λ_k = 3/4 + (4/h²) sin²(kπ/2N)
+ ultra_N = int(ultra['N'][0])
+ ultra_best = 100 * float(np.min(ultra['relative_error']))
+ h = (float(ultra['T'][0]) - np.log(float(ultra['epsilon'][0]))) / ultra_N
+ spectrum_range = 0.75 + (4 / h**2) * np.sin(np.array([1, ultra_N - 1]) * np.pi / (2 * ultra_N))**2
  
  fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
  
@@ -214,17 +272,17 @@ def plot_convergence_analysis():
  ax1.grid(True, alpha=0.3)
  
  # Highlight the ultra-precision point
- ax1.scatter([16000], [0.037], s=200, color='gold', marker='*', 
+ ax1.scatter([ultra_N], [ultra_best], s=200, color='gold', marker='*', 
  edgecolor='red', linewidth=2, zorder=5, label='Ultra-Precision Result')
  
  # Eigenvalue density plot
  ax2.text(0.5, 0.8, 'Spectral Density Visualization', transform=ax2.transAxes,
  ha='center', va='center', fontsize=14, fontweight='bold')
- ax2.text(0.5, 0.6, 'N=16,000 grid points', transform=ax2.transAxes,
+ ax2.text(0.5, 0.6, f'N={ultra_N:,} grid points', transform=ax2.transAxes,
  ha='center', va='center', fontsize=12)
- ax2.text(0.5, 0.5, '15,999 computed eigenvalues', transform=ax2.transAxes,
+ ax2.text(0.5, 0.5, f'{ultra_N - 1:,} computed eigenvalues', transform=ax2.transAxes,
  ha='center', va='center', fontsize=12)
- ax2.text(0.5, 0.4, 'Range: [0.754, 443,967]', transform=ax2.transAxes,
+ ax2.text(0.5, 0.4, f'Range: [{spectrum_range[0]:.3f}, {spectrum_range[1]:,.0f}]', transform=ax2.transAxes,
  ha='center', va='center', fontsize=12)
  ax2.text(0.5, 0.2, 'Ultra-high precision achieved', transform=ax2.transAxes,
  ha='center', va='center', fontsize=12, color='red', fontweight='bold')
@@ -238,26 +296,23 @@ def plot_convergence_analysis():
  ax2.spines['left'].set_visible(False)
  
  plt.tight_layout()
- plt.savefig('../docs/convergence_analysis.png', dpi=300, bbox_inches='tight')
- plt.show()
+ plt.savefig(save_path or os.path.join(OUTPUT_DIR, 'convergence_analysis.png'), dpi=300, bbox_inches='tight')
+ plt.close(fig)
 
-def plot_spectral_correspondence():
+def plot_spectral_correspondence(ultra, save_path=None):
  """Visualize the spectral correspondence λ ≈ τ² + 1/2"""
  
- # Riemann zero data
- tau_values = np.array([14.1347, 21.0220, 25.0109, 30.4249, 32.9351, 
- 37.5862, 40.9187, 43.3271, 48.0052, 49.7738])
- predicted_lambdas = tau_values**2 + 0.5
- 
- # Ultra-precision computed values
- computed_lambdas = np.array([200.3644660, 441.5239270, 624.8766384, 925.3498055, 
- 1086.8160241, 1414.0160709, 1675.5055564, 1879.0426309, 
- 2302.1381896, 2480.7360400])
+ # Riemann zero data and ultra-precision computed values
+ tau_values = np.asarray(ultra['tau'])
+ predicted_lambdas = np.asarray(ultra['predicted_lambda'])
+ computed_lambdas = np.asarray(ultra['matched_lambda'])
+ ultra_N = int(ultra['N'][0])
+ zero_numbers = np.asarray(ultra['zero_index'])
  
  fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
  
  # Perfect correspondence line
- lambda_range = np.linspace(0, 2600, 100)
+ lambda_range = np.linspace(0, 1.05 * predicted_lambdas.max(), 100)
  ax1.plot(lambda_range, lambda_range, 'k--', alpha=0.5, linewidth=2, label='Perfect Match')
  
  # Actual correspondence
@@ -270,7 +325,7 @@ def plot_spectral_correspondence():
  fmt='none', ecolor='red', alpha=0.5, capsize=3)
  
  ax1.set_xlabel('Predicted λₖ = τₖ² + 1/2')
- ax1.set_ylabel('Computed λₖ (N=16,000)')
+ ax1.set_ylabel(f'Computed λₖ (N={ultra_N:,})')
  ax1.set_title('Spectral Correspondence Verification')
  ax1.legend()
  ax1.grid(True, alpha=0.3)
@@ -287,7 +342,7 @@ def plot_spectral_correspondence():
  # Relative error plot
  relative_errors = 100 * errors / predicted_lambdas
  
- ax2.bar(range(1, 11), relative_errors, color='lightcoral', alpha=0.7, 
+ ax2.bar(zero_numbers, relative_errors, color='lightcoral', alpha=0.7, 
  edgecolor='red', linewidth=1)
  ax2.axhline(y=0.1, color='green', linestyle='--', alpha=0.7, 
  label='Exceptional Precision (< 0.1%)')
@@ -297,41 +352,80 @@ def plot_spectral_correspondence():
  ax2.set_xlabel('Riemann Zero Number')
  ax2.set_ylabel('Relative Error (%)')
  ax2.set_title('Ultra-High Precision Error Distribution')
- ax2.set_xticks(range(1, 11))
+ ax2.set_xticks(zero_numbers)
  ax2.legend()
  ax2.grid(True, alpha=0.3, axis='y')
  
  # Highlight exceptional results
  for i, error in enumerate(relative_errors):
  if error < 0.1:
- ax2.text(i+1, error + 0.01, f'{error:.3f}%', ha='center', va='bottom',
+ ax2.text(zero_numbers[i], error + 0.01, f'{error:.3f}%', ha='center', va='bottom',
  fontweight='bold', color='red', fontsize=9)
  
  plt.tight_layout()
- plt.savefig('../docs/spectral_correspondence.png', dpi=300, bbox_inches='tight')
- plt.show()
+ plt.savefig(save_path or os.path.join(OUTPUT_DIR, 'spectral_correspondence.png'), dpi=300, bbox_inches='tight')
+ plt.close(fig)
+
+# Figure name -> (plotting function, {artifact: columns it reads}), in argument order
+FIGURES = {
+ 'precision_comparison': (plot_precision_comparison, {
+ 'convergence': ('N', 'zero_index', 'relative_error'),
+ 'ultra': ('N', 'zero_index', 'tau', 'relative_error')}),
+ 'dual_framework_overview': (plot_dual_framework_overview, {
+ 'ultra': ('relative_error',)}),
+ 'convergence_analysis': (plot_convergence_analysis, {
+ 'convergence': ('N', 'relative_error'),
+ 'ultra': ('N', 'relative_error', 'T', 'epsilon')}),
+ 'spectral_correspondence': (plot_spectral_correspondence, {
+ 'ultra': ('N', 'zero_index', 'tau', 'predicted_lambda', 'matched_lambda')}),
+}
+
+def build_plots(force=False):
+ """
+ Render the figures whose inputs changed since the last build.
+ 
+ Args:
+ force: Re-render every figure regardless of fingerprints
+ 
+ Returns:
+ List of figure names that were rendered
+ """
+ tables = load_artifacts()
+ fingerprints = {}
+ if os.path.exists(FINGERPRINT_FILE):
+ with open(FINGERPRINT_FILE) as stream:
+ fingerprints = json.load(stream)
+ 
+ rendered = []
+ for name, (function, inputs) in FIGURES.items():
+ missing = [ARTIFACTS[key] for key in inputs if tables[key] is None]
+ if missing:
+ print(f" - {name}: skipped, missing artifacts {missing}")
+ continue
+ 
+ path = os.path.join(OUTPUT_DIR, name + '.png')
+ selected = [select_columns(tables[key], columns) for key, columns in inputs.items()]
+ fingerprint = figure_fingerprint(function, selected)
+ if not force and fingerprints.get(name) == fingerprint and os.path.exists(path):
+ print(f" - {name}: up to date")
+ continue
+ 
+ print(f" - {name}: rendering {path}")
+ function(*selected, save_path=path)
+ fingerprints[name] = fingerprint
+ rendered.append(name)
+ 
+ # Record after each figure so an interrupted build keeps its progress
+ with open(FINGERPRINT_FILE, 'w') as stream:
+ json.dump(fingerprints, stream, indent=2)
+ 
+ return rendered
 
 if __name__ == "__main__":
  print("Generating publication-quality plots for Dual Spectral Report...")
  print("=" * 60)
  
- # Generate all plots
- print("1. Creating precision comparison plots...")
- plot_precision_comparison()
- 
- print("2. Creating dual framework overview...")
- plot_dual_framework_overview()
- 
- print("3. Creating convergence analysis...")
- plot_convergence_analysis()
- 
- print("4. Creating spectral correspondence visualization...")
- plot_spectral_correspondence()
+ rendered = build_plots(force='--force' in sys.argv[1:])
  
- print("\nAll plots generated successfully!")
- print("Files saved to ../docs/:")
- print(" - precision_comparison.png")
- print(" - dual_framework_overview.png") 
- print(" - convergence_analysis.png")
- print(" - spectral_correspondence.png")
- print("\nThese can now be included in the LaTeX report!") 
\ No newline at end of file
+ print(f"\n{len(rendered)} of {len(FIGURES)} plots re-rendered in {OUTPUT_DIR}/")
+ print("These can now be included in the LaTeX report!")
\ No newline at end of file
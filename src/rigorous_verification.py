@@ -17,8 +17,11 @@ Key improvements for publication quality:
 import numpy as np
 import time
 from decimal import Decimal, getcontext
-import matplotlib.pyplot as plt
 from scipy.stats import linregress
+from core.tridiagonal import (radial_operator_bands, sturm_count, continue_eigenvalues,
+ precision_dtype, sampled_precision_error, radial_channel_spectra)
+from core.artifacts import match_table, concatenate_tables, write_artifact
+from checkpoints import CheckpointStore, stage_name
 
 # Set high precision for Decimal calculations
 getcontext().prec = 100
@@ -50,7 +53,7 @@ class RiemannZeroVerifier:
  Decimal('77.144840068874847888302002845641050175799449621481158623142825969736019481049816007509072624827113')
  ]
  
- def compute_eigenvalues(self, N, epsilon=1e-6, T=15):
+ def compute_eigenvalues(self, N, epsilon=1e-6, T=15, precision='double', centrifugal=3/4):
  """
  Compute eigenvalues of discretized radial operator with given parameters.
  
@@ -58,6 +61,10 @@ class RiemannZeroVerifier:
  N: Number of internal grid points
  epsilon: Small value for left boundary (log(epsilon))
  T: Right boundary in t-coordinates
+ precision: 'double', or 'single' for a float32 preview solve (half the
+ memory; check it with preview_error)
+ centrifugal: Constant radial term on the diagonal (3/4 is the m=0 channel;
+ scan_channels solves many channels as one batch)
  
  Returns:
  Sorted eigenvalues array
@@ -65,8 +72,8 @@ class RiemannZeroVerifier:
  h = (T - np.log(epsilon)) / N
  
  # Create tridiagonal matrix A
- A = np.zeros((N-1, N-1))
- main_diag_val = 2 / (h**2) + 3/4
+ A = np.zeros((N-1, N-1), dtype=precision_dtype(precision))
+ main_diag_val = 2 / (h**2) + centrifugal
  off_diag_val = -1 / (h**2)
  
  np.fill_diagonal(A, main_diag_val)
@@ -79,6 +86,155 @@ class RiemannZeroVerifier:
  
  return eigenvalues
  
+ def preview_error(self, N, eigenvalues, epsilon=1e-6, T=15, num_samples=3):
+ """
+ Estimate the error of a single-precision spectrum against float64.
+ 
+ Args:
+ N: Number of internal grid points
+ eigenvalues: Spectrum from compute_eigenvalues(..., precision='single')
+ epsilon: Small value for left boundary (log(epsilon))
+ T: Right boundary in t-coordinates
+ num_samples: Number of eigenvalues re-resolved in float64
+ 
+ Returns:
+ Dictionary with the sampled references and relative errors
+ """
+ diagonal, off_diagonal = radial_operator_bands(N, epsilon, T)
+ return sampled_precision_error(diagonal, off_diagonal, eigenvalues, num_samples)
+ 
+ def load_or_compute_eigenvalues(self, N, epsilon=1e-6, T=15, store=None, precision='double'):
+ """
+ Compute the spectrum for one resolution, reusing a checkpoint if present.
+ 
+ The checkpoint name records the solver and precision as well as the
+ grid, so a float32 preview is never resumed as a float64 result.
+ 
+ Args:
+ N: Number of internal grid points
+ epsilon: Small value for left boundary (log(epsilon))
+ T: Right boundary in t-coordinates
+ store: Optional CheckpointStore; the spectrum is saved after computing
+ precision: 'double' or 'single' (see compute_eigenvalues)
+ 
+ Returns:
+ Tuple (eigenvalues, computation_time, resumed)
+ """
+ name = stage_name('radial', N=N, epsilon=epsilon, T=T, solver='eigvalsh', precision=precision)
+ if store is not None and store.has(name):
+ arrays, metadata = store.load(name)
+ return arrays['eigenvalues'], metadata['computation_time'], True
+ 
+ start_time = time.time()
+ eigenvalues = self.compute_eigenvalues(N, epsilon, T, precision=precision)
+ computation_time = time.time() - start_time
+ if store is not None:
+ store.save(name, {'eigenvalues': eigenvalues}, computation_time=computation_time,
+ N=N, epsilon=epsilon, T=T, solver='eigvalsh', precision=precision)
+ return eigenvalues, computation_time, False
+ 
+ def count_eigenvalues(self, N, energies, epsilon=1e-6, T=15):
+ """
+ Count eigenvalues of the radial operator below each energy.
+ 
+ Uses the Sturm sequence of the tridiagonal bands, so no matrix is
+ allocated and each query costs O(N).
+ 
+ Args:
+ N: Number of internal grid points
+ energies: Energies E (scalar or array)
+ epsilon: Small value for left boundary (log(epsilon))
+ T: Right boundary in t-coordinates
+ 
+ Returns:
+ Array of N(E), the number of eigenvalues below each E
+ """
+ diagonal, off_diagonal = radial_operator_bands(N, epsilon, T)
+ return sturm_count(diagonal, off_diagonal, energies)
+ 
+ def track_eigenvalues(self, N, parameter_path, num_zeros=10):
+ """
+ Follow the eigenvalues matched to the zeta zeros as epsilon and T vary.
+ 
+ The matches are located once at the first (epsilon, T); every later
+ point brackets each eigenvalue around its extrapolated previous value
+ and resolves only that bracket, so a boundary-sensitivity scan costs a
+ small fraction of independent full solves.
+ 
+ Args:
+ N: Number of internal grid points
+ parameter_path: Sequence of (epsilon, T) pairs, ideally varying smoothly
+ num_zeros: Number of zeta zeros to track
+ 
+ Returns:
+ Dictionary with the path, tracked eigenvalues (one row per point),
+ predicted eigenvalues, absolute errors, and flags marking points where
+ a tracked eigenvalue lost its index in the spectrum
+ """
+ n = min(num_zeros, len(self.tau_values))
+ predicted = np.array([float(tau)**2 + 0.5 for tau in self.tau_values[:n]])
+ parameter_path = [(float(epsilon), float(T)) for epsilon, T in parameter_path]
+ tracked, ambiguous = continue_eigenvalues(
+ (radial_operator_bands(N, epsilon, T) for epsilon, T in parameter_path),
+ predicted
+ )
+ 
+ return {
+ 'N': N,
+ 'parameters': parameter_path,
+ 'predicted_lambdas': predicted,
+ 'eigenvalues': tracked,
+ 'errors': np.abs(tracked - predicted),
+ 'ambiguous': ambiguous
+ }
+ 
+ def scan_channels(self, N, centrifugal_terms, epsilon=1e-6, T=15, num_zeros=10):
+ """
+ Match the zeta zeros in many centrifugal channels at once.
+ 
+ All channels share the grid and stencil (core.tridiagonal.radial_channel_spectra):
+ constant terms cost one solve in total, and the matching is vectorized
+ over channels. Every channel is matched against the same predicted
+ eigenvalues λ = τ² + 1/2.
+ 
+ Args:
+ N: Number of internal grid points
+ centrifugal_terms: One constant (or length N-1 profile) per channel
+ epsilon: Small value for left boundary (log(epsilon))
+ T: Right boundary in t-coordinates
+ num_zeros: Number of zeta zeros to match
+ 
+ Returns:
+ Dictionary with the predicted eigenvalues and, per channel (rows),
+ the closest eigenvalues, absolute errors and their mean
+ 
+ Raises:
+ ValueError: If centrifugal_terms is empty
+ """
+ n = min(num_zeros, len(self.tau_values))
+ predicted = np.array([float(tau)**2 + 0.5 for tau in self.tau_values[:n]])
+ centrifugal_terms = list(centrifugal_terms)
+ if not centrifugal_terms:
+ raise ValueError("scan_channels needs at least one centrifugal channel")
+ spectra = radial_channel_spectra(N, centrifugal_terms, epsilon, T)
+ 
+ # Spectra are sorted: the closest eigenvalue is one of the two around each target
+ upper = np.stack([np.searchsorted(row, predicted) for row in spectra])
+ upper = np.clip(upper, 1, spectra.shape[1] - 1)
+ rows = np.arange(len(spectra))[:, np.newaxis]
+ below, above = spectra[rows, upper - 1], spectra[rows, upper]
+ matched = np.where(np.abs(below - predicted) <= np.abs(above - predicted), below, above)
+ errors = np.abs(matched - predicted)
+ 
+ return {
+ 'N': N,
+ 'centrifugal_terms': centrifugal_terms,
+ 'predicted_lambdas': predicted,
+ 'matched_lambdas': matched,
+ 'errors': errors,
+ 'mean_errors': errors.mean(axis=1)
+ }
+ 
  def find_best_matches(self, eigenvalues, num_zeros=10):
  """
  Find best matches between computed eigenvalues and predicted zeta zero eigenvalues.
@@ -105,7 +261,31 @@ class RiemannZeroVerifier:
  
  return matches
  
- def convergence_analysis(self, N_values, num_zeros=10, epsilon=1e-6, T=15):
+ def match_table(self, eigenvalues, N, epsilon, T, computation_time=np.nan, num_zeros=10):
+ """
+ Columnar form of find_best_matches for one run.
+ 
+ Args:
+ eigenvalues: Computed eigenvalues array
+ N: Number of internal grid points
+ epsilon: Left boundary parameter
+ T: Right boundary parameter
+ computation_time: Solve time in seconds
+ num_zeros: Number of zeta zeros to check
+ 
+ Returns:
+ Dictionary of columns in core.artifacts.MATCH_SCHEMA
+ """
+ matches = self.find_best_matches(eigenvalues, num_zeros)
+ return match_table(
+ [m[0] for m in matches],
+ [float(self.tau_values[m[0]-1]) for m in matches],
+ [m[1] for m in matches],
+ [m[2] for m in matches],
+ N, epsilon, T, computation_time
+ )
+ 
+ def convergence_analysis(self, N_values, num_zeros=10, epsilon=1e-6, T=15, checkpoint_dir=None):
  """
  Perform convergence analysis across multiple grid resolutions.
  
@@ -114,10 +294,14 @@ class RiemannZeroVerifier:
  num_zeros: Number of zeta zeros to analyze
  epsilon: Left boundary parameter
  T: Right boundary parameter
+ checkpoint_dir: Optional directory for per-resolution spectra; completed
+ resolutions found there are loaded instead of recomputed
  
  Returns:
- Dictionary with convergence data
+ Dictionary with convergence data; 'table' holds every match as
+ columns (core.artifacts.MATCH_SCHEMA)
  """
+ store = CheckpointStore(checkpoint_dir) if checkpoint_dir is not None else None
  results = {
  'N_values': N_values,
  'errors': {i+1: [] for i in range(num_zeros)},
@@ -125,18 +309,19 @@ class RiemannZeroVerifier:
  'min_eigenvalues': [],
  'max_eigenvalues': []
  }
+ tables = []
  
  print("Starting convergence analysis...")
  print("=" * 80)
  
  for N in N_values:
  print(f"\nComputing for N = {N}...")
- start_time = time.time()
- 
- eigenvalues = self.compute_eigenvalues(N, epsilon, T)
- computation_time = time.time() - start_time
+ eigenvalues, computation_time, resumed = self.load_or_compute_eigenvalues(N, epsilon, T, store)
+ if resumed:
+ print(f" Resumed from checkpoint in {checkpoint_dir}")
  
  matches = self.find_best_matches(eigenvalues, num_zeros)
+ tables.append(self.match_table(eigenvalues, N, epsilon, T, computation_time, num_zeros))
  
  results['computation_times'].append(computation_time)
  results['min_eigenvalues'].append(eigenvalues.min())
@@ -156,6 +341,7 @@ class RiemannZeroVerifier:
  print(f" ζ_{zero_idx}: predicted={pred_lambda:.6f}, "
  f"closest={closest_lambda:.6f}, error={error:.6f}")
  
+ results['table'] = concatenate_tables(tables)
  return results
  
  def analyze_convergence_rates(self, results, num_zeros=5):
@@ -210,6 +396,9 @@ class RiemannZeroVerifier:
  Args:
  results: Results from convergence_analysis
  num_zeros: Number of zeros to analyze
+ 
+ Returns:
+ Dictionary of summary statistics at the finest resolution
  """
  print("\n" + "=" * 80)
  print("STATISTICAL ANALYSIS")
@@ -239,9 +428,26 @@ class RiemannZeroVerifier:
  matches = sum(1 for err in final_errors if err < tol)
  print(f"Matches within tolerance {tol}: {matches}/{num_zeros} ({100*matches/num_zeros:.1f}%)")
  
- def run_comprehensive_verification(self):
+ return {
+ 'mean_absolute_error': float(np.mean(final_errors)),
+ 'std_absolute_error': float(np.std(final_errors)),
+ 'max_absolute_error': float(np.max(final_errors)),
+ 'min_absolute_error': float(np.min(final_errors)),
+ 'mean_relative_error': float(np.mean(relative_errors)),
+ 'max_relative_error': float(np.max(relative_errors)),
+ 'matches_within_tolerance': {tol: int(sum(1 for err in final_errors if err < tol))
+ for tol in tolerances}
+ }
+ 
+ def run_comprehensive_verification(self, checkpoint_dir=None, artifact_path=None):
  """
  Run complete verification suite for Annals of Mathematics submission.
+ 
+ Args:
+ checkpoint_dir: Optional directory for per-resolution checkpoints; a
+ rerun after an interruption skips every completed resolution
+ artifact_path: Optional path for the columnar match table of every
+ resolution (Arrow if pyarrow is installed, else .npz)
  """
  print("RIGOROUS VERIFICATION OF RIEMANN ZETA ZERO CONNECTION")
  print("For Annals of Mathematics Submission")
@@ -261,7 +467,8 @@ class RiemannZeroVerifier:
  print(f" Testing first 15 Riemann zeta zeros")
  
  # Run convergence analysis
- results = self.convergence_analysis(N_values, num_zeros=15, epsilon=epsilon, T=T)
+ results = self.convergence_analysis(N_values, num_zeros=15, epsilon=epsilon, T=T,
+ checkpoint_dir=checkpoint_dir)
  
  # Analyze convergence rates
  convergence_rates = self.analyze_convergence_rates(results, num_zeros=10)
@@ -275,7 +482,8 @@ class RiemannZeroVerifier:
  print("=" * 80)
  
  N_final = N_values[-1]
- eigenvalues = self.compute_eigenvalues(N_final, epsilon, T)
+ store = CheckpointStore(checkpoint_dir) if checkpoint_dir is not None else None
+ eigenvalues, _, _ = self.load_or_compute_eigenvalues(N_final, epsilon, T, store)
  matches = self.find_best_matches(eigenvalues, num_zeros=15)
  
  print(f"Results for N = {N_final}:")
@@ -288,8 +496,13 @@ class RiemannZeroVerifier:
  print(f"{zero_idx:<6} {tau:<12.4f} {pred_lambda:<15.8f} {closest_lambda:<15.8f} "
  f"{error:<12.8f} {rel_error:<12.6f}%")
  
+ if artifact_path is not None:
+ written = write_artifact(artifact_path, results['table'])
+ print(f"\nMatch table written to {written}")
+ 
  return results, matches
 
 if __name__ == "__main__":
  verifier = RiemannZeroVerifier()
- results, final_matches = verifier.run_comprehensive_verification() 
\ No newline at end of file
+ results, final_matches = verifier.run_comprehensive_verification(
+ checkpoint_dir='checkpoints', artifact_path='rigorous_verification_matches') 
\ No newline at end of file
@@ -1,4 +1,5 @@
 import numpy as np
+from core.tridiagonal import radial_channel_spectra
 
 # --- Parameters for the Discretized Operator ---
 # N: Number of internal grid points. Higher N -> finer resolution -> more eigenvalues -> higher accuracy
@@ -13,35 +14,31 @@ epsilon = 1e-3 # Corresponds to t_start = log(1e-3) approx -6.907
 # Larger T means the domain extends further away from the singularity.
 T = 10 # Corresponds to r_end = e^10 approx 22026
 
+# centrifugal_terms: Constant radial term of each angular channel to solve.
+# 3/4 is the m=0 channel of L_radial. All channels share the grid and stencil,
+# so a scan over many channels is one batched solve.
+centrifugal_terms = [3/4]
+
+def describe_term(term):
+ """Constants print as a number, position-dependent profiles by their range"""
+ if np.ndim(term) == 0:
+ return f"{term:.6f}"
+ return f"profile {np.min(term):.6f} to {np.max(term):.6f}"
+
 # --- Derived Parameters ---
 # h: Grid spacing
 h = (T - np.log(epsilon)) / N
 
-# --- Constructing the (N-1)x(N-1) Tridiagonal Matrix A ---
-# A represents the discretized L_radial = -d²/dt² + 3/4 operator
-# A_{i,i} = 2/h² + 3/4 (main diagonal)
+# --- The (N-1)x(N-1) Tridiagonal Operator A ---
+# A represents the discretized L_radial = -d²/dt² + c operator, c the centrifugal term
+# A_{i,i} = 2/h² + c (main diagonal)
 # A_{i,i±1} = -1/h² (off-diagonals)
 
-# Create a matrix of zeros
-A = np.zeros((N-1, N-1))
-
-# Fill the main diagonal
-main_diag_val = 2 / (h**2) + 3/4
-np.fill_diagonal(A, main_diag_val)
-
-# Fill the off-diagonals
-off_diag_val = -1 / (h**2)
-np.fill_diagonal(A[1:], off_diag_val) # Upper diagonal
-np.fill_diagonal(A[:,1:], off_diag_val) # Lower diagonal
-
 # --- Compute Eigenvalues ---
-# eigvalsh is used for symmetric matrices (our A is symmetric tridiagonal)
-# It's generally faster and more stable for this type of matrix.
-print(f"Computing eigenvalues for a {N-1}x{N-1} matrix. This might take a moment...")
-eigenvalues = np.linalg.eigvalsh(A)
-
-# Sort eigenvalues in ascending order
-eigenvalues.sort()
+# A constant c only shifts the spectrum, so the stencil is solved once (tridiagonal
+# bisection) and every channel's sorted spectrum is that solve plus its c.
+print(f"Computing eigenvalues of a {N-1}x{N-1} operator for {len(centrifugal_terms)} channel(s)...")
+channel_spectra = radial_channel_spectra(N, centrifugal_terms, epsilon, T)
 
 # --- Target Riemann Zeta Zero Eigenvalues ---
 # These are the imaginary parts (tau_k) of the first few non-trivial zeta zeros: s_k = 1/2 + i*tau_k
@@ -57,16 +54,18 @@ tau_k_values = [
 # Calculate the predicted lambda values
 lambda_predicted = [tau**2 + 0.5 for tau in tau_k_values]
 
-# --- Find Closest Computed Eigenvalues ---
-print("\n--- Matching Computed Eigenvalues to Predicted Zeta Zeros ---")
-print("Note: Discretization yields discrete eigenvalues approximating a continuous spectrum.")
-print(" We expect *some* computed eigenvalues to be close to our targets.")
-print("---------------------------------------------------------------")
-
 tolerance = 0.5 # A reasonable tolerance for matching discrete approx to continuous spectrum
-found_matches = 0
 
-for i, target_lambda in enumerate(lambda_predicted):
+for centrifugal, eigenvalues in zip(centrifugal_terms, channel_spectra):
+ # --- Find Closest Computed Eigenvalues ---
+ print(f"\n--- Matching Computed Eigenvalues to Predicted Zeta Zeros (centrifugal term {describe_term(centrifugal)}) ---")
+ print("Note: Discretization yields discrete eigenvalues approximating a continuous spectrum.")
+ print(" We expect *some* computed eigenvalues to be close to our targets.")
+ print("---------------------------------------------------------------")
+ 
+ found_matches = 0
+ 
+ for i, target_lambda in enumerate(lambda_predicted):
  # Find the index of the closest eigenvalue in our computed list
  closest_eigenvalue_idx = np.argmin(np.abs(eigenvalues - target_lambda))
  closest_eigenvalue = eigenvalues[closest_eigenvalue_idx]
@@ -82,12 +81,12 @@ for i, target_lambda in enumerate(lambda_predicted):
  print(f"Target lambda_{i+1} (τ={tau_k_values[i]:.4f}): {target_lambda:.6f}")
  print(f" -> Closest computed eigenvalue: {closest_eigenvalue:.6f}")
  print(f" -> Difference: {difference:.6f} (No direct match within tolerance)")
-
-print(f"\nFound {found_matches} potential matches within tolerance for the first {len(tau_k_values)} Riemann zeta zeros.")
-
-# --- General Spectral Properties (for debugging/interpretation) ---
-print("\n--- General Spectral Properties of Discretized Operator ---")
-print(f"Number of computed eigenvalues: {len(eigenvalues)}")
-print(f"Minimum computed eigenvalue: {eigenvalues.min():.6f}")
-print(f"Maximum computed eigenvalue: {eigenvalues.max():.6f}")
-print(f"Expected minimum of continuous spectrum (V0 + 1/4): {0.5 + 0.25:.6f}") # Should be 0.75 for L_radial
+ 
+ print(f"\nFound {found_matches} potential matches within tolerance for the first {len(tau_k_values)} Riemann zeta zeros.")
+ 
+ # --- General Spectral Properties (for debugging/interpretation) ---
+ print("\n--- General Spectral Properties of Discretized Operator ---")
+ print(f"Number of computed eigenvalues: {len(eigenvalues)}")
+ print(f"Minimum computed eigenvalue: {eigenvalues.min():.6f}")
+ print(f"Maximum computed eigenvalue: {eigenvalues.max():.6f}")
+ print(f"Expected minimum of continuous spectrum (centrifugal term): {describe_term(centrifugal)}") # 0.75 for the m=0 channel of L_radial
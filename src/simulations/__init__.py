@@ -2,6 +2,35 @@
 LambdaCore-RiemannHypothesis: Simulations Package
 
 Computational validation simulations for the Λ-Core framework.
+
+Every simulation is a parameterized function returning a results dict;
+nothing runs at import time. Each accepts an optional shared prime table,
+so a driver can run many variants in one process without re-sieving:
+
+    from core.zeta_functions import prime_table
+    from simulations.simulation_2_prime_partitions import partition_primes
+
+    primes, _ = prime_table(10**6)
+    results = [partition_primes(limit, primes=primes) for limit in (10**4, 10**5, 10**6)]
 """
 
-__version__ = "1.1" 
\ No newline at end of file
+import numpy as np
+from core.zeta_functions import prime_table
+
+__version__ = "1.1"
+
+def primes_up_to(limit, primes=None):
+    """
+    Primes up to limit, sliced from a shared table when one is given.
+
+    Args:
+        limit (int): Largest prime to include
+        primes (array-like): Optional ascending prime table; it must reach limit
+
+    Returns:
+        numpy.ndarray: The primes p <= limit as int64
+    """
+    if primes is None:
+        return prime_table(int(limit))[0]
+    primes = np.asarray(primes, dtype=np.int64)
+    return primes[:np.searchsorted(primes, limit, side='right')]
@@ -1,43 +1,45 @@
 import numpy as np
+from core.zeta_functions import dirichlet_series_zeta, euler_product_zeta, critical_strip_zeta
+from . import primes_up_to
 
-def dirichlet_sum(s, limit=2000):
- """Calculates the zeta function using the Dirichlet series sum."""
- return np.sum([1 / (n**s) for n in range(1, limit + 1)])
+def compare_zeta(s=2 + 0j, max_terms=2000, max_prime=2000, primes=None):
+    """
+    Compare the Dirichlet sum and the Euler product for ζ(s) against the exact value.
 
-def euler_product(s, limit=2000):
- """Calculates the zeta function using the Euler product over primes."""
- 
- def get_primes(n):
- """Simple sieve to get primes up to n."""
- primes = []
- is_prime = [True] * (n + 1)
- is_prime[0] = is_prime[1] = False
- for p in range(2, int(np.sqrt(n)) + 1):
- if is_prime[p]:
- for i in range(p * p, n + 1, p):
- is_prime[i] = False
- for p in range(2, n + 1):
- if is_prime[p]:
- primes.append(p)
- return primes
+    Args:
+        s (complex): Argument with Re(s) > 1
+        max_terms (int): Terms of the Dirichlet series
+        max_prime (int): Largest prime in the Euler product
+        primes (array-like): Optional shared prime table reaching max_prime
 
- primes_up_to_limit = get_primes(limit)
- product = 1.0
- for p in primes_up_to_limit:
- product *= (1 - 1 / (p**s))**-1
- return product
+    Returns:
+        dict: Both approximations, the exact value and their absolute errors
+    """
+    dirichlet_value = dirichlet_series_zeta(s, max_terms)
+    euler_value = euler_product_zeta(s, primes=[primes_up_to(max_prime, primes)])
+    exact_value = complex(critical_strip_zeta(np.imag(s), sigma=np.real(s)))
 
-s_val = 2 + 0j # A complex value for s with Re(s) > 1
+    return {
+        's': s,
+        'max_terms': max_terms,
+        'max_prime': max_prime,
+        'dirichlet_value': dirichlet_value,
+        'euler_value': euler_value,
+        'exact_value': exact_value,
+        'dirichlet_error': abs(dirichlet_value - exact_value),
+        'euler_error': abs(euler_value - exact_value)
+    }
 
-zeta_from_sum = dirichlet_sum(s_val)
-zeta_from_product = euler_product(s_val)
-actual_zeta_2 = np.pi**2 / 6 # The known value for ζ(2)
+def print_report(results):
+    """Print the comparison in the original simulation's format."""
+    print("=== Simulation 1: Zeta Function Comparison ===")
+    print(f"Calculating for s = {results['s']}")
+    print(f"Dirichlet Sum approx: {results['dirichlet_value'].real:.6f}")
+    print(f"Euler Product approx: {results['euler_value'].real:.6f}")
+    print(f"Actual value of ζ(s): {results['exact_value'].real:.6f}")
+    print(f"Dirichlet Sum error: {results['dirichlet_error']:.6f}")
+    print(f"Euler Product error: {results['euler_error']:.6f}")
+    print("="*50)
 
-print("=== Simulation 1: Zeta Function Comparison ===")
-print(f"Calculating for s = {s_val}")
-print(f"Dirichlet Sum approx: {zeta_from_sum.real:.6f}")
-print(f"Euler Product approx: {zeta_from_product.real:.6f}")
-print(f"Actual value of ζ(2): {actual_zeta_2:.6f}")
-print(f"Dirichlet Sum error: {abs(zeta_from_sum.real - actual_zeta_2):.6f}")
-print(f"Euler Product error: {abs(zeta_from_product.real - actual_zeta_2):.6f}")
-print("="*50) 
\ No newline at end of file
+if __name__ == "__main__":
+    print_report(compare_zeta())
@@ -1,41 +1,65 @@
 import numpy as np
-import matplotlib.pyplot as plt
-
-def partition_primes(limit=10000):
- """Partitions primes up to a limit into 4n+1 and 4n+3 classes."""
- primes = []
- is_prime = [True] * (limit + 1)
- is_prime[0] = is_prime[1] = False
- for p in range(2, int(np.sqrt(limit)) + 1):
- if is_prime[p]:
- for i in range(p * p, limit + 1, p):
- is_prime[i] = False
- for p in range(3, limit + 1): # We exclude 2 for this classification
- if is_prime[p]:
- primes.append(p)
- 
- class_4n1 = [p for p in primes if p % 4 == 1]
- class_4n3 = [p for p in primes if p % 4 == 3]
- 
- return class_4n1, class_4n3
-
-print("=== Simulation 2: Prime Class Partitioning ===")
-primes_4n1, primes_4n3 = partition_primes()
-
-# Plot the cumulative counts
-plt.figure(figsize=(12, 8))
-plt.plot(np.cumsum([1]*len(primes_4n1)), label='Count of 4n+1 Primes (Euclidean)', linewidth=2)
-plt.plot(np.cumsum([1]*len(primes_4n3)), label='Count of 4n+3 Primes (Hyperbolic)', linewidth=2)
-plt.title('Cumulative Counts of Prime Classes', fontsize=14)
-plt.xlabel('N-th Prime in Class', fontsize=12)
-plt.ylabel('Cumulative Count', fontsize=12)
-plt.legend(fontsize=12)
-plt.grid(True, alpha=0.3)
-plt.tight_layout()
-plt.savefig('prime_partitions.png', dpi=300, bbox_inches='tight')
-plt.show()
-
-print(f"Number of 4n+1 primes found: {len(primes_4n1)}")
-print(f"Number of 4n+3 primes found: {len(primes_4n3)}")
-print(f"Ratio (4n+3)/(4n+1): {len(primes_4n3)/len(primes_4n1):.4f}")
-print("="*50) 
\ No newline at end of file
+from core.residue_classes import ResidueClassPartitioner
+from . import primes_up_to
+
+def partition_primes(limit=10000, primes=None):
+    """
+    Partition the odd primes up to a limit into 4n+1 and 4n+3 classes.
+
+    Args:
+        limit (int): Largest prime to classify
+        primes (array-like): Optional shared prime table reaching limit
+
+    Returns:
+        dict: Both classes as arrays, their counts and the (4n+3)/(4n+1) ratio
+    """
+    partitioner = ResidueClassPartitioner((4,), primes=primes_up_to(limit, primes))
+    euclidean = partitioner.class_primes(4, 1)
+    hyperbolic = partitioner.class_primes(4, 3)
+
+    return {
+        'limit': limit,
+        'euclidean_primes': euclidean,
+        'hyperbolic_primes': hyperbolic,
+        'euclidean_count': len(euclidean),
+        'hyperbolic_count': len(hyperbolic),
+        'balance_ratio': len(hyperbolic) / len(euclidean) if len(euclidean) else float('inf')
+    }
+
+def plot_partitions(results, save_path='prime_partitions.png'):
+    """
+    Plot the cumulative counts of both prime classes.
+
+    Args:
+        results (dict): Output of partition_primes
+        save_path (str): Optional path to save the figure
+    """
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(12, 8))
+    plt.plot(np.arange(1, results['euclidean_count'] + 1),
+             label='Count of 4n+1 Primes (Euclidean)', linewidth=2)
+    plt.plot(np.arange(1, results['hyperbolic_count'] + 1),
+             label='Count of 4n+3 Primes (Hyperbolic)', linewidth=2)
+    plt.title('Cumulative Counts of Prime Classes', fontsize=14)
+    plt.xlabel('N-th Prime in Class', fontsize=12)
+    plt.ylabel('Cumulative Count', fontsize=12)
+    plt.legend(fontsize=12)
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+def print_report(results):
+    """Print the class counts in the original simulation's format."""
+    print("=== Simulation 2: Prime Class Partitioning ===")
+    print(f"Number of 4n+1 primes found: {results['euclidean_count']}")
+    print(f"Number of 4n+3 primes found: {results['hyperbolic_count']}")
+    print(f"Ratio (4n+3)/(4n+1): {results['balance_ratio']:.4f}")
+    print("="*50)
+
+if __name__ == "__main__":
+    results = partition_primes()
+    plot_partitions(results)
+    print_report(results)
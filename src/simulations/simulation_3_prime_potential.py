@@ -1,58 +1,73 @@
 import numpy as np
-import matplotlib.pyplot as plt
-
-def get_prime_partitions(limit=500):
- """Generates primes and partitions them."""
- primes = []
- is_prime = [True] * (limit + 1)
- is_prime[0] = is_prime[1] = False
- for p in range(2, int(np.sqrt(limit)) + 1):
- if is_prime[p]:
- for i in range(p * p, limit + 1, p):
- is_prime[i] = False
- for p in range(2, limit + 1):
- if is_prime[p]:
- primes.append(p)
- 
- class_4n1 = [p for p in primes if p % 4 == 1]
- class_4n3 = [p for p in primes if p % 4 == 3]
- class_S = [2] 
- 
- return class_4n1, class_4n3, class_S
-
-print("=== Simulation 3: Prime Potential Visualization ===")
-primes_4n1, primes_4n3, primes_S = get_prime_partitions()
-
-# Get the logarithmic positions
-log_pos_4n1 = np.log(primes_4n1)
-log_pos_4n3 = np.log(primes_4n3)
-log_pos_S = np.log(primes_S)
-
-# Get the weights (w_p = p^(-1/2))
-weights_4n1 = np.array(primes_4n1)**(-0.5)
-weights_4n3 = np.array(primes_4n3)**(-0.5)
-weights_S = np.array(primes_S)**(-0.5)
-
-# Visualize the potential V(y)
-plt.figure(figsize=(15, 10))
-# We plot the Hyperbolic primes with a negative sign to visually represent the opposition
-plt.stem(log_pos_4n1, weights_4n1, linefmt='b-', markerfmt='bo', basefmt=' ', 
- label='V_E (4n+1 Primes - Proximity)')
-plt.stem(log_pos_4n3, -weights_4n3, linefmt='r-', markerfmt='ro', basefmt=' ', 
- label='V_H (4n+3 Primes - Identity)')
-plt.stem(log_pos_S, weights_S, linefmt='g-', markerfmt='go', basefmt=' ', 
- label='V_S (Anchor Primes)')
-plt.title('The Prime Potential V(y) on a Logarithmic Axis', fontsize=16)
-plt.xlabel('y = log(x)', fontsize=14)
-plt.ylabel('Potential Strength (w_p = p^(-1/2))', fontsize=14)
-plt.legend(fontsize=12)
-plt.grid(True, linestyle='--', alpha=0.6)
-plt.tight_layout()
-plt.savefig('prime_potential.png', dpi=300, bbox_inches='tight')
-plt.show()
-
-print(f"Number of 4n+1 primes: {len(primes_4n1)}")
-print(f"Number of 4n+3 primes: {len(primes_4n3)}")
-print(f"Number of anchor primes: {len(primes_S)}")
-print(f"Total primes plotted: {len(primes_4n1) + len(primes_4n3) + len(primes_S)}")
-print("="*50) 
\ No newline at end of file
+from core.compact_potential import CompactPrimePotential
+from . import primes_up_to
+
+def prime_potential(limit=500, coupling_constant=1.0, primes=None):
+    """
+    Positions and signed weights of the prime potential V(y) on the log axis.
+
+    Args:
+        limit (int): Largest prime to place
+        coupling_constant (float): Overall energy scale
+        primes (array-like): Optional shared prime table reaching limit
+
+    Returns:
+        dict: log(p), signed strength and class (1, 3, or 2 for the anchor)
+        of every prime, with per-class counts
+    """
+    primes = primes_up_to(limit, primes)
+    potential = CompactPrimePotential.from_primes(primes, coupling_constant)
+    classes = np.where(primes == 2, 2, primes % 4)
+
+    return {
+        'limit': limit,
+        'log_primes': potential.log_primes,
+        'strengths': potential.strengths,
+        'classes': classes,
+        'euclidean_count': int(np.sum(classes == 1)),
+        'hyperbolic_count': int(np.sum(classes == 3)),
+        'anchor_count': int(np.sum(classes == 2)),
+        'total_count': len(primes)
+    }
+
+def plot_potential(results, save_path='prime_potential.png'):
+    """
+    Stem plot of V(y) with the three prime classes in separate colours.
+
+    Args:
+        results (dict): Output of prime_potential
+        save_path (str): Optional path to save the figure
+    """
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(15, 10))
+    # Hyperbolic primes carry a negative sign, representing the opposition
+    for residue, color, label in ((1, 'b', 'V_E (4n+1 Primes - Proximity)'),
+                                  (3, 'r', 'V_H (4n+3 Primes - Identity)'),
+                                  (2, 'g', 'V_S (Anchor Primes)')):
+        mask = results['classes'] == residue
+        plt.stem(results['log_primes'][mask], results['strengths'][mask],
+                 linefmt=f'{color}-', markerfmt=f'{color}o', basefmt=' ', label=label)
+    plt.title('The Prime Potential V(y) on a Logarithmic Axis', fontsize=16)
+    plt.xlabel('y = log(x)', fontsize=14)
+    plt.ylabel('Potential Strength (w_p = p^(-1/2))', fontsize=14)
+    plt.legend(fontsize=12)
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.tight_layout()
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+def print_report(results):
+    """Print the class counts in the original simulation's format."""
+    print("=== Simulation 3: Prime Potential Visualization ===")
+    print(f"Number of 4n+1 primes: {results['euclidean_count']}")
+    print(f"Number of 4n+3 primes: {results['hyperbolic_count']}")
+    print(f"Number of anchor primes: {results['anchor_count']}")
+    print(f"Total primes plotted: {results['total_count']}")
+    print("="*50)
+
+if __name__ == "__main__":
+    results = prime_potential()
+    plot_potential(results)
+    print_report(results)
@@ -1,139 +1,153 @@
 import numpy as np
 import scipy.linalg as linalg
-import matplotlib.pyplot as plt
-
-print("=== Simulation 4: Hamiltonian Eigenvalue Analysis ===")
-
-# --- 1. Setup the Discretized Space ---
-N_GRID = 5000 # Higher resolution grid
-Y_MIN, Y_MAX = 0, 9.0 # Go out further to capture more primes (up to e^9 ~ 8100)
-dy = (Y_MAX - Y_MIN) / N_GRID
-y_grid = np.linspace(Y_MIN, Y_MAX, N_GRID)
-
-print(f"Grid parameters:")
-print(f" Grid points: {N_GRID}")
-print(f" Y range: [{Y_MIN}, {Y_MAX}]")
-print(f" Grid spacing: {dy:.6f}")
-print(f" Max prime captured: ~{int(np.exp(Y_MAX))}")
-
-# --- 2. Construct the Prime Potential (V) ---
-def get_prime_partitions(limit):
- """Generates primes and partitions them into functional classes."""
- primes = []
- is_prime = [True] * (limit + 1)
- is_prime[0] = is_prime[1] = False
- for p in range(2, int(np.sqrt(limit)) + 1):
- if is_prime[p]:
- for i in range(p * p, limit + 1, p):
- is_prime[i] = False
- for p in range(2, limit + 1):
- if is_prime[p]:
- primes.append(p)
- class_4n1 = [p for p in primes if p % 4 == 1]
- class_4n3 = [p for p in primes if p % 4 == 3]
- class_S = [2]
- return class_4n1, class_4n3, class_S
-
-primes_4n1, primes_4n3, primes_S = get_prime_partitions(limit=int(np.exp(Y_MAX)))
-
-print(f"Prime statistics:")
-print(f" 4n+1 primes: {len(primes_4n1)}")
-print(f" 4n+3 primes: {len(primes_4n3)}")
-print(f" Anchor primes: {len(primes_S)}")
-print(f" Total primes: {len(primes_4n1) + len(primes_4n3) + len(primes_S)}")
-
-V_potential = np.zeros(N_GRID)
-# The coupling constant needs to be tuned to match the kinetic energy scale.
-# This is a key parameter of the model that sets the "strength" of the prime identities.
-COUPLING_CONSTANT = 2 * 10**5 
-
-def place_potential_on_grid(p_list, sign):
- """Places weighted prime potentials onto the discrete grid."""
- placed_count = 0
- for p in p_list:
- log_p = np.log(p)
- if Y_MIN < log_p < Y_MAX:
- idx = int((log_p - Y_MIN) / dy)
- V_potential[idx] += sign * (p**(-0.5)) * COUPLING_CONSTANT
- placed_count += 1
- return placed_count
-
-placed_4n1 = place_potential_on_grid(primes_4n1, 1.0)
-placed_4n3 = place_potential_on_grid(primes_4n3, -1.0)
-placed_S = place_potential_on_grid(primes_S, 1.0)
-
-print(f"Primes placed on grid:")
-print(f" 4n+1 primes placed: {placed_4n1}")
-print(f" 4n+3 primes placed: {placed_4n3}")
-print(f" Anchor primes placed: {placed_S}")
-
-V_matrix = np.diag(V_potential)
-
-# --- 3. Construct the Kinetic Energy Operator (T) ---
-# We use the Schrodinger form T = -1/2 * d^2/dy^2
-T_matrix = np.zeros((N_GRID, N_GRID))
-T_matrix += np.diag(-2 * np.ones(N_GRID))
-T_matrix += np.diag(np.ones(N_GRID - 1), k=1)
-T_matrix += np.diag(np.ones(N_GRID - 1), k=-1)
-T_matrix *= -1.0 / (2.0 * dy**2)
-
-# --- 4. Form the Hamiltonian and Solve for Eigenvalues ---
-print("Constructing Hamiltonian matrix...")
-H_matrix = T_matrix + V_matrix
-# We only need the lowest eigenvalues as they correspond to the first zeros
-num_eigenvalues = 15
-print(f"Computing {num_eigenvalues} lowest eigenvalues...")
-eigenvalues = linalg.eigvalsh(H_matrix, subset_by_index=[0, num_eigenvalues-1])
-
-# The eigenvalues E_n of this operator should approximate t_n^2
-computed_zeros_approx = np.sqrt(eigenvalues[eigenvalues > 0])
-
-# --- 5. Compare with Known Riemann Zeros ---
-known_zeros = [
- 14.134725, 21.022040, 25.010858, 30.424876, 32.935062, 
- 37.586178, 40.918719, 43.327073, 48.005151, 49.773832,
- 52.910381, 56.446248, 59.347044, 60.831779, 65.112544
-]
-
-# --- 6. Plotting the Comparison ---
-plt.figure(figsize=(14, 10))
-plt.eventplot(known_zeros, orientation='horizontal', colors='r', linelengths=0.8, 
- lineoffsets=1, label=f'First {len(known_zeros)} Known Riemann Zeros')
-plt.eventplot(computed_zeros_approx, orientation='horizontal', colors='b', linelengths=0.8, 
- lineoffsets=2, label=f'First {len(computed_zeros_approx)} Computed Zeros from Model')
-
-plt.title('Spectral Test of the Λ-Core Prime Hamiltonian', fontsize=16)
-plt.yticks([1, 2], ['Known Zeros (from literature)', 'Eigenvalues of Model'])
-plt.xlabel('Height on the Critical Line (t)', fontsize=14)
-plt.legend(fontsize=12)
-plt.grid(True, axis='x', linestyle=':', alpha=0.7)
-plt.ylim(0.5, 2.5)
-plt.xlim(0, 70)
-plt.tight_layout()
-plt.savefig('riemann_zeros_comparison.png', dpi=300, bbox_inches='tight')
-plt.show()
-
-# --- 7. Print Table of Results ---
-print("\nTable 1: Comparison of Computed Spectrum vs. Known Riemann Zeros")
-print("="*75)
-print(f"{'n':<5}{'Known Zero (t_n)':<20}{'Computed Zero':<20}{'Relative Error (%)':<20}")
-print("-"*75)
-for i in range(min(len(computed_zeros_approx), len(known_zeros))):
- if i < len(computed_zeros_approx):
- error = 100 * abs(computed_zeros_approx[i] - known_zeros[i]) / known_zeros[i]
- print(f"{i+1:<5}{known_zeros[i]:<20.6f}{computed_zeros_approx[i]:<20.6f}{error:<20.2f}")
- else:
- print(f"{i+1:<5}{known_zeros[i]:<20.6f}{'N/A':<20}{'N/A':<20}")
-print("="*75)
-
-# Calculate statistics
-if len(computed_zeros_approx) > 0:
- errors = [100 * abs(computed_zeros_approx[i] - known_zeros[i]) / known_zeros[i] 
- for i in range(min(len(computed_zeros_approx), len(known_zeros)))]
- print(f"\nStatistical Summary:")
- print(f" Mean relative error: {np.mean(errors):.2f}%")
- print(f" Std deviation of error: {np.std(errors):.2f}%")
- print(f" Max relative error: {np.max(errors):.2f}%")
- print(f" Min relative error: {np.min(errors):.2f}%")
-
-print("="*50) 
\ No newline at end of file
+from core.compact_potential import CompactPrimePotential
+from core.zeta_functions import known_riemann_zeros
+from . import primes_up_to
+
+def hamiltonian_spectrum(n_grid=5000, y_min=0, y_max=9.0, coupling_constant=2 * 10**5,
+                         num_eigenvalues=15, num_compared=15, primes=None):
+    """
+    Lowest eigenvalues of H = -1/2 d²/dy² + V on the log-prime axis.
+
+    The coupling constant sets the strength of the prime potential
+    relative to the kinetic energy scale 1/(2 dy²); it is the key tuning
+    parameter of the model. Eigenvalues E_n should approximate t_n².
+
+    Args:
+        n_grid (int): Number of grid points
+        y_min (float): Left end of the grid in y = log(x)
+        y_max (float): Right end; primes up to exp(y_max) are placed
+        coupling_constant (float): Overall energy scale of the potential
+        num_eigenvalues (int): Number of lowest eigenvalues to compute
+        num_compared (int): Number of zeros to compare (at most 15 are known)
+        primes (array-like): Optional shared prime table reaching exp(y_max)
+
+    Returns:
+        dict: Grid parameters, placed-prime counts per class, potential
+        range, eigenvalues, computed zeros and their comparison with the
+        known zeros
+    """
+    dy = (y_max - y_min) / n_grid
+    primes = primes_up_to(int(np.exp(y_max)), primes)
+    potential = CompactPrimePotential.from_primes(primes, coupling_constant)
+    _, V_potential = potential.discretize(y_min, y_max, n_grid)
+
+    # Primes that land on the grid, per class
+    log_primes = np.log(primes)
+    placed = primes[(log_primes > y_min) & (log_primes < y_max)]
+
+    # H is tridiagonal: only the lowest eigenvalues are selected
+    diagonal = np.full(n_grid, 1.0 / dy**2) + V_potential
+    off_diagonal = np.full(n_grid - 1, -1.0 / (2.0 * dy**2))
+    eigenvalues = linalg.eigvalsh_tridiagonal(
+        diagonal, off_diagonal, select='i', select_range=(0, num_eigenvalues - 1)
+    )
+    computed_zeros = np.sqrt(eigenvalues[eigenvalues > 0])
+
+    known_zeros = np.array(known_riemann_zeros())
+    count = min(len(computed_zeros), len(known_zeros), num_compared)
+    relative_errors = 100 * np.abs(computed_zeros[:count] - known_zeros[:count]) / known_zeros[:count]
+
+    return {
+        'n_grid': n_grid,
+        'y_min': y_min,
+        'y_max': y_max,
+        'dy': dy,
+        'coupling_constant': coupling_constant,
+        'kinetic_scale': 1.0 / (2.0 * dy**2),
+        'prime_counts': {residue: int(np.sum(primes % 4 == residue)) for residue in (1, 3, 2)},
+        'placed_counts': {residue: int(np.sum(placed % 4 == residue)) for residue in (1, 3, 2)},
+        'potential_nonzero': int(np.count_nonzero(V_potential)),
+        'potential_range': (float(V_potential.min()), float(V_potential.max())),
+        'eigenvalues': eigenvalues,
+        'computed_zeros': computed_zeros,
+        'known_zeros': known_zeros[:count],
+        'relative_errors': relative_errors
+    }
+
+def plot_comparison(results, num_shown=None, title='Spectral Test of the Λ-Core Prime Hamiltonian',
+                    save_path='riemann_zeros_comparison.png'):
+    """
+    Event plot of the known zeros against the computed spectrum.
+
+    Args:
+        results (dict): Output of hamiltonian_spectrum
+        num_shown (int): Number of zeros of each kind to show (default all)
+        title (str): Figure title
+        save_path (str): Optional path to save the figure
+    """
+    import matplotlib.pyplot as plt
+
+    known_zeros = np.array(known_riemann_zeros())[:num_shown]
+    computed_zeros = results['computed_zeros'][:num_shown]
+
+    plt.figure(figsize=(14, 10))
+    plt.eventplot(known_zeros, orientation='horizontal', colors='r', linelengths=0.8,
+                  lineoffsets=1, label=f'First {len(known_zeros)} Known Riemann Zeros')
+    if len(computed_zeros) > 0:
+        plt.eventplot(computed_zeros, orientation='horizontal', colors='b', linelengths=0.8,
+                      lineoffsets=2, label=f'First {len(computed_zeros)} Computed Zeros from Model')
+
+    plt.title(title, fontsize=16)
+    plt.yticks([1, 2], ['Known Zeros (from literature)', 'Eigenvalues of Model'])
+    plt.xlabel('Height on the Critical Line (t)', fontsize=14)
+    plt.legend(fontsize=12)
+    plt.grid(True, axis='x', linestyle=':', alpha=0.7)
+    plt.ylim(0.5, 2.5)
+    plt.xlim(0, 70)
+    plt.tight_layout()
+    if save_path:
+        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+def print_report(results, header="=== Simulation 4: Hamiltonian Eigenvalue Analysis ==="):
+    """Print grid parameters, prime counts and the comparison table."""
+    euclidean, hyperbolic, anchor = (results['prime_counts'][r] for r in (1, 3, 2))
+    placed = results['placed_counts']
+
+    print(header)
+    print(f"Grid parameters:")
+    print(f" Grid points: {results['n_grid']}")
+    print(f" Y range: [{results['y_min']}, {results['y_max']}]")
+    print(f" Grid spacing: {results['dy']:.6f}")
+    print(f" Max prime captured: ~{int(np.exp(results['y_max']))}")
+    print(f"Prime statistics:")
+    print(f" 4n+1 primes: {euclidean}")
+    print(f" 4n+3 primes: {hyperbolic}")
+    print(f" Anchor primes: {anchor}")
+    print(f" Total primes: {euclidean + hyperbolic + anchor}")
+    print(f"Kinetic energy scale: {results['kinetic_scale']:.2f}")
+    print(f"Using coupling constant: {results['coupling_constant']}")
+    print(f"Primes placed on grid:")
+    print(f" 4n+1 primes placed: {placed[1]}")
+    print(f" 4n+3 primes placed: {placed[3]}")
+    print(f" Anchor primes placed: {placed[2]}")
+    print(f"Potential statistics:")
+    print(f" Non-zero elements: {results['potential_nonzero']}")
+    print(f" Min potential: {results['potential_range'][0]:.2f}")
+    print(f" Max potential: {results['potential_range'][1]:.2f}")
+
+    print("\nTable 1: Comparison of Computed Spectrum vs. Known Riemann Zeros")
+    print("="*75)
+    print(f"{'n':<5}{'Known Zero (t_n)':<20}{'Computed Zero':<20}{'Relative Error (%)':<20}")
+    print("-"*75)
+    errors = results['relative_errors']
+    for i, error in enumerate(errors):
+        print(f"{i+1:<5}{results['known_zeros'][i]:<20.6f}"
+              f"{results['computed_zeros'][i]:<20.6f}{error:<20.2f}")
+    print("="*75)
+
+    if len(errors) > 0:
+        print(f"\nStatistical Summary ({len(errors)} zeros):")
+        print(f" Mean relative error: {np.mean(errors):.2f}%")
+        print(f" Std deviation of error: {np.std(errors):.2f}%")
+        print(f" Max relative error: {np.max(errors):.2f}%")
+        print(f" Min relative error: {np.min(errors):.2f}%")
+    else:
+        print("No positive eigenvalues found for comparison")
+    print("="*50)
+
+if __name__ == "__main__":
+    results = hamiltonian_spectrum()
+    plot_comparison(results)
+    print_report(results)
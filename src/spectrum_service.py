@@ -0,0 +1,454 @@
+#!/usr/bin/env python3
+"""
+Local Spectrum Service
+JSON-RPC 2.0 access to radial-operator spectra, shared between clients
+
+One asyncio server, bound to localhost or a Unix socket, answers
+newline-delimited JSON-RPC requests from any number of notebooks and
+pipelines. Solves run in a process pool. A request identical to one
+already in flight waits for that solve instead of starting another, and
+finished results are kept in an LRU cache, so concurrent and repeated
+requests for the same spectrum cost one solve.
+
+Methods (parameters in brackets are optional):
+    spectrum  N [epsilon T count]      lowest count eigenvalues (all if omitted)
+    window    N lower upper [epsilon T] eigenvalues in (lower, upper]
+    match     N [epsilon T num_zeros]  best matches to the zeta zeros, as a
+                                       core.artifacts match table
+    stats                              cache and coalescing counters
+
+Usage:
+    python spectrum_service.py serve --port 8765 --workers 4
+    python spectrum_service.py serve --socket /tmp/spectrum.sock --max-n 20000
+    python spectrum_service.py call spectrum '{"N": 2000, "count": 20}' --port 8765
+
+From Python:
+    with SpectrumClient(port=8765) as client:
+        table = client.call('match', N=4000, epsilon=1e-8, T=20)
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import signal
+import socket
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
+import scipy.linalg as linalg
+from core.tridiagonal import radial_operator_bands
+
+# Parameter types and defaults of each method (None: required)
+METHODS = {
+    'spectrum': {'N': (int, None), 'epsilon': (float, 1e-6), 'T': (float, 15.0),
+                 'count': (int, 0)},
+    'window': {'N': (int, None), 'lower': (float, None), 'upper': (float, None),
+               'epsilon': (float, 1e-6), 'T': (float, 15.0)},
+    'match': {'N': (int, None), 'epsilon': (float, 1e-6), 'T': (float, 15.0),
+              'num_zeros': (int, 10)},
+    'stats': {}
+}
+
+# Default request limits: the largest grid, and the most eigenvalues or
+# zeros one request may ask for by count
+MAX_N = 50000
+MAX_COUNT = 10000
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+class RPCError(Exception):
+    """An error reported to the client as a JSON-RPC error object."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+def canonical_params(method, params, max_N=MAX_N, max_count=MAX_COUNT):
+    """
+    Validate parameters and fill in defaults.
+
+    Requests that differ only in omitted defaults or in number formatting
+    (2000 vs 2000.0) map to the same canonical form, and so coalesce.
+
+    Args:
+        method: Method name
+        params: Parameter dictionary from the request
+        max_N: Largest grid size accepted
+        max_count: Largest count or num_zeros accepted
+
+    Returns:
+        Dictionary with every parameter of the method, converted to its type
+    """
+    if method not in METHODS:
+        raise RPCError(METHOD_NOT_FOUND, f"Unknown method '{method}'")
+    if not isinstance(params, dict):
+        raise RPCError(INVALID_PARAMS, "params must be an object")
+    schema = METHODS[method]
+    unknown = set(params) - set(schema)
+    if unknown:
+        raise RPCError(INVALID_PARAMS, f"Unknown parameters for {method}: {sorted(unknown)}")
+
+    canonical = {}
+    for name, (kind, default) in schema.items():
+        if name not in params:
+            if default is None:
+                raise RPCError(INVALID_PARAMS, f"{method} requires '{name}'")
+            canonical[name] = default
+            continue
+        value = params[name]
+        try:
+            # Integral floats (2000.0) are accepted for int parameters; 2000.7 is not
+            if kind is int and isinstance(value, float) and not value.is_integer():
+                raise ValueError(value)
+            canonical[name] = kind(value)
+        except (TypeError, ValueError, OverflowError):
+            raise RPCError(INVALID_PARAMS, f"'{name}' must be {kind.__name__}") from None
+    if canonical.get('N', 3) < 3:
+        raise RPCError(INVALID_PARAMS, "N must be at least 3")
+    if canonical.get('N', 3) > max_N:
+        raise RPCError(INVALID_PARAMS, f"N must be at most {max_N}")
+    for name in ('count', 'num_zeros'):
+        if not 0 <= canonical.get(name, 0) <= max_count:
+            raise RPCError(INVALID_PARAMS, f"'{name}' must be between 0 and {max_count}")
+    if method == 'window' and not canonical['lower'] < canonical['upper']:
+        raise RPCError(INVALID_PARAMS, "lower must be less than upper")
+    return canonical
+
+def compute_spectrum(N, epsilon, T, count):
+    """Lowest count eigenvalues of the radial operator (all when count is 0)."""
+    diagonal, off_diagonal = radial_operator_bands(N, epsilon, T)
+    if count <= 0 or count >= N - 1:
+        return linalg.eigvalsh_tridiagonal(diagonal, off_diagonal)
+    return linalg.eigvalsh_tridiagonal(diagonal, off_diagonal, select='i',
+                                       select_range=(0, count - 1))
+
+def compute_window(N, lower, upper, epsilon, T):
+    """Eigenvalues of the radial operator in (lower, upper]."""
+    diagonal, off_diagonal = radial_operator_bands(N, epsilon, T)
+    return linalg.eigvalsh_tridiagonal(diagonal, off_diagonal, select='v',
+                                       select_range=(lower, upper))
+
+def _solve(method, params):
+    """Process-pool entry point: one solve, returned as JSON-ready data."""
+    start_time = time.time()
+    if method == 'spectrum':
+        eigenvalues = compute_spectrum(**params)
+    else:
+        eigenvalues = compute_window(**params)
+    return {'eigenvalues': eigenvalues.tolist(), 'computation_time': time.time() - start_time}
+
+class SpectrumService:
+    """
+    Coalescing, caching front end to a process pool of spectrum solves.
+
+    Every request is keyed by its method and canonical parameters. A key
+    already in the cache is answered immediately; a key being computed
+    is awaited; only a new key is submitted to the pool.
+    """
+
+    def __init__(self, workers=None, cache_size=256, max_N=MAX_N, max_count=MAX_COUNT):
+        """
+        Args:
+            workers: Number of solver processes (defaults to the core count)
+            cache_size: Maximum number of results kept in the LRU cache
+            max_N: Largest grid size a request may ask for
+            max_count: Largest count or num_zeros a request may ask for
+        """
+        self.workers = workers
+        self.pool = self._start_pool()
+        self.max_N = max_N
+        self.max_count = max_count
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.in_flight = {}
+        self.counters = {'requests': 0, 'cache_hits': 0, 'coalesced': 0, 'solves': 0,
+                         'pool_restarts': 0}
+
+    def _start_pool(self):
+        # Spawned workers load BLAS fresh, so thread limits exported by
+        # core.threads.set_blas_threads before start-up apply to them
+        return ProcessPoolExecutor(max_workers=self.workers,
+                                   mp_context=multiprocessing.get_context('spawn'))
+
+    def close(self):
+        """Shut down the solver processes."""
+        self.pool.shutdown(cancel_futures=True)
+
+    async def _cached(self, key, compute):
+        """Return the result for key, sharing in-flight and finished work."""
+        if key in self.cache:
+            self.counters['cache_hits'] += 1
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        if key in self.in_flight:
+            self.counters['coalesced'] += 1
+            # Shielded, so one client disconnecting cannot cancel the shared solve
+            return await asyncio.shield(self.in_flight[key])
+
+        future = asyncio.ensure_future(compute())
+        self.in_flight[key] = future
+        future.add_done_callback(lambda done: self._store(key, done))
+        return await asyncio.shield(future)
+
+    def _store(self, key, future):
+        # Runs when the solve finishes, even if every requester has gone away
+        self.in_flight.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+        self.cache[key] = future.result()
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+
+    async def _pool_solve(self, method, params):
+        loop = asyncio.get_running_loop()
+        self.counters['solves'] += 1
+        pool = self.pool
+        try:
+            solve = loop.run_in_executor(pool, _solve, method, params)
+        except BrokenProcessPool:
+            # A worker died while idle; this request has not run, so resubmit it
+            self._replace_pool(pool)
+            pool = self.pool
+            solve = loop.run_in_executor(pool, _solve, method, params)
+        try:
+            return await solve
+        except BrokenProcessPool:
+            # A worker died mid-solve (killed for memory, say): the solves the
+            # pool held fail, but later requests get a fresh pool
+            self._replace_pool(pool)
+            raise RPCError(SERVER_ERROR, "Solver process died; the pool was restarted") from None
+
+    def _replace_pool(self, pool):
+        # A dead worker breaks the whole pool; the first solve to notice replaces it
+        if self.pool is pool:
+            self.counters['pool_restarts'] += 1
+            self.pool = self._start_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def _match(self, params):
+        # Matching reuses the (shared) full spectrum and is cheap enough to run inline
+        from rigorous_verification import RiemannZeroVerifier
+        spectrum_params = {'N': params['N'], 'epsilon': params['epsilon'],
+                           'T': params['T'], 'count': 0}
+        spectrum = await self.call('spectrum', spectrum_params)
+        table = RiemannZeroVerifier().match_table(
+            np.asarray(spectrum['eigenvalues']), params['N'], params['epsilon'], params['T'],
+            spectrum['computation_time'], params['num_zeros']
+        )
+        return {name: column.tolist() for name, column in table.items()}
+
+    async def call(self, method, params):
+        """
+        Run one method.
+
+        Args:
+            method: Method name (see METHODS)
+            params: Parameter dictionary
+
+        Returns:
+            JSON-serializable result
+        """
+        params = canonical_params(method, params, self.max_N, self.max_count)
+        self.counters['requests'] += 1
+        if method == 'stats':
+            return dict(self.counters, cached=len(self.cache), in_flight=len(self.in_flight))
+
+        key = (method, json.dumps(params, sort_keys=True))
+        if method == 'match':
+            return await self._cached(key, lambda: self._match(params))
+        return await self._cached(key, lambda: self._pool_solve(method, params))
+
+    async def handle(self, request):
+        """
+        Answer one JSON-RPC request object.
+
+        Returns:
+            Response object, or None for a notification
+        """
+        request_id = request.get('id') if isinstance(request, dict) else None
+        try:
+            if (not isinstance(request, dict) or request.get('jsonrpc') != '2.0'
+                    or not isinstance(request.get('method'), str)):
+                raise RPCError(INVALID_REQUEST, "Invalid JSON-RPC 2.0 request")
+            result = await self.call(request['method'], request.get('params', {}))
+            response = {'jsonrpc': '2.0', 'id': request_id, 'result': result}
+        except RPCError as error:
+            response = {'jsonrpc': '2.0', 'id': request_id,
+                        'error': {'code': error.code, 'message': error.message}}
+        except Exception as error:
+            response = {'jsonrpc': '2.0', 'id': request_id,
+                        'error': {'code': SERVER_ERROR, 'message': repr(error)}}
+        if isinstance(request, dict) and 'id' not in request:
+            return None
+        return response
+
+    async def serve_connection(self, reader, writer):
+        """Serve one client; its requests run concurrently and may answer out of order."""
+        lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(message):
+            if message == []:
+                response = {'jsonrpc': '2.0', 'id': None,
+                            'error': {'code': INVALID_REQUEST, 'message': "Empty batch"}}
+            elif isinstance(message, list):
+                responses = await asyncio.gather(*(self.handle(item) for item in message))
+                response = [item for item in responses if item is not None] or None
+            else:
+                response = await self.handle(message)
+            if response is not None:
+                async with lock:
+                    writer.write(json.dumps(response).encode() + b'\n')
+                    await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    message = None
+                    error = {'jsonrpc': '2.0', 'id': None,
+                             'error': {'code': PARSE_ERROR, 'message': "Parse error"}}
+                    async with lock:
+                        writer.write(json.dumps(error).encode() + b'\n')
+                if message is not None:
+                    task = asyncio.ensure_future(respond(message))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        except ConnectionError:
+            # Client went away; its unanswered requests are cancelled below
+            pass
+        finally:
+            # Shared solves are shielded and still finish into the cache
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+async def serve(host='127.0.0.1', port=8765, socket_path=None, workers=None, cache_size=256,
+                max_N=MAX_N, max_count=MAX_COUNT):
+    """
+    Run the service until cancelled.
+
+    Args:
+        host: Interface for TCP (keep the default to stay local)
+        port: TCP port
+        socket_path: Unix socket path; used instead of TCP when given
+        workers: Number of solver processes
+        cache_size: Maximum number of cached results
+        max_N: Largest grid size a request may ask for
+        max_count: Largest count or num_zeros a request may ask for
+    """
+    service = SpectrumService(workers, cache_size, max_N, max_count)
+    if socket_path is not None:
+        server = await asyncio.start_unix_server(service.serve_connection, path=socket_path)
+        address = socket_path
+    else:
+        server = await asyncio.start_server(service.serve_connection, host, port)
+        address = f"{host}:{port}"
+    print(f"Spectrum service listening on {address}")
+    # Stop cleanly on SIGTERM too, so the solver processes are shut down
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        service.close()
+
+class SpectrumClient:
+    """Blocking JSON-RPC client for notebooks and scripts."""
+
+    def __init__(self, host='127.0.0.1', port=8765, socket_path=None, timeout=None):
+        """
+        Args:
+            host: Service host
+            port: Service TCP port
+            socket_path: Unix socket path; used instead of TCP when given
+            timeout: Socket timeout in seconds (None waits indefinitely)
+        """
+        if socket_path is not None:
+            self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.socket.settimeout(timeout)
+            self.socket.connect(socket_path)
+        else:
+            self.socket = socket.create_connection((host, port), timeout=timeout)
+        self.stream = self.socket.makefile('rwb')
+        self.next_id = 0
+
+    def close(self):
+        """Close the connection."""
+        self.stream.close()
+        self.socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def call(self, method, **params):
+        """
+        Call a method and wait for its result.
+
+        Raises:
+            RPCError: If the service returns an error
+        """
+        self.next_id += 1
+        request = {'jsonrpc': '2.0', 'id': self.next_id, 'method': method, 'params': params}
+        self.stream.write(json.dumps(request).encode() + b'\n')
+        self.stream.flush()
+        response = json.loads(self.stream.readline())
+        if 'error' in response:
+            raise RPCError(response['error']['code'], response['error']['message'])
+        return response['result']
+
+def main():
+    parser = argparse.ArgumentParser(description="Local JSON-RPC spectrum service")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    server = commands.add_parser('serve', help="run the service")
+    server.add_argument('--workers', type=int, default=None)
+    server.add_argument('--cache-size', type=int, default=256)
+    server.add_argument('--max-n', type=int, default=MAX_N, help="largest N a request may ask for")
+    server.add_argument('--max-count', type=int, default=MAX_COUNT,
+                        help="largest count or num_zeros a request may ask for")
+    server.add_argument('--threads', type=int, default=None,
+                        help="BLAS/LAPACK threads per solver process")
+
+    client = commands.add_parser('call', help="call one method and print the result")
+    client.add_argument('method', choices=sorted(METHODS))
+    client.add_argument('params', nargs='?', default='{}', help="JSON object of parameters")
+
+    for sub in (server, client):
+        sub.add_argument('--host', default='127.0.0.1')
+        sub.add_argument('--port', type=int, default=8765)
+        sub.add_argument('--socket', default=None, help="Unix socket path instead of TCP")
+
+    args = parser.parse_args()
+    if args.command == 'serve':
+        if args.threads is not None:
+            from core.threads import set_blas_threads
+            set_blas_threads(args.threads)
+        try:
+            asyncio.run(serve(args.host, args.port, args.socket, args.workers, args.cache_size,
+                              args.max_n, args.max_count))
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            pass
+    else:
+        with SpectrumClient(args.host, args.port, args.socket) as connection:
+            print(json.dumps(connection.call(args.method, **json.loads(args.params))))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Resumable Parameter Sweep Queue
+Distributed sweeps over (N, epsilon, T, coupling) backed by one SQLite file
+
+Workers on any node that can see the queue file claim tasks atomically,
+run them and store the result against the task's parameter key, so each
+parameter point is computed and recorded once. A claimed task carries a
+lease, renewed by a background thread while the task runs; if its worker
+crashes or is preempted, the renewals stop, the lease expires and the
+task returns to the pending pool, so a lost node costs at most the task
+it was running.
+
+The queue file must live on a filesystem with working POSIX locks (a
+local disk, or a shared directory mounted with locking enabled).
+
+Usage:
+    python sweep_queue.py init sweep.db --N 500 1000 2000 --epsilon 1e-8 --T 20
+    python sweep_queue.py work sweep.db          # on every node
+    python sweep_queue.py work sweep.db --threads 4   # BLAS/LAPACK threads for this worker
+    python sweep_queue.py status sweep.db
+    python sweep_queue.py results sweep.db
+"""
+
+import argparse
+import itertools
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    key TEXT UNIQUE NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    worker TEXT,
+    claimed_at REAL,
+    finished_at REAL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    result TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id);
+"""
+
+def task_key(params):
+    """Canonical key of a parameter point (sorted keys, exact float repr)."""
+    return json.dumps(params, sort_keys=True)
+
+def default_worker_id():
+    """Identify a worker by host and process id."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+class SweepQueue:
+    """
+    Task queue for parameter sweeps stored in a single SQLite file.
+
+    Task states are 'pending', 'running', 'done' and 'failed'. Every state
+    change runs inside an IMMEDIATE transaction, so concurrent workers never
+    claim the same task twice.
+    """
+
+    def __init__(self, path, lease_seconds=3600, max_attempts=3):
+        """
+        Open (and create if needed) the queue.
+
+        Args:
+            path: Path of the SQLite queue file
+            lease_seconds: Time after which a running task is presumed lost
+            max_attempts: Attempts before a repeatedly failing task is parked
+        """
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.connection = sqlite3.connect(path, timeout=60, isolation_level=None)
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        """Close the underlying connection."""
+        self.connection.close()
+
+    def _transaction(self):
+        self.connection.execute("BEGIN IMMEDIATE")
+        return self.connection
+
+    def add(self, params_list):
+        """
+        Enqueue parameter points, ignoring any already in the queue.
+
+        Args:
+            params_list: Iterable of parameter dictionaries
+
+        Returns:
+            Number of newly added tasks
+        """
+        rows = [(task_key(params), json.dumps(params)) for params in params_list]
+        db = self._transaction()
+        try:
+            before = db.total_changes
+            db.executemany("INSERT OR IGNORE INTO tasks (key, params) VALUES (?, ?)", rows)
+            added = db.total_changes - before
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        return added
+
+    def add_grid(self, N_values, epsilon_values=(1e-6,), T_values=(15,),
+                 coupling_values=(None,), num_zeros=10):
+        """
+        Enqueue the Cartesian product of the sweep axes.
+
+        Args:
+            N_values: Grid resolutions
+            epsilon_values: Left boundary parameters
+            T_values: Right boundary parameters
+            coupling_values: Prime-potential couplings (None for the radial operator)
+            num_zeros: Number of zeta zeros to match per task
+
+        Returns:
+            Number of newly added tasks
+        """
+        grid = itertools.product(N_values, epsilon_values, T_values, coupling_values)
+        return self.add(
+            {'N': int(N), 'epsilon': float(epsilon), 'T': float(T),
+             'coupling': None if coupling is None else float(coupling),
+             'num_zeros': int(num_zeros)}
+            for N, epsilon, T, coupling in grid
+        )
+
+    def requeue_expired(self, now=None):
+        """
+        Return tasks whose lease has expired to the pending pool.
+
+        Returns:
+            Number of requeued tasks
+        """
+        now = time.time() if now is None else now
+        cursor = self.connection.execute(
+            "UPDATE tasks SET status = 'pending', worker = NULL "
+            "WHERE status = 'running' AND claimed_at < ?",
+            (now - self.lease_seconds,)
+        )
+        return cursor.rowcount
+
+    def claim(self, worker=None):
+        """
+        Atomically claim the oldest pending task.
+
+        Expired leases are requeued in the same transaction, so a dead
+        worker's task is picked up by the next claim.
+
+        Args:
+            worker: Worker identifier (defaults to host:pid)
+
+        Returns:
+            (task_id, params) or None if nothing is pending
+        """
+        worker = worker or default_worker_id()
+        now = time.time()
+        db = self._transaction()
+        try:
+            db.execute(
+                "UPDATE tasks SET status = 'pending', worker = NULL "
+                "WHERE status = 'running' AND claimed_at < ?",
+                (now - self.lease_seconds,)
+            )
+            row = db.execute(
+                "SELECT id, params FROM tasks WHERE status = 'pending' ORDER BY id LIMIT 1"
+            ).fetchone()
+            if row is not None:
+                db.execute(
+                    "UPDATE tasks SET status = 'running', worker = ?, claimed_at = ?, "
+                    "attempts = attempts + 1 WHERE id = ?",
+                    (worker, now, row[0])
+                )
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def heartbeat(self, task_id, worker=None):
+        """
+        Renew the lease on a running task.
+
+        Returns:
+            True if the worker still held the task
+        """
+        worker = worker or default_worker_id()
+        cursor = self.connection.execute(
+            "UPDATE tasks SET claimed_at = ? WHERE id = ? AND worker = ? AND status = 'running'",
+            (time.time(), task_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    @contextmanager
+    def leased(self, task_id, worker=None, interval=None):
+        """
+        Keep a task's lease alive while the block runs.
+
+        A daemon thread calls heartbeat every interval seconds on its own
+        connection (SQLite connections are bound to their thread), so tasks
+        longer than lease_seconds are not handed to a second worker.
+
+        Args:
+            task_id: Task identifier returned by claim
+            worker: Worker identifier (defaults to host:pid)
+            interval: Seconds between renewals (defaults to a third of the lease)
+        """
+        worker = worker or default_worker_id()
+        interval = interval or self.lease_seconds / 3
+        stop = threading.Event()
+
+        def renew():
+            queue = SweepQueue(self.path, self.lease_seconds, self.max_attempts)
+            try:
+                while not stop.wait(interval):
+                    queue.heartbeat(task_id, worker)
+            finally:
+                queue.close()
+
+        thread = threading.Thread(target=renew, name=f"lease-{task_id}", daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            stop.set()
+            thread.join()
+
+    def complete(self, task_id, result):
+        """
+        Record a task's result.
+
+        The first completion wins; a late duplicate from a worker whose
+        lease had expired is discarded.
+
+        Args:
+            task_id: Task identifier returned by claim
+            result: JSON-serializable result
+
+        Returns:
+            True if this call stored the result
+        """
+        cursor = self.connection.execute(
+            "UPDATE tasks SET status = 'done', result = ?, finished_at = ?, error = NULL "
+            "WHERE id = ? AND status != 'done'",
+            (json.dumps(result), time.time(), task_id)
+        )
+        return cursor.rowcount == 1
+
+    def fail(self, task_id, error, worker=None):
+        """
+        Record a failed attempt; the task is retried until max_attempts.
+
+        Only the worker holding the task can fail it, so a worker whose
+        lease expired cannot requeue a task another worker is running.
+
+        Args:
+            task_id: Task identifier returned by claim
+            error: Error description
+            worker: Worker identifier (defaults to host:pid)
+
+        Returns:
+            True if the failure was recorded
+        """
+        worker = worker or default_worker_id()
+        cursor = self.connection.execute(
+            "UPDATE tasks SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+            "worker = NULL, error = ? WHERE id = ? AND worker = ? AND status = 'running'",
+            (self.max_attempts, str(error), task_id, worker)
+        )
+        return cursor.rowcount == 1
+
+    def status(self):
+        """
+        Count tasks by state.
+
+        Returns:
+            Dictionary mapping state to number of tasks
+        """
+        counts = {'pending': 0, 'running': 0, 'done': 0, 'failed': 0}
+        for state, count in self.connection.execute(
+                "SELECT status, COUNT(*) FROM tasks GROUP BY status"):
+            counts[state] = count
+        return counts
+
+    def results(self):
+        """
+        Completed tasks in enqueue order.
+
+        Returns:
+            List of (params, result) pairs
+        """
+        rows = self.connection.execute(
+            "SELECT params, result FROM tasks WHERE status = 'done' ORDER BY id"
+        )
+        return [(json.loads(params), json.loads(result)) for params, result in rows]
+
+def run_sweep_task(params):
+    """
+    Compute one sweep point.
+
+    Without a coupling the radial operator is solved and matched against
+    the zeta zeros (RiemannZeroVerifier); with a coupling the prime
+    Hamiltonian on y in [0, T] is solved with that potential strength
+    (epsilon does not enter this case).
+
+    Args:
+        params: Dictionary with N, epsilon, T, coupling and num_zeros
+
+    Returns:
+        JSON-serializable result dictionary
+    """
+    start_time = time.time()
+    N, epsilon, T = params['N'], params['epsilon'], params['T']
+    num_zeros = params.get('num_zeros', 10)
+
+    if params.get('coupling') is None:
+        from rigorous_verification import RiemannZeroVerifier
+        verifier = RiemannZeroVerifier()
+        eigenvalues = verifier.compute_eigenvalues(N, epsilon, T)
+        matches = verifier.find_best_matches(eigenvalues, num_zeros)
+        result = {
+            'zero_index': [m[0] for m in matches],
+            'predicted_lambda': [float(m[1]) for m in matches],
+            'matched_lambda': [float(m[2]) for m in matches],
+            'errors': [float(m[3]) for m in matches]
+        }
+    else:
+        from core.prime_operators import PrimePartitioner, PrimePotential
+        from core.spectral_solver import QuantumHamiltonian
+        potential = PrimePotential(PrimePartitioner(params.get('max_prime', 10000)),
+                                   coupling_constant=params['coupling'])
+        hamiltonian = QuantumHamiltonian(potential, y_min=0, y_max=T, n_grid=N)
+        validation = hamiltonian.validate_against_known_zeros(num_zeros)
+        result = {
+            'computed_zeros': validation['computed_zeros'].tolist(),
+            'known_zeros': validation['known_zeros'].tolist(),
+            'relative_errors': validation['relative_errors'].tolist()
+        }
+
+    result['computation_time'] = time.time() - start_time
+    return result
+
+def work(queue, task=run_sweep_task, worker=None, max_tasks=None, verbose=True):
+    """
+    Claim and run tasks until the queue is drained.
+
+    Args:
+        queue: SweepQueue instance
+        task: Function mapping a parameter dictionary to a result
+        worker: Worker identifier (defaults to host:pid)
+        max_tasks: Optional limit on the number of tasks to run
+        verbose: Print one line per task
+
+    Returns:
+        Number of tasks completed by this worker
+    """
+    worker = worker or default_worker_id()
+    completed = 0
+    while max_tasks is None or completed < max_tasks:
+        claimed = queue.claim(worker)
+        if claimed is None:
+            break
+        task_id, params = claimed
+        try:
+            with queue.leased(task_id, worker):
+                result = task(params)
+        except Exception as error:
+            queue.fail(task_id, repr(error), worker)
+            if verbose:
+                print(f"[{worker}] task {task_id} failed: {error!r}")
+            continue
+        stored = queue.complete(task_id, result)
+        completed += 1
+        if verbose:
+            note = "" if stored else " (duplicate discarded)"
+            print(f"[{worker}] task {task_id} {params} done{note}")
+    return completed
+
+def main():
+    parser = argparse.ArgumentParser(description="Resumable (N, epsilon, T, coupling) sweeps")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    init = commands.add_parser('init', help="create the queue and enqueue a grid")
+    init.add_argument('queue')
+    init.add_argument('--N', type=int, nargs='+', required=True)
+    init.add_argument('--epsilon', type=float, nargs='+', default=[1e-6])
+    init.add_argument('--T', type=float, nargs='+', default=[15])
+    init.add_argument('--coupling', type=float, nargs='+', default=None)
+    init.add_argument('--num-zeros', type=int, default=10)
+
+    worker = commands.add_parser('work', help="run tasks until the queue is drained")
+    worker.add_argument('queue')
+    worker.add_argument('--lease', type=float, default=3600)
+    worker.add_argument('--max-tasks', type=int, default=None)
+    worker.add_argument('--threads', type=int, default=None,
+                        help="BLAS/LAPACK threads for this worker (e.g. cores // workers per node)")
+
+    for name in ('status', 'results'):
+        sub = commands.add_parser(name)
+        sub.add_argument('queue')
+
+    args = parser.parse_args()
+    if args.command == 'init':
+        queue = SweepQueue(args.queue)
+        couplings = args.coupling if args.coupling is not None else [None]
+        added = queue.add_grid(args.N, args.epsilon, args.T, couplings, args.num_zeros)
+        print(f"Enqueued {added} new tasks; {queue.status()}")
+    elif args.command == 'work':
+        queue = SweepQueue(args.queue, lease_seconds=args.lease)
+        if args.threads is not None:
+            from core.threads import set_blas_threads
+            set_blas_threads(args.threads)
+        completed = work(queue, max_tasks=args.max_tasks)
+        print(f"Worker finished after {completed} tasks; {queue.status()}")
+    elif args.command == 'status':
+        print(SweepQueue(args.queue).status())
+    else:
+        for params, result in SweepQueue(args.queue).results():
+            print(json.dumps({'params': params, 'result': result}))
+
+if __name__ == "__main__":
+    main()
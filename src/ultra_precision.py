@@ -7,6 +7,9 @@ Maximum precision run with N=16000
 import numpy as np
 import time
 from decimal import Decimal, getcontext
+from checkpoints import CheckpointStore, stage_name
+from core.planner import plan_eigensolve, solve_radial_spectrum
+from core.artifacts import match_table, write_artifact
 
 getcontext().prec = 100
 
@@ -24,15 +27,27 @@ tau_values = [
  Decimal('49.773832477672302181916784678563484638640074189652086348950088425559806274721327058166095899914304')
 ]
 
-def compute_ultra_precision_eigenvalues(N=16000, epsilon=1e-10, T=25):
+def compute_ultra_precision_eigenvalues(N=16000, epsilon=1e-10, T=25, backend='auto',
+ memory_budget='auto', plan=None):
  """
  Ultra-high precision eigenvalue computation.
+ 
+ The eigensolver is planned before anything is allocated: estimates come
+ from timings calibrated on this machine, and the fastest backend that
+ fits the memory budget is used (a dense plan that would not fit is
+ downgraded or refused instead of being OOM-killed). A plan made by the
+ caller (e.g. to record its backend with a checkpoint) is used as given.
  """
+ if plan is None:
+ plan = plan_eigensolve(N - 1, backend=backend, memory_budget=memory_budget)
+ 
  print(f"Computing with ULTRA-HIGH PRECISION:")
  print(f" N = {N}")
  print(f" epsilon = {epsilon}")
  print(f" T = {T}")
- print(f" Expected computation time: ~5-10 minutes")
+ print(f" Backend: {plan['backend']}")
+ print(f" Estimated memory: {plan['memory_bytes'] / 2**20:.1f} MB")
+ print(f" Expected computation time: ~{plan['seconds']:.1f} seconds")
  print()
  
  start_time = time.time()
@@ -40,19 +55,8 @@ def compute_ultra_precision_eigenvalues(N=16000, epsilon=1e-10, T=25):
  h = (T - np.log(epsilon)) / N
  print(f"Grid spacing h = {h:.12f}")
  
- # Create the massive tridiagonal matrix
- print("Creating tridiagonal matrix...")
- A = np.zeros((N-1, N-1))
- main_diag_val = 2 / (h**2) + 3/4
- off_diag_val = -1 / (h**2)
- 
- np.fill_diagonal(A, main_diag_val)
- np.fill_diagonal(A[1:], off_diag_val)
- np.fill_diagonal(A[:,1:], off_diag_val)
- 
- print("Computing eigenvalues (this will take several minutes)...")
- eigenvalues = np.linalg.eigvalsh(A)
- eigenvalues.sort()
+ print(f"Computing eigenvalues ({plan['backend']} backend)...")
+ eigenvalues, _ = solve_radial_spectrum(N, epsilon, T, plan=plan)
  
  computation_time = time.time() - start_time
  print(f"Computation completed in {computation_time:.1f} seconds")
@@ -130,8 +134,24 @@ if __name__ == "__main__":
  print("For Annals of Mathematics - Maximum Precision Run")
  print("="*100)
  
- # Ultra-high precision computation
- eigenvalues = compute_ultra_precision_eigenvalues(N=16000, epsilon=1e-10, T=25)
+ # Ultra-high precision computation, resumed from the saved spectrum if present;
+ # every backend gives the same float64 spectrum, so the backend is recorded in
+ # the checkpoint metadata but not in its name, and is only planned on a miss
+ store = CheckpointStore('checkpoints')
+ stage = stage_name('ultra', N=16000, epsilon=1e-10, T=25, precision='double')
+ if store.has(stage):
+ print(f"Loading spectrum from checkpoint {store.path(stage)}")
+ arrays, metadata = store.load(stage)
+ eigenvalues = arrays['eigenvalues']
+ computation_time = metadata.get('computation_time', float('nan'))
+ print(f" Computed with the {metadata.get('backend', 'unknown')} backend")
+ else:
+ plan = plan_eigensolve(16000 - 1)
+ start_time = time.time()
+ eigenvalues = compute_ultra_precision_eigenvalues(N=16000, epsilon=1e-10, T=25, plan=plan)
+ computation_time = time.time() - start_time
+ store.save(stage, {'eigenvalues': eigenvalues}, N=16000, epsilon=1e-10, T=25,
+ backend=plan['backend'], precision='double', computation_time=computation_time)
  
  print(f"\nEigenvalue spectrum summary:")
  print(f" Total eigenvalues: {len(eigenvalues)}")
@@ -143,6 +163,12 @@ if __name__ == "__main__":
  # Statistical analysis
  statistical_summary(matches)
  
+ # Columnar artifact for plotting and aggregation jobs
+ table = match_table([m[0] for m in matches], [m[1] for m in matches],
+ [m[2] for m in matches], [m[3] for m in matches],
+ N=16000, epsilon=1e-10, T=25, computation_time=computation_time)
+ print(f"\nMatch table written to {write_artifact('ultra_precision_matches', table)}")
+ 
  print(f"\n{'='*100}")
  print("CONCLUSION: This represents the highest precision numerical verification")
  print("of the Riemann zeta zero connection achieved to date.")
@@ -0,0 +1,6 @@
+"""Make the src/ packages importable when pytest runs from the repository root"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, 'src'))
@@ -0,0 +1,54 @@
+"""Regression tests for the banded eigensolvers in core.tridiagonal"""
+
+import numpy as np
+import scipy.linalg as linalg
+
+from core.tridiagonal import (continue_eigenvalues, iterative_eigenvalues, radial_operator_bands,
+                              sturm_count, tridiagonal_operator)
+
+
+def test_iterative_eigenvalues_local_operator():
+    diagonal, off_diagonal = radial_operator_bands(1001)
+    operator = tridiagonal_operator(diagonal, off_diagonal)
+    expected = linalg.eigvalsh_tridiagonal(diagonal, off_diagonal, select='i', select_range=(0, 9))
+    computed = iterative_eigenvalues(operator, 10, bands=(diagonal, off_diagonal))
+    np.testing.assert_allclose(computed, expected, rtol=1e-9)
+
+
+def test_iterative_eigenvalues_non_local_term():
+    # A rank-one coupling 0.3/N * ones stalls LOBPCG; the result must still
+    # match the dense spectrum
+    diagonal, off_diagonal = radial_operator_bands(1001)
+    n = len(diagonal)
+    coupling = lambda psi: np.full_like(psi, 0.3 / n) * psi.sum(axis=0)
+    operator = tridiagonal_operator(diagonal, off_diagonal, [coupling])
+    expected = linalg.eigvalsh(operator @ np.eye(n))[:10]
+    computed = iterative_eigenvalues(operator, 10, bands=(diagonal, off_diagonal))
+    np.testing.assert_allclose(computed, expected, rtol=1e-9)
+
+
+def test_continue_eigenvalues_smooth_path_is_not_flagged():
+    # Steps here exceed the level spacing, so brackets hold several eigenvalues
+    path = [radial_operator_bands(2001, 1e-6, T) for T in np.linspace(15.0, 16.0, 30)]
+    tau = np.array([14.134725, 21.022040, 25.010858, 30.424876, 32.935062])
+    tracked, flags = continue_eigenvalues(path, tau**2 + 0.5)
+    indices = sturm_count(*path[0], tracked[0] - 1e-6)
+    expected = [
+        [linalg.eigvalsh_tridiagonal(*bands, select='i', select_range=(k, k))[0] for k in indices]
+        for bands in path
+    ]
+    np.testing.assert_allclose(tracked, expected, rtol=1e-10)
+    assert not flags.any()
+
+
+def test_continue_eigenvalues_flags_a_jump():
+    # Shifting the whole spectrum by one level spacing after a flat start
+    # puts the extrapolated bracket on the neighbouring eigenvalue
+    diagonal, off_diagonal = radial_operator_bands(2001)
+    levels = linalg.eigvalsh_tridiagonal(diagonal, off_diagonal, select='i', select_range=(19, 21))
+    spacing = levels[1] - levels[0]
+    shifts = [0.0, 0.0, 0.0, spacing]
+    path = [(diagonal + shift, off_diagonal) for shift in shifts]
+    tracked, flags = continue_eigenvalues(path, levels[1:2])
+    np.testing.assert_allclose(tracked[:, 0], levels[1] + np.array(shifts), rtol=1e-10)
+    assert flags[:, 0].tolist() == [False, False, False, True]
@@ -0,0 +1,22 @@
+"""Regression tests for core.zeta_functions"""
+
+import warnings
+
+import numpy as np
+
+from core.zeta_functions import validate_zeta_identity_grid
+
+
+def test_validate_zeta_identity_grid_empty():
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        results = validate_zeta_identity_grid(np.empty((0, 3), dtype=complex))
+    assert results['identity_error'].shape == (0, 3)
+    assert results['validation_passed'].shape == (0, 3)
+
+
+def test_validate_zeta_identity_grid_keeps_grid_shape():
+    s_values = np.array([[2.0, 3.0], [4.0 + 1j, 5.0]])
+    results = validate_zeta_identity_grid(s_values, max_terms=100000, max_prime=10000)
+    assert results['exact_value'].shape == (2, 2)
+    np.testing.assert_allclose(results['exact_value'][0], [np.pi**2 / 6, 1.2020569031595942])